@@ -9,7 +9,7 @@ Tests:
 4. Solve time measurement for real-time feasibility
 
 Requirements:
-    pip install cvxpy numpy
+    pip install -e ".[exploration]"
 
 Expected output:
 - Solve times < 10ms for 2D control problem
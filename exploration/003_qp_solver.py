@@ -9,6 +9,9 @@ Tests:
 3. Infeasibility handling with slack variable
 4. Warm-start performance comparison
 5. OSQP solver performance (target: 1-10ms)
+
+Requirements:
+    pip install -e ".[exploration]"
 """
 
 import numpy as np
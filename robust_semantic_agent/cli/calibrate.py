@@ -20,7 +20,7 @@ from pathlib import Path
 
 import numpy as np
 
-from ..core.semantics import calibrate_thresholds
+from ..core.semantics import calibrate_thresholds, calibration_array
 from ..reports.calibration import (
     compute_brier,
     generate_reliability_diagram,
@@ -147,6 +147,9 @@ def main():
 
     logger.info(f"Loaded {len(episodes)} episodes for calibration")
 
+    # Pack once: calibration and the report below read the same columns
+    episodes = calibration_array(episodes)
+
     # Calibrate thresholds
     logger.info("Running threshold calibration...")
     tau_opt, tau_prime_opt, ece_before, ece_after = calibrate_thresholds(
@@ -158,37 +161,22 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Extract predictions and outcomes for visualization
-    s_c = np.array([ep["s_c"] for ep in episodes])
-    s_bar_c = np.array([ep["s_bar_c"] for ep in episodes])
-    ground_truth = np.array([ep["ground_truth"] for ep in episodes])
+    s_c = episodes["s_c"]
+    s_bar_c = episodes["s_bar_c"]
+    ground_truth = episodes["ground_truth"]
 
     # Convert to predictions using calibrated thresholds
-    from ..core.semantics import BelnapValue, status
-
-    predictions_before = []
-    predictions_after = []
-
-    for i in range(len(episodes)):
-        # Before calibration
-        v_before = status(s_c[i], s_bar_c[i], tau=0.7, tau_prime=0.3)
-        if v_before == BelnapValue.TRUE:
-            predictions_before.append(0.9)
-        elif v_before == BelnapValue.FALSE:
-            predictions_before.append(0.1)
-        else:
-            predictions_before.append(0.5)
-
-        # After calibration
-        v_after = status(s_c[i], s_bar_c[i], tau=tau_opt, tau_prime=tau_prime_opt)
-        if v_after == BelnapValue.TRUE:
-            predictions_after.append(0.9)
-        elif v_after == BelnapValue.FALSE:
-            predictions_after.append(0.1)
-        else:
-            predictions_after.append(0.5)
-
-    predictions_before = np.array(predictions_before)
-    predictions_after = np.array(predictions_after)
+    from ..core.semantics import BelnapValue, status_batch
+
+    # Status code → probability: TRUE → 0.9, FALSE → 0.1, NEITHER/BOTH → 0.5
+    status_prob = np.full(len(BelnapValue), 0.5)
+    status_prob[BelnapValue.TRUE] = 0.9
+    status_prob[BelnapValue.FALSE] = 0.1
+
+    predictions_before = status_prob[status_batch(s_c, s_bar_c, tau=0.7, tau_prime=0.3)]
+    predictions_after = status_prob[
+        status_batch(s_c, s_bar_c, tau=tau_opt, tau_prime=tau_prime_opt)
+    ]
 
     # Compute metrics
     brier_before = compute_brier(predictions_before, ground_truth)
@@ -20,20 +20,19 @@ from pathlib import Path
 
 import numpy as np
 
-from ..reports.risk import generate_cvar_curves, generate_tail_distributions
+from ..core.episode import read_jsonl
+from ..reports.render import render_all
+from ..reports.risk import (
+    generate_cvar_curves,
+    generate_tail_distributions,
+    prepare_return_stats,
+)
 from ..reports.safety import compute_violation_rates, generate_barrier_traces
 
 
 def load_episodes_from_jsonl(file_path: Path) -> list:
     """Load episodes from JSONL file."""
-    episodes = []
-
-    with open(file_path) as f:
-        for line in f:
-            if line.strip():
-                episodes.append(json.loads(line))
-
-    return episodes
+    return read_jsonl(file_path)
 
 
 def main():
@@ -57,6 +56,12 @@ def main():
         default=None,
         help="Optional baseline runs directory for comparison",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Report rendering processes (default: one per figure, capped at CPU count)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Verbose logging")
 
     args = parser.parse_args()
@@ -102,37 +107,56 @@ def main():
     for dir_path in [risk_dir, safety_dir, credal_dir, calibration_dir]:
         dir_path.mkdir(parents=True, exist_ok=True)
 
-    # === Risk Reports (T076, T077) ===
-    logger.info("Generating risk reports...")
+    # === Risk and Safety Figures (T076, T077, T078) ===
+    logger.info("Generating risk and safety figures...")
 
-    # CVaR curves
-    alphas = np.linspace(0.05, 1.0, 20)
-    cvar_results = generate_cvar_curves(
-        episodes,
-        alphas,
-        output_path=str(risk_dir / "cvar_curves.png"),
-        baseline_episodes=baseline_episodes,
-    )
+    # Sort returns once for both risk figures
+    return_stats = prepare_return_stats(episodes)
+    baseline_stats = prepare_return_stats(baseline_episodes) if baseline_episodes else None
 
-    # Tail distributions
-    generate_tail_distributions(
-        episodes,
-        output_path=str(risk_dir / "tail_distributions.png"),
-        baseline_episodes=baseline_episodes,
+    # Independent figures render in parallel worker processes
+    alphas = np.linspace(0.05, 1.0, 20)
+    max_traces = 10
+    cvar_results, _, _ = render_all(
+        [
+            # CVaR curves
+            (
+                generate_cvar_curves,
+                (return_stats, alphas),
+                {
+                    "output_path": str(risk_dir / "cvar_curves.png"),
+                    "baseline_episodes": baseline_stats,
+                },
+            ),
+            # Tail distributions
+            (
+                generate_tail_distributions,
+                (return_stats,),
+                {
+                    "output_path": str(risk_dir / "tail_distributions.png"),
+                    "baseline_episodes": baseline_stats,
+                },
+            ),
+            # Barrier traces (ship only the plotted episodes to the worker)
+            (
+                generate_barrier_traces,
+                (episodes[:max_traces],),
+                {
+                    "output_path": str(safety_dir / "barrier_traces.png"),
+                    "max_episodes": max_traces,
+                },
+            ),
+        ],
+        max_workers=args.workers,
     )
 
     # Save CVaR results
     with open(risk_dir / "cvar_results.json", "w") as f:
         json.dump(cvar_results, f, indent=2)
 
-    # === Safety Reports (T078, T079) ===
+    # === Safety Reports (T079) ===
     logger.info("Generating safety reports...")
 
-    # Barrier traces
-    generate_barrier_traces(
-        episodes, output_path=str(safety_dir / "barrier_traces.png"), max_episodes=10
-    )
-
     # Violation rates
     violation_stats = compute_violation_rates(episodes)
 
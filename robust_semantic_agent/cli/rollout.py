@@ -121,17 +121,17 @@ def main():
 
             # Update statistics
             total_steps += 1
-            if info.get("safety_filter_active", False):
+            if info.safety_filter_active:
                 filter_activations += 1
             if env_info.get("violated_safety", False):
                 safety_violations += 1
 
             # Task T065: Query statistics
-            if info.get("query_triggered", False):
+            if info.query_triggered:
                 query_triggers += 1
                 # Compute entropy reduction
-                H_before = info.get("entropy_before_query")
-                H_after = info.get("entropy_after_query")
+                H_before = info.entropy_before_query
+                H_after = info.entropy_after_query
                 if H_before and H_after:
                     reduction = (H_before - H_after) / H_before
                     entropy_reductions.append(reduction)
@@ -16,7 +16,42 @@ References:
 """
 
 import numpy as np
-from scipy.stats import norm
+
+from .credal import create_credal_from_logit_interval
+from .semantics import BelnapValue
+
+
+def normalized_weights(log_weights: np.ndarray, axis: int = -1) -> np.ndarray:
+    """
+    Convert (unnormalized) log-weights to probabilities.
+
+    w_i = exp(log w_i - max) / Σ_j exp(log w_j - max)
+
+    One max pass, one exp pass and one scaling pass over a single buffer.
+    (np.logaddexp.reduce would need one log1p·exp per element, and
+    scipy.special.logsumexp allocates several (N,) temporaries.)
+
+    Args:
+        log_weights: Log-weights (..., n_particles); stacked rows are
+                     normalized independently along axis
+        axis: Particle axis
+
+    Returns:
+        Weights summing to 1 along axis
+    """
+    weights = log_weights - np.max(log_weights, axis=axis, keepdims=True)
+    np.exp(weights, out=weights)
+    weights /= np.sum(weights, axis=axis, keepdims=True)
+    return weights
+
+
+def _same_view(a: np.ndarray, b: np.ndarray) -> bool:
+    """True if a and b view exactly the same memory with the same layout."""
+    return (
+        a.shape == b.shape
+        and a.strides == b.strides
+        and a.__array_interface__["data"][0] == b.__array_interface__["data"][0]
+    )
 
 
 class Belief:
@@ -26,8 +61,9 @@ class Belief:
     Represents belief β(x) as weighted particles in log-space.
 
     Attributes:
-        particles: (n_particles, state_dim) array of particle positions
+        particles: (n_particles, state_dim) float32 view of (state_dim, N) storage
         log_weights: (n_particles,) array of log-probabilities
+        weights: (n_particles,) normalized probabilities (cached, read-only)
         n_particles: Number of particles
         state_dim: State space dimensionality
         resample_threshold: ESS threshold for triggering resampling (as fraction of N)
@@ -40,18 +76,191 @@ class Belief:
         n_particles: int = 5000,
         state_dim: int = 2,
         resample_threshold: float = 0.5,
+        rng: np.random.Generator | None = None,
     ):
+        """
+        Initialize a belief with N particles at the origin and uniform weights.
+
+        Args:
+            n_particles: Number of particles N
+            state_dim: State space dimensionality
+            resample_threshold: ESS fraction below which to resample
+            rng: Generator for resampling draws. If None, one is
+                 seeded from the legacy global RNG on first use, so beliefs
+                 that never draw (e.g. EVI posteriors) cost no global draws.
+        """
+        self._rng = rng
         self.n_particles = n_particles
         self.state_dim = state_dim
         self.resample_threshold = resample_threshold
 
-        # Initialize uniform distribution
-        self.particles = np.zeros((n_particles, state_dim))
+        # Initialize uniform distribution (particle storage layout: see below)
+        self._particles_soa = np.zeros((state_dim, n_particles), dtype=np.float32)
+        self._mean = None
         self.log_weights = np.full(n_particles, -np.log(n_particles))
 
         # Credal set for contradictory information (v=⊤)
         self.credal_set = None  # Optional CredalSet object
 
+        # Per-particle scratch space for update_obs (allocated on first use)
+        self._scratch = None
+
+    @classmethod
+    def from_particles(
+        cls,
+        particles: np.ndarray,
+        log_weights: np.ndarray | None = None,
+        resample_threshold: float = 0.5,
+        rng: np.random.Generator | None = None,
+        share: bool = False,
+    ) -> "Belief":
+        """
+        Build a belief from existing particles (and optionally log-weights).
+
+        With share=True the particle buffer is used as-is when it already has
+        the internal layout (float32 with a C-contiguous transpose, e.g. another
+        belief's .particles) and is held read-only, so several beliefs built
+        from one buffer (identical credal posteriors, EVI posteriors) store one
+        copy. In-place edits of .particles raise; resample() and reassignment
+        give the belief its own buffer. The caller must not modify the buffer
+        afterwards.
+
+        Args:
+            particles: Particle positions (n_particles, state_dim)
+            log_weights: Log-weights (n_particles,), copied (default: uniform)
+            resample_threshold: ESS fraction below which to resample
+            rng: Generator for resampling draws
+            share: Reference the particle buffer instead of copying it
+
+        Returns:
+            Belief over the given particles
+        """
+        n_particles, state_dim = np.shape(particles)
+        belief = cls(
+            n_particles=n_particles,
+            state_dim=state_dim,
+            resample_threshold=resample_threshold,
+            rng=rng,
+        )
+        soa = np.asarray(particles, dtype=np.float32).T
+        if share:
+            if not soa.flags.c_contiguous:
+                soa = np.ascontiguousarray(soa)
+            soa = soa.view()
+            soa.flags.writeable = False
+        else:
+            # Always a private copy (the particles setter would alias a buffer
+            # that already has the internal layout, e.g. another belief's view)
+            soa = np.array(soa, order="C")
+        belief._particles_soa = soa
+        if log_weights is not None:
+            belief.log_weights = np.array(log_weights, dtype=np.float64)
+        return belief
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """Generator used for resampling draws (and by default for RiskBellman sampling)."""
+        if self._rng is None:
+            self._rng = np.random.default_rng(np.random.randint(0, 2**31 - 1))
+        return self._rng
+
+    @property
+    def log_weights(self) -> np.ndarray:
+        """
+        Log-weights (n_particles,), float64, normalized on read.
+
+        update_obs() and apply_message() only add to the log-weights and
+        defer the log-sum-exp pass: normalizing is a constant shift, so
+        back-to-back updates share one normalization, done here (or by
+        ess()) when the weights are next consumed.
+
+        Assigning a new array invalidates the cached ESS. Element-wise edits
+        in place must be followed by _normalize_log_weights().
+        """
+        if self._dirty:
+            self._normalize_log_weights()
+        return self._log_weights
+
+    @log_weights.setter
+    def log_weights(self, value: np.ndarray) -> None:
+        self._log_weights = value
+        self._dirty = False
+        self._ess = None
+        self._weights = None
+        self._entropy = None
+        self._mean = None
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        Normalized weights exp(log_weights), (n_particles,), read-only.
+
+        Computed once per weight update and shared by every consumer (ESS,
+        covariance, entropy, credal expectations, EVI sampling) until the
+        log-weights next change. Callers that need a scratch copy must copy.
+        """
+        if self._dirty:
+            self._normalize_log_weights()
+        if self._weights is None:
+            weights = normalized_weights(self._log_weights)
+            weights.setflags(write=False)
+            self._weights = weights
+        return self._weights
+
+    @property
+    def particles(self) -> np.ndarray:
+        """
+        Particle positions (n_particles, state_dim), float32.
+
+        Storage is structure-of-arrays: one contiguous (state_dim, N) float32
+        block, exposed here as its transposed (N, state_dim) view. Per-dimension
+        passes (update_obs, claim predicates on particles[:, d]) then stream one
+        long contiguous row each, and single precision halves the bytes moved.
+        Log-weights stay float64: they carry the commutativity tolerance
+        (TV ≤ 1e-6) and are accumulated in place.
+
+        Assignment (including augmented assignment, belief.particles += u)
+        invalidates the cached mean; element-wise edits through the view
+        (belief.particles[:, d] += u) do not, so reassign after those.
+        """
+        return self._particles_soa.T
+
+    @particles.setter
+    def particles(self, value: np.ndarray) -> None:
+        soa = np.asarray(value, dtype=np.float32).T
+        own = self.__dict__.get("_particles_soa")
+        # In-place updates through the view hand back our own buffer: keep it.
+        # Anything else is copied, even a buffer that already has the (D, N)
+        # layout (e.g. another belief's particles view)
+        if own is None or not _same_view(soa, own):
+            self._particles_soa = np.array(soa, order="C")
+        self._mean = None
+
+    def clone(self) -> "Belief":
+        """
+        Independent copy of this belief.
+
+        Particles and log-weights are copied. The cached statistics (weights,
+        ESS, entropy, mean) carry over, since both
+        beliefs describe the same state until either one is updated. The rng
+        and any credal set are shared, not copied.
+
+        Returns:
+            New Belief with the same particles, weights and settings
+        """
+        twin = Belief.from_particles(
+            self.particles,
+            self.log_weights,
+            resample_threshold=self.resample_threshold,
+            rng=self._rng,
+        )
+        twin._ess = self._ess
+        twin._weights = self._weights  # read-only; replaced, never edited, on update
+        twin._entropy = self._entropy
+        twin._mean = self._mean
+        twin.credal_set = self.credal_set
+        return twin
+
     def update_obs(self, observation: np.ndarray, obs_noise: float) -> None:
         """
         Update belief with observation using Gaussian likelihood.
@@ -69,17 +278,28 @@ class Belief:
             - FR-001: Observation kernel G
             - exploration/001_particle_filter.py: Validated implementation
         """
-        # Compute log-likelihood G(o|x) = N(o; x, σ²)
-        # For multivariate: sum log-likelihoods across dimensions
-        log_likelihood = np.sum(
-            norm.logpdf(observation, loc=self.particles, scale=obs_noise), axis=1
-        )
-
-        # Update weights in log-space
-        self.log_weights += log_likelihood
-
-        # Normalize
-        self._normalize_log_weights()
+        # Log-likelihood G(o|x) = N(o; x, σ²I), summed across dimensions:
+        #   log G = -||x - o||² / (2σ²) + const
+        # The constant -D·log(σ√2π) is shared by all particles and cancels in
+        # the normalization, so it is dropped
+        #
+        # Accumulated one state dimension at a time in two reusable (N,)
+        # buffers: contiguous column ufuncs, no (N, D) temporaries. dtype=float64
+        # makes the float32 particles upcast before subtracting (a scalar
+        # observation alone would not promote the loop to double)
+        half_inv_var = 0.5 / (obs_noise * obs_noise)  # scalar, computed once per call
+        sq_dist, tmp = self._scratch_buffers()
+        np.subtract(self.particles[:, 0], observation[0], out=sq_dist, dtype=np.float64)
+        np.multiply(sq_dist, sq_dist, out=sq_dist)
+        for d in range(1, self.state_dim):
+            np.subtract(self.particles[:, d], observation[d], out=tmp, dtype=np.float64)
+            np.multiply(tmp, tmp, out=tmp)
+            np.add(sq_dist, tmp, out=sq_dist)
+        np.multiply(sq_dist, half_inv_var, out=sq_dist)
+
+        # Update weights in log-space (normalized lazily)
+        self._log_weights -= sq_dist
+        self._mark_dirty()
 
     def apply_message(self, message, source_trust) -> None:
         """
@@ -94,33 +314,40 @@ class Belief:
         Updates:
             log_weights via message multiplier
 
+        Raises:
+            ValueError: If message.A_c does not return a vectorized (n_particles,)
+                        bool mask
+
         References:
             - FR-003: Message integration
             - FR-002: Commutativity with observations (TV ≤ 1e-6)
         """
-        from .semantics import BelnapValue
-
         # Get logit from source reliability
         lambda_s = source_trust.logit()
 
-        # Evaluate claim on particles
+        # Evaluate claim on particles (once per message, shared with credal expansion)
         claim_satisfied = message.A_c(self.particles)  # Boolean array (n_particles,)
+        if claim_satisfied.shape != (self.n_particles,) or claim_satisfied.dtype != bool:
+            raise ValueError(
+                f"Message A_c must map particles to a bool array of shape "
+                f"({self.n_particles},), got {claim_satisfied.dtype} {claim_satisfied.shape}"
+            )
 
-        # Compute log-multiplier based on Belnap status
+        # Apply the log-multiplier based on Belnap status in place: ±λ_s is
+        # -λ_s everywhere plus 2λ_s on the claim region (no (N,) float temporary)
         if message.value == BelnapValue.TRUE:
             # Support claim: +λ_s where true, -λ_s where false
-            log_mult = np.where(claim_satisfied, lambda_s, -lambda_s)
+            self._log_weights -= lambda_s
+            self._log_weights[claim_satisfied] += 2.0 * lambda_s
+            self._mark_dirty()
         elif message.value == BelnapValue.FALSE:
             # Countersupport claim: -λ_s where true, +λ_s where false
-            log_mult = np.where(claim_satisfied, -lambda_s, lambda_s)
-        elif message.value == BelnapValue.NEITHER:
-            # No information: neutral multiplier
-            log_mult = np.zeros(self.n_particles)
-        else:  # BelnapValue.BOTH - contradiction (v=⊤)
+            self._log_weights += lambda_s
+            self._log_weights[claim_satisfied] -= 2.0 * lambda_s
+            self._mark_dirty()
+        elif message.value == BelnapValue.BOTH:  # Contradiction (v=⊤)
             # Task T051: Expand belief to credal set
             # Logit interval Λ_s = [-λ_s, +λ_s] → K extreme posteriors
-            from .credal import create_credal_from_logit_interval
-
             # Get K from config (default 5)
             K = 5  # TODO: Read from config
 
@@ -130,43 +357,61 @@ class Belief:
                 A_c=message.A_c,
                 lambda_s=lambda_s,
                 K=K,
+                claim_mask=claim_satisfied,
             )
 
-            # For base belief, apply neutral multiplier (central estimate)
-            log_mult = np.zeros(self.n_particles)
-
-        # Update weights in log-space
-        self.log_weights += log_mult
+            # Base belief keeps a neutral multiplier (central estimate)
+        # BelnapValue.NEITHER: no information, neutral multiplier
 
-        # Normalize
-        self._normalize_log_weights()
-
-    def resample(self) -> None:
+    def resample(self, scheme: str = "systematic") -> None:
         """
-        Systematic resampling (low variance).
+        Low-variance resampling (systematic or stratified).
 
         Restores ESS to ~N by resampling particles according to weights.
+        Both schemes place one position in each stratum [i/N, (i+1)/N) and
+        gather with a single sorted search: systematic shares one uniform
+        offset across strata, stratified draws an independent offset per
+        stratum. Cost is the same O(N) either way.
+
+        Args:
+            scheme: "systematic" (default) or "stratified"
+
+        Raises:
+            ValueError: If scheme is unknown
 
         References:
             - exploration/001_particle_filter.py: Validated algorithm
         """
+        if scheme == "systematic":
+            offsets = self.rng.uniform()
+        elif scheme == "stratified":
+            offsets = self.rng.random(self.n_particles)
+        else:
+            raise ValueError(f"Unknown resampling scheme: {scheme!r}")
+
         # Normalize weights to probabilities
-        weights = np.exp(self.log_weights - np.max(self.log_weights))
-        weights /= np.sum(weights)
+        weights = normalized_weights(self.log_weights)
 
-        # Systematic resampling
-        cumsum = np.cumsum(weights)
-        positions = (np.arange(self.n_particles) + np.random.uniform()) / self.n_particles
-        indices = np.searchsorted(cumsum, positions)
+        # One sorted comb of positions, one C-level search. Pin the CDF end to
+        # 1 so rounding in the cumsum can never send the last position past
+        # the final particle (index N)
+        cdf = np.cumsum(weights, out=weights)
+        cdf[-1] = 1.0
+        positions = (np.arange(self.n_particles) + offsets) / self.n_particles
+        indices = np.searchsorted(cdf, positions)
 
-        # Resample particles
-        self.particles = self.particles[indices].copy()
+        # Resample particles (gather along the particle axis of the SoA block)
+        self._particles_soa = self._particles_soa[:, indices]
 
         # Reset weights to uniform
-        self.log_weights = np.full(self.n_particles, -np.log(self.n_particles))
+        self.log_weights.fill(-np.log(self.n_particles))
+        self._ess = float(self.n_particles)
+        self._weights = None
+        self._entropy = float(np.log(self.n_particles))
+        self._mean = None
 
         # Add small jitter to maintain diversity
-        self.particles += np.random.randn(self.n_particles, self.state_dim) * 0.01
+        self.particles += self.rng.standard_normal((self.n_particles, self.state_dim)) * 0.01
 
     def ess(self) -> float:
         """
@@ -174,23 +419,40 @@ class Belief:
 
         ESS = 1 / Σ(w_i²)
 
+        Cached by _normalize_log_weights(), so calls between weight updates
+        are O(1).
+
         Returns:
             Effective sample size ∈ [1, N]
         """
-        weights = np.exp(self.log_weights - np.max(self.log_weights))
-        weights /= np.sum(weights)
-        return 1.0 / np.sum(weights**2)
+        if self._dirty:
+            self._normalize_log_weights()
+        if self._ess is None:
+            weights = self.weights
+            self._ess = 1.0 / np.dot(weights, weights)
+        return self._ess
 
     def mean(self) -> np.ndarray:
         """
         Compute weighted mean of particles.
 
+        Cached until the particles or weights next change: one agent step
+        reads it for the safety filter, the policy and the current EVI value.
+
         Returns:
             Mean state estimate (state_dim,)
         """
-        weights = np.exp(self.log_weights - np.max(self.log_weights))
-        weights /= np.sum(weights)
-        return np.average(self.particles, weights=weights, axis=0)
+        if self._dirty:
+            self._normalize_log_weights()
+        if self._mean is None:
+            # Fused: unnormalized weights in a scratch buffer, one (D, N) @ (N,)
+            # product, then a scalar divide (no (N,) weight array allocated)
+            log_w = self._log_weights
+            e, _ = self._scratch_buffers()
+            np.subtract(log_w, np.max(log_w), out=e)
+            np.exp(e, out=e)
+            self._mean = (self._particles_soa @ e) / e.sum()
+        return self._mean.copy()
 
     def covariance(self) -> np.ndarray:
         """
@@ -199,8 +461,7 @@ class Belief:
         Returns:
             Covariance matrix (state_dim, state_dim)
         """
-        weights = np.exp(self.log_weights - np.max(self.log_weights))
-        weights /= np.sum(weights)
+        weights = self.weights
         mean = self.mean()
         diff = self.particles - mean
         return np.average(diff[:, :, None] * diff[:, None, :], weights=weights, axis=0)
@@ -211,32 +472,68 @@ class Belief:
 
         H(β) = -Σ w_i log(w_i)
 
+        Computed as H = log Z - Σ w_i log w̃_i from the stored log-weights log w̃_i,
+        which need not be normalized (the log_weights setter stores arrays as
+        given). log Z is read off the cached weights at the heaviest particle,
+        log Z = log w̃_k - log w_k, so there is no per-particle log. Cached until
+        the weights next change.
+
         Returns:
             Entropy in nats
 
         References:
             - Task T062: Query action implementation
         """
-        weights = np.exp(self.log_weights - np.max(self.log_weights))
-        weights /= np.sum(weights)
-
-        # Avoid log(0)
-        weights = weights[weights > 1e-12]
-
-        return -np.sum(weights * np.log(weights))
+        if self._dirty:
+            self._normalize_log_weights()
+        if self._entropy is None:
+            weights = self.weights
+            log_w = self._log_weights
+            k = int(np.argmax(log_w))
+            log_z = log_w[k] - np.log(weights[k])
+            cross = float(np.dot(weights, log_w))
+            if not np.isfinite(cross):
+                # Zero-weight particles (log w = -inf) contribute 0·log 0 = 0
+                nonzero = weights > 0
+                cross = float(np.dot(weights[nonzero], log_w[nonzero]))
+            self._entropy = float(log_z) - cross
+        return self._entropy
+
+    def _scratch_buffers(self) -> tuple[np.ndarray, np.ndarray]:
+        """Two float64 (N,) work buffers, reallocated only if N changes."""
+        n = len(self.particles)
+        if self._scratch is None or self._scratch.shape[1] != n:
+            self._scratch = np.empty((2, n))
+        return self._scratch[0], self._scratch[1]
+
+    def _mark_dirty(self) -> None:
+        """Record an unnormalized additive update to the log-weights."""
+        self._dirty = True
+        self._ess = None
+        self._weights = None
+        self._entropy = None
+        self._mean = None
 
     def _normalize_log_weights(self) -> None:
         """
         Normalize log-weights using log-sum-exp trick.
 
-        Prevents numerical overflow/underflow.
+        Prevents numerical overflow/underflow. The same pass caches the ESS:
+        with e_i = exp(log w_i - max), ESS = (Σe_i)² / Σe_i².
 
         References:
             - docs/verified-apis.md: Log-PF algorithm
         """
-        log_w_max = np.max(self.log_weights)
-        log_sum = log_w_max + np.log(np.sum(np.exp(self.log_weights - log_w_max)))
-        self.log_weights -= log_sum
+        log_w = self._log_weights
+        log_w_max = np.max(log_w)
+        e, _ = self._scratch_buffers()
+        np.subtract(log_w, log_w_max, out=e)
+        np.exp(e, out=e)
+        total = e.sum()
+        log_w -= log_w_max + np.log(total)
+        self._ess = total * total / np.dot(e, e)
+        self._weights = None
+        self._dirty = False
 
     def __repr__(self) -> str:
         return (
@@ -37,6 +37,7 @@ class CredalSet:
     Methods:
         add_posterior(belief): Add posterior to credal set
         lower_expectation(f): Compute 𝔼_[f] = min_{P ∈ Γ} 𝔼_P[f]
+        lower_expectation_vec(f_vec): Same, for f vectorized over particle rows
         mean(): Conservative mean estimate (using lower expectation)
 
     References:
@@ -59,6 +60,36 @@ class CredalSet:
         self.posteriors = posteriors
         self.K = len(posteriors)
 
+    @classmethod
+    def from_single(cls, belief, K: int) -> "CredalSet":
+        """
+        Degenerate credal set: K copies of one posterior.
+
+        The K posteriors share one read-only snapshot of the particles
+        (Belief.from_particles(share=True)); each gets its own log-weights.
+
+        Args:
+            belief: Belief to replicate
+            K: Number of posteriors
+
+        Returns:
+            CredalSet with K identical posteriors
+        """
+        from robust_semantic_agent.core.belief import Belief
+
+        snapshot = belief.particles.copy(order="F")  # keeps the (D, N) layout
+        return cls(
+            posteriors=[
+                Belief.from_particles(
+                    snapshot,
+                    belief.log_weights,
+                    resample_threshold=belief.resample_threshold,
+                    share=True,
+                )
+                for _ in range(K)
+            ]
+        )
+
     def add_posterior(self, belief) -> None:
         """
         Add posterior to credal set.
@@ -96,11 +127,7 @@ class CredalSet:
         for belief in self.posteriors:
             # Compute E_P[f(x)] for this posterior P
             particles = belief.particles
-            log_weights = belief.log_weights
-
-            # Normalize weights
-            weights = np.exp(log_weights - np.max(log_weights))
-            weights /= np.sum(weights)
+            weights = belief.weights
 
             # Expected value: sum_i w_i * f(x_i)
             expected = 0.0
@@ -112,6 +139,32 @@ class CredalSet:
         # Return minimum (lower bound)
         return min(expectations)
 
+    def lower_expectation_vec(self, f_vec: Callable[[np.ndarray], np.ndarray]) -> float:
+        """
+        Lower expectation for a vectorized function (batched lower_expectation).
+
+        All K posteriors' particles are concatenated into one (ΣN_k, D) array
+        so f_vec runs once instead of once per particle; the per-posterior
+        expectations are then segment sums of w·f.
+
+        Args:
+            f_vec: Function (M, D) → (M,) evaluating f row-wise
+
+        Returns:
+            Lower expectation value min_k Σ_i w_ki · f(x_ki)
+        """
+        if self.K == 0:
+            raise ValueError("Cannot compute lower expectation on empty credal set")
+
+        particles = np.concatenate([belief.particles for belief in self.posteriors])
+        weights = np.concatenate([belief.weights for belief in self.posteriors])
+        offsets = np.cumsum([0] + [belief.n_particles for belief in self.posteriors[:-1]])
+
+        values = np.asarray(f_vec(particles), dtype=np.float64)
+        expectations = np.add.reduceat(weights * values, offsets)
+
+        return float(expectations.min())
+
     def mean(self) -> np.ndarray:
         """
         Conservative mean estimate using lower expectation.
@@ -131,14 +184,10 @@ class CredalSet:
 
         state_dim = self.posteriors[0].state_dim
 
-        # For each dimension, compute lower expectation
+        # For each dimension, compute lower expectation of f(x) = x[d]
         mean = np.zeros(state_dim)
         for d in range(state_dim):
-            # Function: f(x) = x[d]
-            def f_d(x):
-                return x[d]
-
-            mean[d] = self.lower_expectation(f_d)
+            mean[d] = self.lower_expectation_vec(lambda x, d=d: x[:, d])
 
         return mean
 
@@ -162,8 +211,7 @@ class CredalSet:
 
         for belief in self.posteriors:
             particles = belief.particles
-            weights = np.exp(belief.log_weights - np.max(belief.log_weights))
-            weights /= np.sum(weights)
+            weights = belief.weights
 
             # Variance: E[x^2] - E[x]^2
             mean = np.average(particles, axis=0, weights=weights)
@@ -188,6 +236,7 @@ def create_credal_from_logit_interval(
     A_c: Callable[[np.ndarray], np.ndarray],
     lambda_s: float,
     K: int = 5,
+    claim_mask: np.ndarray | None = None,
 ) -> CredalSet:
     """
     Create credal set from logit interval Λ_s = [-λ_s, +λ_s].
@@ -197,9 +246,12 @@ def create_credal_from_logit_interval(
 
     Args:
         base_belief: Belief object to extend with credal set
-        A_c: Claim indicator function x → {0, 1}
+        A_c: Vectorized claim indicator, particles (n_particles, state_dim) →
+             bool mask (n_particles,); unused when claim_mask is given
         lambda_s: Logit bound (from source trust)
         K: Number of extreme posteriors to generate
+        claim_mask: Optional precomputed A_c(particles) of shape (n_particles,).
+                    The claim is evaluated once and shared by all K posteriors.
 
     Returns:
         CredalSet with K posteriors
@@ -216,6 +268,16 @@ def create_credal_from_logit_interval(
     """
     from robust_semantic_agent.core.belief import Belief
 
+    # All posteriors share the base particles, so evaluate the claim once
+    if claim_mask is None:
+        claim_mask = A_c(base_belief.particles)
+    claim_satisfied = np.asarray(claim_mask, dtype=bool)  # Shape: (n_particles,)
+
+    # One read-only particle snapshot backs all K posteriors; it is decoupled
+    # from the base belief, which keeps moving its own particles
+    snapshot = base_belief.particles.copy(order="F")  # keeps the (D, N) layout
+    base_log_weights = base_belief.log_weights
+
     posteriors = []
 
     # Generate K extreme posteriors spanning the logit interval
@@ -227,25 +289,17 @@ def create_credal_from_logit_interval(
             # Linear interpolation: -λ_s + (2λ_s * k / (K-1))
             logit_value = -lambda_s + (2 * lambda_s * k / (K - 1))
 
-        # Create new belief with same particles
-        belief_k = Belief(
-            n_particles=base_belief.n_particles,
-            state_dim=base_belief.state_dim,
-            resample_threshold=base_belief.resample_threshold,
-        )
-
-        # Copy particles and weights
-        belief_k.particles = base_belief.particles.copy()
-        belief_k.log_weights = base_belief.log_weights.copy()
-
         # Apply logit multiplier: log w_k = log w + λ_k · A_c(x)
-        claim_satisfied = A_c(belief_k.particles)  # Shape: (n_particles,)
-
         # Logit multiplier: +λ_k for A_c(x)=1, -λ_k for A_c(x)=0
         # This creates "extreme" posteriors favoring/disfavoring the claim
         log_mult = np.where(claim_satisfied, logit_value, -logit_value)
 
-        belief_k.log_weights += log_mult
+        belief_k = Belief.from_particles(
+            snapshot,
+            base_log_weights + log_mult,
+            resample_threshold=base_belief.resample_threshold,
+            share=True,
+        )
 
         # Normalize
         belief_k._normalize_log_weights()
@@ -11,12 +11,110 @@ References:
 """
 
 import json
+from collections.abc import Mapping
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import numpy as np
 
+try:  # Optional fast JSON backend (pip install robust-semantic-agent[fast])
+    import orjson
+except ImportError:
+    orjson = None
+
+STATE_DIM = 2
+
+# Per-step safety record, one contiguous column per field (for report reductions)
+STEP_DTYPE = np.dtype(
+    [
+        ("violated_safety", "?"),
+        ("safety_filter_active", "?"),
+        ("barrier_value", "f4"),
+        ("state", "f4", (STATE_DIM,)),
+    ]
+)
+
+# Shared default for steps without an info dict (immutable; avoids a {} per step)
+EMPTY_INFO: Mapping[str, Any] = MappingProxyType({})
+
+
+def steps_to_array(steps: list[dict]) -> np.ndarray:
+    """
+    Pack serialized episode steps into a STEP_DTYPE structured array.
+
+    Missing flags default to False; missing barrier values and states are NaN.
+
+    Args:
+        steps: List of step dicts (as produced by Episode.to_dict())
+
+    Returns:
+        Structured array (T,) with dtype STEP_DTYPE
+    """
+    arr = np.empty(len(steps), dtype=STEP_DTYPE)
+    arr["state"] = np.nan
+
+    for t, step in enumerate(steps):
+        info = step.get("info", EMPTY_INFO)
+        arr["violated_safety"][t] = info.get("violated_safety", False)
+        arr["safety_filter_active"][t] = info.get("safety_filter_active", False)
+        arr["barrier_value"][t] = info.get("barrier_value", np.nan)
+        state = step.get("state")
+        if state is not None:
+            arr["state"][t] = state
+
+    return arr
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a compact JSON string (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj)
+
+
+def write_jsonl(episodes: list[dict], path: Path) -> None:
+    """
+    Write episode dicts to a JSONL file, one episode per line.
+
+    Uses orjson (numpy-aware, newline appended natively) when available and
+    falls back to the stdlib json module. In-memory 'steps_arr' structured
+    arrays are not serialized.
+
+    Args:
+        episodes: Episode dicts (e.g. from Episode.to_dict())
+        path: Output file path (overwritten)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    records = ({k: v for k, v in ep.items() if k != "steps_arr"} for ep in episodes)
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        with open(path, "wb") as f:
+            for record in records:
+                f.write(orjson.dumps(record, option=option))
+    else:
+        with open(path, "w") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+
+def read_jsonl(path: Path) -> list[dict]:
+    """
+    Load episode dicts from a JSONL file (orjson when installed).
+
+    Args:
+        path: JSONL file path
+
+    Returns:
+        List of episode dicts
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, "rb") as f:
+        return [loads(line) for line in f if line.strip()]
+
 
 @dataclass
 class EpisodeStep:
@@ -123,15 +221,25 @@ class Episode:
             ret += (discount**t) * step.reward
         return ret
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert episode to dictionary."""
-        return {
+    def to_dict(self, include_step_array: bool = False) -> dict[str, Any]:
+        """
+        Convert episode to dictionary.
+
+        Args:
+            include_step_array: Also attach 'steps_arr' (STEP_DTYPE structured
+                array) for the report generators. Not JSON-serializable.
+        """
+        steps = [asdict(step) for step in self.steps]
+        result = {
             "episode_id": self.episode_id,
             "config_hash": self.config_hash,
             "total_return": self.total_return,
             "num_steps": len(self.steps),
-            "steps": [asdict(step) for step in self.steps],
+            "steps": steps,
         }
+        if include_step_array:
+            result["steps_arr"] = steps_to_array(steps)
+        return result
 
     def to_jsonl(self) -> str:
         """
@@ -140,7 +248,7 @@ class Episode:
         Returns:
             JSON string
         """
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def save(self, path: Path) -> None:
         """
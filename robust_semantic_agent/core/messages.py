@@ -5,6 +5,7 @@ Tasks: T030, T031
 
 Implements:
 - Message dataclass for exogenous claims
+- ThresholdClaim predicate for axis-aligned claims (x[:, i] > c)
 - SourceTrust class for reliability tracking with Beta-Bernoulli updates
 
 References:
@@ -12,6 +13,7 @@ References:
 - FR-003: Message multipliers specification
 """
 
+import operator
 from collections.abc import Callable
 from dataclasses import dataclass
 
@@ -20,6 +22,42 @@ import numpy as np
 from .semantics import BelnapValue
 
 
+_COMPARISONS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le}
+
+
+@dataclass(frozen=True)
+class ThresholdClaim:
+    """
+    Axis-aligned claim region A_c = {x : x[axis] op threshold}.
+
+    A ready-made Message.A_c for the common threshold claims. Unlike a
+    lambda it is a single vectorized comparison on one particle column
+    (contiguous in Belief's storage), hashable, reusable across messages,
+    and picklable for worker processes.
+
+    Attributes:
+        axis: State dimension the claim refers to
+        threshold: Comparison threshold c
+        op: One of ">", ">=", "<", "<="
+
+    Example:
+        north = ThresholdClaim(axis=1, threshold=0.0)  # "y > 0"
+        message = Message("location_north", "gossip", BelnapValue.TRUE, A_c=north)
+    """
+
+    axis: int
+    threshold: float
+    op: str = ">"
+
+    def __post_init__(self):
+        if self.op not in _COMPARISONS:
+            raise ValueError(f"op must be one of {sorted(_COMPARISONS)}, got {self.op!r}")
+
+    def __call__(self, particles: np.ndarray) -> np.ndarray:
+        """Evaluate the claim on (N, state_dim) particles → bool (N,)."""
+        return _COMPARISONS[self.op](particles[:, self.axis], self.threshold)
+
+
 @dataclass
 class Message:
     """
@@ -29,7 +67,8 @@ class Message:
         claim: Human-readable claim description
         source: Source identifier
         value: BelnapValue status (⊥, t, f, ⊤)
-        A_c: Claim region indicator function: particles → bool array
+        A_c: Vectorized claim region indicator: (N, state_dim) particles →
+             bool array of shape (N,), evaluated once per message
 
     Example:
         message = Message(
@@ -28,6 +28,7 @@ def evi(
     value_fn: Callable[[Belief], float],
     obs_noise: float,
     n_samples: int = 100,
+    rng: np.random.Generator | None = None,
 ) -> float:
     """
     Compute Expected Value of Information (EVI).
@@ -49,9 +50,13 @@ def evi(
 
     Args:
         belief: Current belief state
-        value_fn: Value function V(β) → ℝ
+        value_fn: Value function V(β) → ℝ. Called once per observation sample
+                  on a shared posterior object, so it must not keep a
+                  reference to the belief it is passed
         obs_noise: Observation noise standard deviation
         n_samples: Number of observation samples for expectation
+        rng: Generator for the observation samples (default: seeded from the
+             legacy global RNG)
 
     Returns:
         EVI value (positive → information is valuable)
@@ -63,47 +68,44 @@ def evi(
     Example:
         >>> goal = np.array([0.8, 0.8])
         >>> def value_fn(b):
-        ...     mean = b.mean()
-        ...     return -np.linalg.norm(mean - goal)
+        ...     d = b.mean() - goal
+        ...     return -np.sqrt(d @ d)
         >>> evi_value = evi(belief, value_fn, obs_noise=0.1, n_samples=50)
     """
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(0, 2**31 - 1))
+
     # Current value
     V_current = value_fn(belief)
 
     # Sample potential observations from belief
     # Draw particles according to weights
-    weights = np.exp(belief.log_weights - np.max(belief.log_weights))
-    weights /= np.sum(weights)
+    weights = belief.weights
 
     # Sample particle indices
-    indices = np.random.choice(belief.n_particles, size=n_samples, replace=True, p=weights)
+    indices = rng.choice(belief.n_particles, size=n_samples, replace=True, p=weights)
     sampled_states = belief.particles[indices]
 
     # Generate noisy observations from sampled states
-    observations = sampled_states + np.random.randn(n_samples, belief.state_dim) * obs_noise
-
-    # Compute posterior values for each observation
-    posterior_values = []
+    observations = sampled_states + rng.standard_normal((n_samples, belief.state_dim)) * obs_noise
 
-    for obs in observations:
-        # Create posterior belief by updating with observation
-        posterior = Belief(
-            n_particles=belief.n_particles,
-            state_dim=belief.state_dim,
-            resample_threshold=belief.resample_threshold,
-        )
-        posterior.particles = belief.particles.copy()
-        posterior.log_weights = belief.log_weights.copy()
+    # All S posteriors share the prior particles and differ only in their
+    # weights: score every (observation, particle) likelihood in one batched
+    # pass, then evaluate V on one reused posterior whose log-weights are
+    # swapped per observation (no per-sample particle copies or Belief setup)
+    log_post = _posterior_log_weights(belief, observations, obs_noise)
 
-        # Update with observation
-        posterior.update_obs(obs, obs_noise)
+    posterior = Belief.from_particles(
+        belief.particles, resample_threshold=belief.resample_threshold, share=True
+    )
 
-        # Evaluate value function
-        V_post = value_fn(posterior)
-        posterior_values.append(V_post)
+    posterior_values = np.empty(n_samples)
+    for s in range(n_samples):
+        posterior.log_weights = log_post[s]
+        posterior_values[s] = value_fn(posterior)
 
     # Expected value of posterior
-    V_expected_post = np.mean(posterior_values)
+    V_expected_post = posterior_values.mean()
 
     # EVI = Expected improvement
     evi_value = V_expected_post - V_current
@@ -111,6 +113,45 @@ def evi(
     return evi_value
 
 
+def _posterior_log_weights(
+    belief: Belief, observations: np.ndarray, obs_noise: float
+) -> np.ndarray:
+    """
+    Normalized posterior log-weights for a batch of observations.
+
+    Row s is what belief.update_obs(observations[s], obs_noise) followed by
+    normalization would produce, computed for all rows at once.
+
+    Args:
+        belief: Prior belief
+        observations: Observations (S, state_dim)
+        obs_noise: Observation noise standard deviation
+
+    Returns:
+        Log-weights (S, n_particles), each row normalized
+    """
+    particles = belief.particles
+    half_inv_var = 0.5 / (obs_noise * obs_noise)
+
+    # -||x - o||² / (2σ²), accumulated per state dimension as in update_obs
+    log_post = np.empty((len(observations), belief.n_particles))
+    tmp = np.empty_like(log_post)
+    np.subtract(particles[:, 0], observations[:, 0, None], out=log_post, dtype=np.float64)
+    np.multiply(log_post, log_post, out=log_post)
+    for d in range(1, belief.state_dim):
+        np.subtract(particles[:, d], observations[:, d, None], out=tmp, dtype=np.float64)
+        np.multiply(tmp, tmp, out=tmp)
+        np.add(log_post, tmp, out=log_post)
+    np.multiply(log_post, -half_inv_var, out=log_post)
+    log_post += belief.log_weights
+
+    # Row-wise log-sum-exp normalization
+    log_post -= np.max(log_post, axis=1, keepdims=True)
+    np.exp(log_post, out=tmp)
+    log_post -= np.log(np.sum(tmp, axis=1, keepdims=True))
+    return log_post
+
+
 def should_query(evi_value: float, delta_star: float) -> bool:
     """
     Decide whether to trigger query action based on EVI threshold.
@@ -138,7 +179,9 @@ def should_query(evi_value: float, delta_star: float) -> bool:
     return evi_value >= delta_star
 
 
-def compute_query_observation(env, obs_noise: float) -> np.ndarray:
+def compute_query_observation(
+    env, obs_noise: float, rng: np.random.Generator | None = None
+) -> np.ndarray:
     """
     Request additional observation from environment (query action).
 
@@ -148,6 +191,7 @@ def compute_query_observation(env, obs_noise: float) -> np.ndarray:
     Args:
         env: Environment instance with .state attribute
         obs_noise: Observation noise for query (can be lower than normal)
+        rng: Generator for the observation noise (default: legacy global RNG)
 
     Returns:
         Observation array (state_dim,)
@@ -160,7 +204,10 @@ def compute_query_observation(env, obs_noise: float) -> np.ndarray:
         - docs/theory.md §5.3: Query observation model
     """
     # Return noisy observation of true state
-    noise = np.random.randn(env.state.shape[0]) * obs_noise
+    if rng is None:
+        noise = np.random.randn(env.state.shape[0]) * obs_noise
+    else:
+        noise = rng.standard_normal(env.state.shape[0]) * obs_noise
     return env.state + noise
 
 
@@ -5,8 +5,9 @@ Tasks: T027, T048, T049
 
 Implements:
 - BelnapValue enum with 2-bit encoding
-- Bilattice operations (truth and knowledge lattices)
-- Status assignment from support/countersupport thresholds
+- Bilattice operations (truth and knowledge lattices), scalar and LUT-batched
+- Status assignment from support/countersupport thresholds (scalar and batched)
+- Threshold calibration over CALIBRATION_DTYPE episode arrays
 
 References:
 - docs/theory.md §2: Semantic layer specification
@@ -48,6 +49,25 @@ class BelnapValue(IntEnum):
         return symbols[self]
 
 
+# Lookup tables: entry (x << 2) | y holds op(x, y), built from the bit definitions
+_CODES = np.arange(4, dtype=np.uint8)
+_X, _Y = _CODES[:, None], _CODES[None, :]
+_AND_LUT = (((_X | _Y) & 0b10) | (_X & _Y & 0b01)).ravel()
+_OR_LUT = ((_X & _Y & 0b10) | ((_X | _Y) & 0b01)).ravel()
+_NOT_LUT = ((_CODES & 0b01) << 1) | ((_CODES & 0b10) >> 1)
+_CONSENSUS_LUT = (_X & _Y).ravel()
+_GULLIBILITY_LUT = (_X | _Y).ravel()
+del _X, _Y
+
+# The same tables as tuples of enum members for the scalar operations: a tuple
+# index returns the member directly, with no NumPy scalar or enum lookup
+_AND_MEMBERS = tuple(map(BelnapValue, _AND_LUT.tolist()))
+_OR_MEMBERS = tuple(map(BelnapValue, _OR_LUT.tolist()))
+_NOT_MEMBERS = tuple(map(BelnapValue, _NOT_LUT.tolist()))
+_CONSENSUS_MEMBERS = tuple(map(BelnapValue, _CONSENSUS_LUT.tolist()))
+_GULLIBILITY_MEMBERS = tuple(map(BelnapValue, _GULLIBILITY_LUT.tolist()))
+
+
 # Truth lattice operations (≤_t)
 
 
@@ -56,9 +76,7 @@ def and_t(x: BelnapValue, y: BelnapValue) -> BelnapValue:
     Truth-preserving conjunction (∧).
     min on truth, max on falsity.
     """
-    t_bit = min(x & 0b01, y & 0b01)
-    f_bit = max((x & 0b10) >> 1, (y & 0b10) >> 1)
-    return BelnapValue((f_bit << 1) | t_bit)
+    return _AND_MEMBERS[(x << 2) | y]
 
 
 def or_t(x: BelnapValue, y: BelnapValue) -> BelnapValue:
@@ -66,9 +84,7 @@ def or_t(x: BelnapValue, y: BelnapValue) -> BelnapValue:
     Truth-preserving disjunction (∨).
     max on truth, min on falsity.
     """
-    t_bit = max(x & 0b01, y & 0b01)
-    f_bit = min((x & 0b10) >> 1, (y & 0b10) >> 1)
-    return BelnapValue((f_bit << 1) | t_bit)
+    return _OR_MEMBERS[(x << 2) | y]
 
 
 def not_t(x: BelnapValue) -> BelnapValue:
@@ -76,7 +92,7 @@ def not_t(x: BelnapValue) -> BelnapValue:
     Negation (¬): swap truth and falsity bits.
     Involution: ¬¬x = x
     """
-    return BelnapValue(((x & 0b01) << 1) | ((x & 0b10) >> 1))
+    return _NOT_MEMBERS[x]
 
 
 # Knowledge lattice operations (≤_k)
@@ -87,7 +103,7 @@ def consensus(x: BelnapValue, y: BelnapValue) -> BelnapValue:
     Consensus (⊗): bitwise AND.
     Agree only on shared information.
     """
-    return BelnapValue(x & y)
+    return _CONSENSUS_MEMBERS[(x << 2) | y]
 
 
 def gullibility(x: BelnapValue, y: BelnapValue) -> BelnapValue:
@@ -95,7 +111,48 @@ def gullibility(x: BelnapValue, y: BelnapValue) -> BelnapValue:
     Gullibility (⊕): bitwise OR.
     Accept all information (may lead to contradiction).
     """
-    return BelnapValue(x | y)
+    return _GULLIBILITY_MEMBERS[(x << 2) | y]
+
+
+def _binary_batch(lut: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Apply a 16-entry binary LUT elementwise to two arrays of 2-bit codes."""
+    xs = np.asarray(xs, dtype=np.uint8)
+    ys = np.asarray(ys, dtype=np.uint8)
+    return lut[(xs << 2) | ys]
+
+
+def and_t_batch(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Elementwise and_t over arrays of Belnap codes.
+
+    Args:
+        xs: Belnap codes (any shape, values in 0..3)
+        ys: Belnap codes, broadcastable against xs
+
+    Returns:
+        uint8 array of codes; BelnapValue(code) recovers the enum
+    """
+    return _binary_batch(_AND_LUT, xs, ys)
+
+
+def or_t_batch(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Elementwise or_t over arrays of Belnap codes (see and_t_batch)."""
+    return _binary_batch(_OR_LUT, xs, ys)
+
+
+def not_t_batch(xs: np.ndarray) -> np.ndarray:
+    """Elementwise not_t over an array of Belnap codes."""
+    return _NOT_LUT[np.asarray(xs, dtype=np.uint8)]
+
+
+def consensus_batch(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Elementwise consensus over arrays of Belnap codes (see and_t_batch)."""
+    return _binary_batch(_CONSENSUS_LUT, xs, ys)
+
+
+def gullibility_batch(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Elementwise gullibility over arrays of Belnap codes (see and_t_batch)."""
+    return _binary_batch(_GULLIBILITY_LUT, xs, ys)
 
 
 # Status assignment for RSA semantic layer
@@ -132,8 +189,157 @@ def status(s_c: float, s_bar_c: float, tau: float = 0.68, tau_prime: float = 0.3
         return BelnapValue.NEITHER  # Insufficient evidence
 
 
+def status_batch(
+    s_c: np.ndarray, s_bar_c: np.ndarray, tau: float = 0.68, tau_prime: float = 0.32
+) -> np.ndarray:
+    """
+    Vectorized status() over arrays of support/countersupport scores.
+
+    Args:
+        s_c: Support scores (any shape)
+        s_bar_c: Countersupport scores, broadcastable against s_c
+        tau: High threshold
+        tau_prime: Low threshold
+
+    Returns:
+        uint8 array of Belnap codes, identical to status() elementwise
+    """
+    s_c = np.asarray(s_c)
+    s_bar_c = np.asarray(s_bar_c)
+    hi_s, hi_sb = s_c >= tau, s_bar_c >= tau
+    lo_s, lo_sb = s_c < tau_prime, s_bar_c < tau_prime
+
+    out = np.full(np.broadcast(s_c, s_bar_c).shape, BelnapValue.NEITHER, dtype=np.uint8)
+    # Assign in reverse priority so overlaps (only possible when τ ≤ τ') match status()
+    out[hi_s & hi_sb] = BelnapValue.BOTH
+    out[hi_sb & lo_s] = BelnapValue.FALSE
+    out[hi_s & lo_sb] = BelnapValue.TRUE
+    return out
+
+
+# Calibration episode record: one row per evaluated claim
+CALIBRATION_DTYPE = np.dtype([("s_c", "f8"), ("s_bar_c", "f8"), ("ground_truth", "i1")])
+
+
+def calibration_array(episodes) -> np.ndarray:
+    """
+    Pack calibration episodes into a CALIBRATION_DTYPE structured array.
+
+    Args:
+        episodes: List of dicts with 's_c', 's_bar_c' and 'ground_truth', or an
+                  array already in CALIBRATION_DTYPE (returned unchanged)
+
+    Returns:
+        Structured array (N,) with dtype CALIBRATION_DTYPE
+    """
+    if isinstance(episodes, np.ndarray) and episodes.dtype == CALIBRATION_DTYPE:
+        return episodes
+    return np.fromiter(
+        ((ep["s_c"], ep["s_bar_c"], ep["ground_truth"]) for ep in episodes),
+        dtype=CALIBRATION_DTYPE,
+        count=len(episodes),
+    )
+
+
+def _dominance_counts(
+    high: np.ndarray,
+    low: np.ndarray,
+    ground_truth: np.ndarray,
+    taus: np.ndarray,
+    tau_primes: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Count episodes with high ≥ τ_i and low < τ'_j, for all (i, j) at once.
+
+    Args:
+        high: Scores compared against τ (N,)
+        low: Scores compared against τ' (N,)
+        ground_truth: Binary outcomes (N,)
+        taus: τ candidates (T,), ascending
+        tau_primes: τ' candidates (T',), ascending
+
+    Returns:
+        (count, positives): (T, T') totals and ground-truth-positive totals
+    """
+    n_tau, n_tau_prime = len(taus), len(tau_primes)
+
+    # a = #{τ ≤ high}: high ≥ τ_i ⇔ i < a.  b = #{τ' ≤ low}: low < τ'_j ⇔ b ≤ j
+    a = np.searchsorted(taus, high, side="right")
+    b = np.searchsorted(tau_primes, low, side="right")
+    cell = a * (n_tau_prime + 1) + b
+    shape = (n_tau + 1, n_tau_prime + 1)
+
+    counts = []
+    for weights in (None, ground_truth):
+        hist = np.bincount(cell, weights=weights, minlength=shape[0] * shape[1])
+        hist = hist.reshape(shape).astype(np.float64)
+        # Suffix sum over a > i, then prefix sum over b ≤ j
+        hist = np.cumsum(hist[::-1], axis=0)[::-1][1:]
+        counts.append(np.cumsum(hist, axis=1)[:, :n_tau_prime])
+    return counts[0], counts[1]
+
+
+def _score_threshold_grid(
+    s_c: np.ndarray,
+    s_bar_c: np.ndarray,
+    ground_truth: np.ndarray,
+    taus: np.ndarray,
+    tau_primes: np.ndarray,
+    n_bins: int = 10,
+) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    """
+    ECE and FP/FN counts of status() predictions for every (τ, τ') pair.
+
+    status() yields TRUE iff s_c ≥ τ and s̄_c < τ', and FALSE iff s̄_c ≥ τ and
+    s_c < τ'. Each is a 2-D dominance count over the grid, so the per-cell
+    counts of each status (and of its positives) come from one histogram of
+    episodes over grid cells plus prefix sums: O(N log G + G²), with no
+    per-cell pass over the episodes.
+
+    Args:
+        s_c: Support scores (N,)
+        s_bar_c: Countersupport scores (N,)
+        ground_truth: Binary outcomes (N,)
+        taus: τ candidates (T,), ascending
+        tau_primes: τ' candidates (T',), ascending
+        n_bins: ECE bins, as in compute_ece()
+
+    Returns:
+        ece: (T, T') ECE of the status probabilities TRUE → 0.9, FALSE → 0.1,
+             NEITHER/BOTH → 0.5
+        (fp, fn): (T, T') false-positive / false-negative counts of the
+                  binary prediction "status is TRUE"
+    """
+    n = len(s_c)
+    n_pos = ground_truth.sum()
+
+    n_true, pos_true = _dominance_counts(s_c, s_bar_c, ground_truth, taus, tau_primes)
+    n_false, pos_false = _dominance_counts(s_bar_c, s_c, ground_truth, taus, tau_primes)
+    n_other = n - n_true - n_false
+    pos_other = n_pos - pos_true - pos_false
+
+    # ECE over the bins compute_ece() would assign each status probability to
+    # (float32 inputs, uniform bins); statuses sharing a bin pool their sums
+    bin_pos = np.zeros((n_bins,) + n_true.shape)
+    bin_pred = np.zeros_like(bin_pos)
+    for prob, count, pos in (
+        (0.9, n_true, pos_true),
+        (0.1, n_false, pos_false),
+        (0.5, n_other, pos_other),
+    ):
+        p = np.float32(prob)
+        b = min(int(p * np.float32(n_bins)), n_bins - 1)
+        bin_pos[b] += pos
+        bin_pred[b] += float(p) * count
+    ece = np.abs(bin_pos - bin_pred).sum(axis=0) / max(n, 1)
+
+    fp = n_true - pos_true
+    fn = n_pos - pos_true
+    return ece, (fp, fn)
+
+
 def calibrate_thresholds(
-    episodes: list, cost_matrix: np.ndarray = None, target_ece: float = 0.05
+    episodes: list | np.ndarray, cost_matrix: np.ndarray = None, target_ece: float = 0.05
 ) -> tuple:
     """
     Auto-calibrate thresholds τ and τ' to minimize ECE with cost penalties.
@@ -142,7 +348,7 @@ def calibrate_thresholds(
 
     Algorithm:
     1. Grid search over (τ, τ') space
-    2. For each pair, compute status predictions
+    2. Score all pairs at once from prefix-summed status counts
     3. Evaluate ECE + cost-weighted error
     4. Select thresholds that minimize objective
 
@@ -151,6 +357,8 @@ def calibrate_thresholds(
                   - 's_c': support score
                   - 's_bar_c': countersupport score
                   - 'ground_truth': actual outcome (0 or 1)
+                  or the same fields as a CALIBRATION_DTYPE structured array
+                  (see calibration_array()), which skips the per-dict pass
         cost_matrix: 2x2 cost matrix [[TN, FP], [FN, TP]]
                      Default: [[0, 1], [1, 0]] (balanced)
         target_ece: Target ECE threshold (SC-008: 0.05)
@@ -172,92 +380,39 @@ def calibrate_thresholds(
         ... ]
         >>> tau, tau_prime, ece_before, ece_after = calibrate_thresholds(episodes)
     """
-    from ..reports.calibration import compute_ece
-
     if cost_matrix is None:
         cost_matrix = np.array([[0, 1], [1, 0]])  # Balanced: FP=FN=1
 
-    # Extract data
-    s_c = np.array([ep["s_c"] for ep in episodes])
-    s_bar_c = np.array([ep["s_bar_c"] for ep in episodes])
-    ground_truth = np.array([ep["ground_truth"] for ep in episodes])
+    # Columns of one structured array; every grid cell is scored from these
+    episodes = calibration_array(episodes)
+    s_c = episodes["s_c"]
+    s_bar_c = episodes["s_bar_c"]
+    ground_truth = episodes["ground_truth"].astype(np.float64)
 
-    # Compute ECE before calibration (default thresholds)
+    # ECE before calibration (default thresholds)
     tau_default = 0.7
     tau_prime_default = 0.3
-
-    predictions_before = []
-    for i in range(len(episodes)):
-        v = status(s_c[i], s_bar_c[i], tau_default, tau_prime_default)
-        # Convert status to probability
-        if v == BelnapValue.TRUE:
-            pred = 0.9
-        elif v == BelnapValue.FALSE:
-            pred = 0.1
-        elif v == BelnapValue.NEITHER:
-            pred = 0.5
-        else:  # BOTH
-            pred = 0.5
-        predictions_before.append(pred)
-
-    ece_before = compute_ece(np.array(predictions_before), ground_truth, n_bins=10)
-
-    # Grid search for optimal thresholds
-    tau_candidates = np.linspace(0.55, 0.95, 20)  # τ > 0.5
-    tau_prime_candidates = np.linspace(0.05, 0.45, 20)  # τ' < 0.5
-
-    best_ece = float("inf")
-    best_cost = float("inf")
-    tau_opt = tau_default
-    tau_prime_opt = tau_prime_default
-
-    for tau in tau_candidates:
-        for tau_prime in tau_prime_candidates:
-            # Ensure τ' < 0.5 < τ
-            if tau_prime >= 0.5 or tau <= 0.5:
-                continue
-
-            # Compute predictions with these thresholds
-            predictions = []
-            for i in range(len(episodes)):
-                v = status(s_c[i], s_bar_c[i], tau, tau_prime)
-                # Convert to probability
-                if v == BelnapValue.TRUE:
-                    pred = 0.9
-                elif v == BelnapValue.FALSE:
-                    pred = 0.1
-                elif v == BelnapValue.NEITHER:
-                    pred = 0.5
-                else:  # BOTH
-                    pred = 0.5
-                predictions.append(pred)
-
-            predictions = np.array(predictions)
-
-            # Compute ECE
-            ece = compute_ece(predictions, ground_truth, n_bins=10)
-
-            # Compute cost-weighted error
-            binary_predictions = (predictions > 0.5).astype(int)
-            confusion = np.zeros((2, 2))
-            for pred, truth in zip(binary_predictions, ground_truth, strict=False):
-                confusion[int(truth), int(pred)] += 1
-
-            # Total cost: FP_cost * FP_count + FN_cost * FN_count
-            fp_count = confusion[0, 1]  # Ground truth = 0, predicted = 1
-            fn_count = confusion[1, 0]  # Ground truth = 1, predicted = 0
-            total_cost = cost_matrix[0, 1] * fp_count + cost_matrix[1, 0] * fn_count
-
-            # Objective: ECE + normalized cost
-            objective = ece + 0.1 * (total_cost / len(episodes))
-
-            # Update best
-            if objective < best_cost:
-                best_cost = objective
-                best_ece = ece
-                tau_opt = tau
-                tau_prime_opt = tau_prime
-
-    ece_after = best_ece
+    ece_before, _ = _score_threshold_grid(
+        s_c, s_bar_c, ground_truth, np.array([tau_default]), np.array([tau_prime_default])
+    )
+
+    # Grid search for optimal thresholds (τ' < 0.5 < τ by construction)
+    tau_candidates = np.linspace(0.55, 0.95, 20)
+    tau_prime_candidates = np.linspace(0.05, 0.45, 20)
+
+    ece, (fp_count, fn_count) = _score_threshold_grid(
+        s_c, s_bar_c, ground_truth, tau_candidates, tau_prime_candidates
+    )
+
+    # Objective: ECE + normalized cost (FP_cost·FP + FN_cost·FN)
+    total_cost = cost_matrix[0, 1] * fp_count + cost_matrix[1, 0] * fn_count
+    objective = ece + 0.1 * (total_cost / len(episodes))
+
+    # First minimum in τ-major order, as the nested loop used to pick
+    i, j = np.unravel_index(np.argmin(objective), objective.shape)
+    tau_opt = tau_candidates[i]
+    tau_prime_opt = tau_prime_candidates[j]
+    ece_before = float(ece_before[0, 0])
+    ece_after = float(ece[i, j])
 
     return tau_opt, tau_prime_opt, ece_before, ece_after
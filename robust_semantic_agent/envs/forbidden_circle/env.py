@@ -5,6 +5,9 @@ Task: T036
 
 2D navigation with circular forbidden zone and noisy beacon observations.
 
+VectorForbiddenCircleEnv steps n_envs independent copies in lockstep, with
+states stored as one (n_envs, 2) array.
+
 Dynamics: ẋ = u (2D integrator)
 Observations: Noisy beacons
 Safe set: S = {x: ||x - center|| ≥ radius}
@@ -18,6 +21,16 @@ import logging
 
 import numpy as np
 
+from ...core.messages import Message, ThresholdClaim
+from ...core.semantics import BelnapValue
+
+# Per-step probability that the gossip source emits a contradiction
+GOSSIP_RATE = 0.1
+
+
+# Claim indicator A_c for "agent is in northern half" (y > 0)
+_NORTH_OF_CENTER = ThresholdClaim(axis=1, threshold=0.0)
+
 
 class ForbiddenCircleEnv:
     """
@@ -35,6 +48,9 @@ class ForbiddenCircleEnv:
         obs_noise: Observation noise std dev
         max_action: Action clipping limit
         dt: Timestep duration
+        state: Current true position (2,). One buffer reused across reset() and
+               step() and updated in place, so a held reference tracks the live
+               state; copy it (or use info["true_state"]) to keep a snapshot
 
     Methods:
         reset(): Initialize episode
@@ -45,12 +61,15 @@ class ForbiddenCircleEnv:
         - Task T042: Integration test
     """
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, seed: int | None = None):
         """
         Initialize environment from configuration.
 
         Args:
             config: Configuration object (or None for defaults)
+            seed: Seed for the environment's private generator. If None, the
+                  seed is drawn from the legacy global RNG so that
+                  np.random.seed() keeps runs reproducible.
         """
         if config is None:
             # Default configuration
@@ -71,14 +90,31 @@ class ForbiddenCircleEnv:
             self.max_action = env_cfg.max_action
             self.dt = 0.1
 
-        # State
+        # Report-convention barrier B(x) = r² - ||x - c||² (B > 0 ⇔ inside zone)
+        self._obstacle_radius_sq = float(self.obstacle_radius) ** 2
+
+        # State (reset() refills one persistent buffer; step() updates it in place)
         self.state = None
+        self._state_buf = np.empty(2)
         self.timestep = 0
         self.max_timesteps = 50
 
         # Task T054: Gossip source for contradiction testing
         self.enable_gossip_source = False  # Enable for US2 testing
         self.gossip_messages = []
+        self._gossip_schedule = np.zeros(self.max_timesteps, dtype=bool)
+        # Claim: "Agent is in northern half", asserted with v=⊤ (contradiction)
+        self._gossip_proto = Message(
+            claim="location_north",
+            source="gossip",
+            value=BelnapValue.BOTH,
+            A_c=_NORTH_OF_CENTER,
+        )
+
+        # Per-environment generator (PCG64)
+        if seed is None:
+            seed = np.random.randint(0, 2**31 - 1)
+        self.rng = np.random.default_rng(seed)
 
         self.logger = logging.getLogger(__name__)
 
@@ -89,19 +125,23 @@ class ForbiddenCircleEnv:
         Returns:
             Initial observation (noisy position)
         """
-        # Random initial state (far from obstacle and goal)
-        angle = np.random.uniform(0, 2 * np.pi)
-        radius = np.random.uniform(0.5, 1.0)
-        self.state = np.array([radius * np.cos(angle), radius * np.sin(angle)])
-
-        # Ensure not in obstacle
-        while self._is_in_obstacle(self.state):
-            angle = np.random.uniform(0, 2 * np.pi)
-            radius = np.random.uniform(0.5, 1.0)
-            self.state = np.array([radius * np.cos(angle), radius * np.sin(angle)])
+        # Random initial state (far from obstacle and goal), redrawn until it
+        # is outside the obstacle
+        self.state = self._state_buf
+        while True:
+            angle = self.rng.uniform(0, 2 * np.pi)
+            radius = self.rng.uniform(0.5, 1.0)
+            self.state[0] = radius * np.cos(angle)
+            self.state[1] = radius * np.sin(angle)
+            if not self._is_in_obstacle(self.state):
+                break
 
         self.timestep = 0
 
+        # Pre-roll gossip emissions for the whole episode (one draw per step)
+        if self.enable_gossip_source:
+            self._gossip_schedule = self.rng.random(self.max_timesteps) < GOSSIP_RATE
+
         # Return noisy observation
         return self._get_observation()
 
@@ -121,14 +161,18 @@ class ForbiddenCircleEnv:
         # Clip action
         action = np.clip(action, -self.max_action, self.max_action)
 
-        # Dynamics: x+ = x + u*dt
-        self.state = self.state + action * self.dt
+        # Dynamics: x+ = x + u*dt (state is owned by the env, update in place)
+        self.state += action * self.dt
+
+        # Observation of the new state, emitted before any other state reads
+        obs = self.state + self.rng.standard_normal(2) * self.obs_noise
 
         # Increment timestep
         self.timestep += 1
 
-        # Compute reward
-        reward = self._compute_reward()
+        # Compute reward (negative distance to goal, reused for goal check)
+        dist_to_goal = np.linalg.norm(self.state - self.goal_region)
+        reward = -dist_to_goal
 
         # Check termination
         done = False
@@ -136,13 +180,15 @@ class ForbiddenCircleEnv:
         violated_safety = False
 
         # Check goal
-        if self._is_at_goal(self.state):
+        if dist_to_goal <= self.goal_radius:
             done = True
             goal_reached = True
             reward += 10.0  # Goal bonus
 
-        # Check obstacle violation
-        if self._is_in_obstacle(self.state):
+        # Check obstacle violation (barrier value is published for the reports)
+        offset = self.state - self.obstacle_center
+        barrier_value = self._obstacle_radius_sq - float(offset @ offset)
+        if barrier_value > 0.0:
             violated_safety = True
             reward -= 10.0  # Penalty
 
@@ -150,14 +196,12 @@ class ForbiddenCircleEnv:
         if self.timestep >= self.max_timesteps:
             done = True
 
-        # Get observation
-        obs = self._get_observation()
-
         # Info dict
         info = {
             "true_state": self.state.copy(),
             "goal_reached": goal_reached,
             "violated_safety": violated_safety,
+            "barrier_value": barrier_value,
             "timestep": self.timestep,
         }
 
@@ -165,23 +209,13 @@ class ForbiddenCircleEnv:
 
     def _get_observation(self) -> np.ndarray:
         """Generate noisy observation of current state."""
-        noise = np.random.randn(2) * self.obs_noise
+        noise = self.rng.standard_normal(2) * self.obs_noise
         return self.state + noise
 
-    def _compute_reward(self) -> float:
-        """Compute step reward (distance to goal)."""
-        dist_to_goal = np.linalg.norm(self.state - self.goal_region)
-        return -dist_to_goal  # Negative distance (minimize)
-
-    def _is_at_goal(self, state: np.ndarray) -> bool:
-        """Check if state is within goal region."""
-        dist = np.linalg.norm(state - self.goal_region)
-        return dist <= self.goal_radius
-
     def _is_in_obstacle(self, state: np.ndarray) -> bool:
-        """Check if state is inside forbidden zone."""
-        dist = np.linalg.norm(state - self.obstacle_center)
-        return dist < self.obstacle_radius
+        """Check if state is inside forbidden zone (squared distance, no sqrt)."""
+        offset = state - self.obstacle_center
+        return offset @ offset < self._obstacle_radius_sq
 
     def get_messages(self):
         """
@@ -189,6 +223,10 @@ class ForbiddenCircleEnv:
 
         Task T054: Gossip source emitting v=⊤ (contradiction) messages.
 
+        Messages belong to the step just taken: after step() advances timestep
+        to t, the schedule slot t - 1 decides emission. Before the first step
+        of an episode (timestep 0) no message is emitted.
+
         Returns:
             List of Message objects
 
@@ -197,30 +235,141 @@ class ForbiddenCircleEnv:
         - "Agent is south of center" (v=FALSE)
         - Combined → v=BOTH (contradiction)
         """
-        from ...core.messages import Message
-        from ...core.semantics import BelnapValue
-
         if not self.enable_gossip_source:
             return []
 
-        messages = []
+        # Emission schedule is pre-rolled in reset(); the message is shared
+        t = self.timestep - 1
+        if 0 <= t < len(self._gossip_schedule) and self._gossip_schedule[t]:
+            return [self._gossip_proto]
 
-        # Emit contradictory message with some probability
-        if np.random.rand() < 0.1:  # 10% chance per step
-            # Create contradictory message about location
-            # Claim: "Agent is in northern half"
-            message = Message(
-                claim="location_north",
-                source="gossip",
-                value=BelnapValue.BOTH,  # ⊤ = contradiction
-                A_c=lambda x: x[:, 1] > 0.0,  # y > 0
-            )
-            messages.append(message)
-
-        return messages
+        return []
 
     def __repr__(self) -> str:
         return (
             f"ForbiddenCircleEnv(obstacle_r={self.obstacle_radius}, "
             f"goal={self.goal_region}, obs_noise={self.obs_noise})"
         )
+
+
+class VectorForbiddenCircleEnv(ForbiddenCircleEnv):
+    """
+    Batch of independent forbidden-circle environments stepped in lockstep.
+
+    States live in one (n_envs, 2) array and every transition is vectorized
+    across environments. Environments that have terminated stay frozen until
+    the next reset(): their state no longer moves, their reward is 0 and
+    their done flag stays set.
+
+    Attributes:
+        n_envs: Number of parallel environments
+        state: Current states (n_envs, 2); reused and updated in place like the
+               single-env state, so copy it to keep a snapshot
+        done: Termination mask (n_envs,)
+
+    Example:
+        >>> envs = VectorForbiddenCircleEnv(config, n_envs=10)
+        >>> obs = envs.reset()                       # (10, 2)
+        >>> obs, rewards, dones, info = envs.step(actions)
+        >>> active = ~dones
+    """
+
+    def __init__(self, config=None, n_envs: int = 10, seed: int | None = None):
+        """
+        Initialize n_envs environments sharing one configuration.
+
+        Args:
+            config: Configuration object (or None for defaults)
+            n_envs: Number of parallel environments
+            seed: Seed for the shared generator (see ForbiddenCircleEnv)
+        """
+        super().__init__(config, seed=seed)
+        self.n_envs = n_envs
+        self.done = np.zeros(n_envs, dtype=bool)
+        self._state_buf = np.empty((n_envs, 2))
+
+    def reset(self) -> np.ndarray:
+        """
+        Reset all environments.
+
+        Returns:
+            Initial observations (n_envs, 2)
+        """
+        self.state = self._state_buf
+        resample = np.ones(self.n_envs, dtype=bool)
+        while resample.any():
+            n = int(resample.sum())
+            angle = self.rng.uniform(0, 2 * np.pi, size=n)
+            radius = self.rng.uniform(0.5, 1.0, size=n)
+            self.state[resample, 0] = radius * np.cos(angle)
+            self.state[resample, 1] = radius * np.sin(angle)
+            resample = self._barrier_values() > 0.0
+
+        self.timestep = 0
+        self.done[:] = False
+
+        if self.enable_gossip_source:
+            self._gossip_schedule = self.rng.random(self.max_timesteps) < GOSSIP_RATE
+
+        return self._get_observation()
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict]:
+        """
+        Execute one action per environment.
+
+        Args:
+            actions: Control inputs (n_envs, 2); rows of finished envs are ignored
+
+        Returns:
+            observations: Noisy state observations (n_envs, 2)
+            rewards: Step rewards (n_envs,), 0 for envs that were already done
+            dones: Termination mask (n_envs,)
+            info: Dict of per-env arrays (true_state, goal_reached,
+                  violated_safety, barrier_value, active) plus the shared timestep
+        """
+        active = ~self.done
+
+        actions = np.clip(actions, -self.max_action, self.max_action)
+        self.state[active] += actions[active] * self.dt
+
+        obs = self._get_observation()
+        self.timestep += 1
+
+        dist_to_goal = np.linalg.norm(self.state - self.goal_region, axis=1)
+        goal_reached = active & (dist_to_goal <= self.goal_radius)
+
+        barrier_value = self._barrier_values()
+        violated_safety = active & (barrier_value > 0.0)
+
+        rewards = -dist_to_goal + 10.0 * goal_reached - 10.0 * violated_safety
+        rewards[~active] = 0.0
+
+        self.done |= goal_reached
+        if self.timestep >= self.max_timesteps:
+            self.done[:] = True
+
+        info = {
+            "true_state": self.state.copy(),
+            "goal_reached": goal_reached,
+            "violated_safety": violated_safety,
+            "barrier_value": barrier_value,
+            "active": active,
+            "timestep": self.timestep,
+        }
+
+        return obs, rewards, self.done.copy(), info
+
+    def _get_observation(self) -> np.ndarray:
+        """Generate noisy observations of all states."""
+        return self.state + self.rng.standard_normal(self.state.shape) * self.obs_noise
+
+    def _barrier_values(self) -> np.ndarray:
+        """Report-convention barrier B(x) = r² - ||x - c||² for every env."""
+        offset = self.state - self.obstacle_center
+        return self._obstacle_radius_sq - np.einsum("ni,ni->n", offset, offset)
+
+    def __repr__(self) -> str:
+        return (
+            f"VectorForbiddenCircleEnv(n_envs={self.n_envs}, "
+            f"obstacle_r={self.obstacle_radius}, goal={self.goal_region})"
+        )
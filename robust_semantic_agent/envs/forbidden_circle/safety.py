@@ -32,6 +32,10 @@ class BarrierFunction:
     Methods:
         evaluate(x): Compute h(x)
         gradient(x): Compute ∇h(x)
+        evaluate_with_gradient(x, out): h(x) and ∇h(x) = Lgh(x) in one call
+        step_and_evaluate(x, u, dt, out): x+ = x + u·dt and h(x+) in one call
+        evaluate_batch(X), gradient_batch(X), step_and_evaluate_batch(X, U, dt):
+            Same over (N, 2) state batches
 
     References:
         - FR-007: CBF-QP safety filter
@@ -47,7 +51,13 @@ class BarrierFunction:
             center: Circle center coordinates (2,)
         """
         self.radius = radius
-        self.center = np.array(center)
+        # Own float64 copy: the cached scalars below must not drift from it
+        self.center = np.array(center, dtype=np.float64)
+
+        # Scalar copies for the closed-form 2D expressions
+        self._cx = float(self.center[0])
+        self._cy = float(self.center[1])
+        self._r2 = float(radius) ** 2
 
     def evaluate(self, x: np.ndarray) -> float:
         """
@@ -61,7 +71,9 @@ class BarrierFunction:
         Returns:
             Barrier value (safe if ≥ 0, unsafe if < 0)
         """
-        return np.dot(x - self.center, x - self.center) - self.radius**2
+        dx = x[0] - self._cx
+        dy = x[1] - self._cy
+        return dx * dx + dy * dy - self._r2
 
     def gradient(self, x: np.ndarray) -> np.ndarray:
         """
@@ -82,5 +94,96 @@ class BarrierFunction:
         """
         return 2.0 * (x - self.center)
 
+    def evaluate_with_gradient(
+        self, x: np.ndarray, out: np.ndarray | None = None
+    ) -> tuple[float, np.ndarray]:
+        """
+        Evaluate h(x) and ∇h(x) together, sharing the offset x - c.
+
+        Along 2D integrator dynamics ẋ = u the Lie derivatives are
+        Lfh(x) = 0 and Lgh(x) = ∇h(x), so this is the CBF constraint's
+        only barrier call.
+
+        Args:
+            x: State (2,)
+            out: Optional (2,) buffer to write ∇h into (avoids allocation)
+
+        Returns:
+            (h(x), ∇h(x)) with the gradient written to out when given
+        """
+        if out is None:
+            out = np.empty(2)
+        dx = x[0] - self._cx
+        dy = x[1] - self._cy
+        out[0] = 2.0 * dx
+        out[1] = 2.0 * dy
+        return dx * dx + dy * dy - self._r2, out
+
+    def step_and_evaluate(
+        self, x: np.ndarray, u: np.ndarray, dt: float, out: np.ndarray | None = None
+    ) -> tuple[np.ndarray, float]:
+        """
+        Advance 2D integrator dynamics x+ = x + u·dt and evaluate h(x+) in one call.
+
+        Args:
+            x: State (2,)
+            u: Control input (2,)
+            dt: Timestep
+            out: Optional (2,) buffer to write x+ into (may alias x)
+
+        Returns:
+            (x+, h(x+)) with x+ written to out when given
+        """
+        if out is None:
+            out = np.empty(2)
+        out[0] = x[0] + u[0] * dt
+        out[1] = x[1] + u[1] * dt
+        dx = out[0] - self._cx
+        dy = out[1] - self._cy
+        return out, dx * dx + dy * dy - self._r2
+
+    def step_and_evaluate_batch(
+        self, X: np.ndarray, U: np.ndarray, dt: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Batched step_and_evaluate over (N, 2) states and controls.
+
+        Args:
+            X: States (N, 2)
+            U: Control inputs (N, 2)
+            dt: Timestep
+
+        Returns:
+            (X+, h(X+)) with shapes (N, 2) and (N,)
+        """
+        X_next = X + U * dt
+        delta = X_next - self.center
+        return X_next, np.einsum("ni,ni->n", delta, delta) - self._r2
+
+    def evaluate_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Evaluate h(x) for a batch of states.
+
+        Args:
+            X: States (N, 2)
+
+        Returns:
+            Barrier values (N,)
+        """
+        delta = X - self.center
+        return np.einsum("ni,ni->n", delta, delta) - self._r2
+
+    def gradient_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Compute ∇h(x) = 2(x - c) for a batch of states.
+
+        Args:
+            X: States (N, 2)
+
+        Returns:
+            Gradients (N, 2)
+        """
+        return 2.0 * (X - self.center)
+
     def __repr__(self) -> str:
         return f"BarrierFunction(radius={self.radius}, center={self.center})"
@@ -11,16 +11,64 @@ References:
 """
 
 import logging
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
 from typing import Any
 
 import numpy as np
 
 from ..core.belief import Belief
+from ..core.messages import SourceTrust
+from ..core.query import compute_query_observation, evi, should_query
 from ..envs.forbidden_circle.safety import BarrierFunction
 from ..policy.planner import Policy
 from ..safety.cbf import SafetyFilter
 
 
+@dataclass(slots=True)
+class AgentInfo(Mapping):
+    """
+    Per-step diagnostics returned by Agent.act().
+
+    A slotted record read by attribute on hot paths (info.safety_filter_active)
+    that is also a read-only Mapping, so info["evi"], info.get(...), {**info}
+    and episode logging keep working as with the former dict.
+    """
+
+    belief_mean: np.ndarray
+    belief_ess: float
+    safety_filter_active: bool
+    slack: float
+    u_desired: np.ndarray
+    u_safe: np.ndarray
+    # Production monitoring
+    safety_filter_error: str | None
+    timestep: int
+    # Task T055: Credal set info for US2
+    credal_set_active: bool
+    credal_set_K: int
+    # Task T063: Query action info for US3
+    query_triggered: bool
+    evi: float
+    entropy_before_query: float | None
+    entropy_after_query: float | None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_AGENT_INFO_KEYS)
+
+    def __len__(self) -> int:
+        return len(_AGENT_INFO_KEYS)
+
+
+_AGENT_INFO_KEYS = tuple(f.name for f in fields(AgentInfo))
+
+
 class Agent:
     """
     Integrated agent with belief tracking, safety, and policy.
@@ -40,12 +88,14 @@ class Agent:
         - SC-002: Filter activation rate
     """
 
-    def __init__(self, config):
+    def __init__(self, config, seed: int | None = None):
         """
         Initialize agent from configuration.
 
         Args:
             config: Configuration object
+            seed: Seed for the agent's private generator. If None, the seed is
+                  drawn from the legacy global RNG (np.random.seed compatible).
 
         Raises:
             ValueError: If configuration is invalid
@@ -53,14 +103,26 @@ class Agent:
         self.config = config
         self.logger = logging.getLogger(__name__)
 
+        if seed is None:
+            seed = np.random.randint(0, 2**31 - 1)
+        self.rng = np.random.default_rng(seed)
+
         # Validate configuration (production safety)
         self._validate_config()
 
+        # Default trust for messages without an explicit SourceTrust (shared per agent)
+        r_s_init = getattr(getattr(config, "credal", None), "trust_init", 0.7)
+        self._default_source_trust = SourceTrust(r_s=r_s_init)
+
+        # Absolute ESS level below which the belief is resampled
+        self._ess_threshold_abs = config.belief.resample_threshold * config.belief.particles
+
         # Initialize belief tracker
         self.belief = Belief(
             n_particles=config.belief.particles,
             state_dim=config.env.state_dim,
             resample_threshold=config.belief.resample_threshold,
+            rng=self.rng,
         )
 
         # Initialize safety filter (if enabled)
@@ -78,8 +140,9 @@ class Agent:
         else:
             self.safety_filter = None
 
-        # Initialize policy
-        self.policy = Policy(goal=np.array(config.env.goal_region), gain=1.0)
+        # Initialize policy (goal array built once, shared with the EVI value function)
+        self._goal = np.asarray(config.env.goal_region, dtype=np.float64)
+        self.policy = Policy(goal=self._goal, gain=1.0)
 
         # Episode state
         self.timestep = 0
@@ -88,23 +151,28 @@ class Agent:
         """
         Reset agent for new episode.
 
-        Reinitialize belief and counters.
+        Reinitialize belief and counters, and clear the safety filter's
+        warm start.
         """
         # Reset belief to uniform
         self.belief = Belief(
             n_particles=self.config.belief.particles,
             state_dim=self.config.env.state_dim,
             resample_threshold=self.config.belief.resample_threshold,
+            rng=self.rng,
         )
 
         # Initialize particles randomly
         self.belief.particles = (
-            np.random.randn(self.belief.n_particles, self.belief.state_dim) * 0.5
+            self.rng.standard_normal((self.belief.n_particles, self.belief.state_dim)) * 0.5
         )
 
+        if self.safety_filter is not None:
+            self.safety_filter.reset()
+
         self.timestep = 0
 
-    def act(self, observation: np.ndarray, env=None) -> tuple[np.ndarray, dict[str, Any]]:
+    def act(self, observation: np.ndarray, env=None) -> tuple[np.ndarray, AgentInfo]:
         """
         Select action based on observation.
 
@@ -121,7 +189,8 @@ class Agent:
 
         Returns:
             action: Safe control input (action_dim,)
-            info: Dict with belief_mean, safety_filter_active, query_triggered, evi, etc.
+            info: AgentInfo with belief_mean, safety_filter_active, query_triggered,
+                  evi, etc. (attribute access or read-only mapping)
 
         Raises:
             ValueError: If observation is invalid
@@ -150,7 +219,7 @@ class Agent:
         self.belief.update_obs(observation, obs_noise)
 
         # Check and resample if needed
-        if self.belief.ess() < self.config.belief.resample_threshold * self.belief.n_particles:
+        if self.belief.ess() < self._ess_threshold_abs:
             self.belief.resample()
 
         # Get belief mean estimate
@@ -167,20 +236,19 @@ class Agent:
             entropy_before_query = self.belief.entropy()
 
             # Define value function: negative distance to goal
-            goal = np.array(self.config.env.goal_region)
+            goal = self._goal
 
             def value_fn(b):
-                mean = b.mean()
-                return -np.linalg.norm(mean - goal)
+                d = b.mean() - goal
+                return -np.sqrt(d @ d)
 
             # Compute EVI
-            from ..core.query import evi, should_query
-
             evi_value = evi(
                 self.belief,
                 value_fn,
                 obs_noise=obs_noise * 0.5,  # Query has lower noise
                 n_samples=50,
+                rng=self.rng,
             )
 
             # Check if should query
@@ -188,18 +256,13 @@ class Agent:
                 query_triggered = True
 
                 # Execute query (get additional observation)
-                from ..core.query import compute_query_observation
-
-                query_obs = compute_query_observation(env, obs_noise * 0.5)
+                query_obs = compute_query_observation(env, obs_noise * 0.5, rng=self.rng)
 
                 # Update belief with query observation
                 self.belief.update_obs(query_obs, obs_noise * 0.5)
 
                 # Resample if needed
-                if (
-                    self.belief.ess()
-                    < self.config.belief.resample_threshold * self.belief.n_particles
-                ):
+                if self.belief.ess() < self._ess_threshold_abs:
                     self.belief.resample()
 
                 # Measure entropy after query
@@ -224,8 +287,9 @@ class Agent:
                 if not np.all(np.isfinite(u_safe)):
                     raise RuntimeError(f"Safety filter returned invalid action: {u_safe}")
 
-                # Check if filter modified action
-                if np.linalg.norm(u_safe - u_desired) > 1e-4:
+                # Check if filter modified action (||Δu|| > 1e-4, compared squared)
+                du = u_safe - u_desired
+                if du @ du > 1e-8:
                     safety_filter_active = True
 
                 action = u_safe
@@ -245,26 +309,26 @@ class Agent:
         # Increment timestep
         self.timestep += 1
 
-        # Prepare info dict
-        info = {
-            "belief_mean": belief_mean,
-            "belief_ess": self.belief.ess(),
-            "safety_filter_active": safety_filter_active,
-            "slack": slack,
-            "u_desired": u_desired,
-            "u_safe": action,
+        # Prepare step diagnostics
+        info = AgentInfo(
+            belief_mean=belief_mean,
+            belief_ess=self.belief.ess(),
+            safety_filter_active=safety_filter_active,
+            slack=slack,
+            u_desired=u_desired,
+            u_safe=action,
             # Production monitoring
-            "safety_filter_error": safety_filter_error,
-            "timestep": self.timestep,
+            safety_filter_error=safety_filter_error,
+            timestep=self.timestep,
             # Task T055: Credal set info for US2
-            "credal_set_active": self.belief.credal_set is not None,
-            "credal_set_K": self.belief.credal_set.K if self.belief.credal_set else 0,
+            credal_set_active=self.belief.credal_set is not None,
+            credal_set_K=self.belief.credal_set.K if self.belief.credal_set else 0,
             # Task T063: Query action info for US3
-            "query_triggered": query_triggered,
-            "evi": evi_value,
-            "entropy_before_query": entropy_before_query,
-            "entropy_after_query": entropy_after_query,
-        }
+            query_triggered=query_triggered,
+            evi=evi_value,
+            entropy_before_query=entropy_before_query,
+            entropy_after_query=entropy_after_query,
+        )
 
         return action, info
 
@@ -274,27 +338,22 @@ class Agent:
 
         Args:
             message: Message object with claim, source, value, A_c
-            source_trust: Optional SourceTrust object. If None, uses config default.
+            source_trust: Optional SourceTrust object. If None, uses the agent's
+                          shared default built from config.credal.trust_init.
 
         References:
             - theory.md §3: Message integration
             - Task T051: Credal set expansion for v=⊤
         """
-        from ..core.messages import SourceTrust
-
-        # Use provided source trust or create from config
+        # Use provided source trust or the agent's default (from config)
         if source_trust is None:
-            # Safely get trust_init from config with fallback chain
-            r_s_init = 0.7  # Default fallback
-            if hasattr(self.config, "credal"):
-                r_s_init = getattr(self.config.credal, "trust_init", 0.7)
-            source_trust = SourceTrust(r_s=r_s_init)
+            source_trust = self._default_source_trust
 
         # Apply message to belief
         self.belief.apply_message(message, source_trust)
 
         # Resample if needed after message update
-        if self.belief.ess() < self.config.belief.resample_threshold * self.belief.n_particles:
+        if self.belief.ess() < self._ess_threshold_abs:
             self.belief.resample()
 
     def _validate_config(self) -> None:
@@ -14,10 +14,44 @@ References:
 - SC-008: ECE ≤ 0.05
 """
 
-from pathlib import Path
-
-import matplotlib.pyplot as plt
 import numpy as np
+from scipy.stats import rankdata
+
+from .figures import get_figure, save_figure
+
+
+def _as_calibration_arrays(
+    predictions: np.ndarray, outcomes: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Cast to compact contiguous dtypes: float32 probabilities, int8 binary outcomes."""
+    return (
+        np.ascontiguousarray(predictions, dtype=np.float32),
+        np.ascontiguousarray(outcomes, dtype=np.int8),
+    )
+
+
+def _bin_stats(
+    predictions: np.ndarray, outcomes: np.ndarray, n_bins: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-bin sample counts and sums over uniform bins on [0, 1].
+
+    Args:
+        predictions: Predicted probabilities (N,)
+        outcomes: Binary outcomes (N,)
+        n_bins: Number of bins
+
+    Returns:
+        (counts, sum_pred, sum_out), each (n_bins,)
+    """
+    # Uniform bins: index by arithmetic instead of binary search
+    bin_indices = np.clip((predictions * n_bins).astype(np.intp), 0, n_bins - 1)
+
+    counts = np.bincount(bin_indices, minlength=n_bins)
+    sum_pred = np.bincount(bin_indices, weights=predictions, minlength=n_bins)
+    sum_out = np.bincount(bin_indices, weights=outcomes, minlength=n_bins)
+
+    return counts, sum_pred, sum_out
 
 
 def compute_ece(predictions: np.ndarray, outcomes: np.ndarray, n_bins: int = 10) -> float:
@@ -49,35 +83,17 @@ def compute_ece(predictions: np.ndarray, outcomes: np.ndarray, n_bins: int = 10)
         >>> outcomes = np.array([1, 1, 0, 0, 0])
         >>> ece = compute_ece(predictions, outcomes, n_bins=5)
     """
-    predictions = np.asarray(predictions)
-    outcomes = np.asarray(outcomes)
-
-    # Create bins
-    bin_edges = np.linspace(0, 1, n_bins + 1)
-    bin_indices = np.digitize(predictions, bin_edges[:-1]) - 1
-    bin_indices = np.clip(bin_indices, 0, n_bins - 1)
+    predictions, outcomes = _as_calibration_arrays(predictions, outcomes)
 
-    ece = 0.0
     N = len(predictions)
+    if N == 0:
+        return 0.0
 
-    for b in range(n_bins):
-        # Get samples in bin
-        mask = bin_indices == b
-        n_b = np.sum(mask)
-
-        if n_b == 0:
-            continue
-
-        # Accuracy in bin (fraction of positive outcomes)
-        acc_b = np.mean(outcomes[mask])
-
-        # Average confidence in bin
-        conf_b = np.mean(predictions[mask])
-
-        # Add weighted contribution
-        ece += (n_b / N) * np.abs(acc_b - conf_b)
+    # Per-bin sums in one pass: (n_b / N)·|acc_b - conf_b| = |Σ o - Σ p|_b / N.
+    # Empty bins contribute |0 - 0|, so no occupancy mask is needed
+    _, sum_pred, sum_out = _bin_stats(predictions, outcomes, n_bins)
 
-    return ece
+    return float(np.abs(sum_out - sum_pred).sum() / N)
 
 
 def compute_brier(predictions: np.ndarray, outcomes: np.ndarray) -> float:
@@ -106,13 +122,14 @@ def compute_brier(predictions: np.ndarray, outcomes: np.ndarray) -> float:
         >>> outcomes = np.array([1, 0, 1])
         >>> brier = compute_brier(predictions, outcomes)
     """
-    predictions = np.asarray(predictions)
-    outcomes = np.asarray(outcomes)
+    predictions, outcomes = _as_calibration_arrays(predictions, outcomes)
 
-    # Mean squared error
-    brier_score = np.mean((predictions - outcomes) ** 2)
+    # Mean squared error: one float32 residual buffer squared in place, then
+    # accumulated in float64
+    diff = np.subtract(predictions, outcomes, dtype=np.float32)
+    np.multiply(diff, diff, out=diff)
 
-    return brier_score
+    return float(np.mean(diff, dtype=np.float64))
 
 
 def generate_reliability_diagram(
@@ -121,6 +138,7 @@ def generate_reliability_diagram(
     output_path: str,
     n_bins: int = 10,
     title: str = "Reliability Diagram",
+    fast: bool = False,
 ) -> None:
     """
     Generate reliability diagram (calibration plot).
@@ -134,6 +152,7 @@ def generate_reliability_diagram(
         output_path: Path to save figure
         n_bins: Number of bins
         title: Plot title
+        fast: Bulk mode: save at lower DPI with aggressive path simplification
 
     References:
         - DeGroot & Fienberg (1983): Comparison of probability forecasters
@@ -145,44 +164,27 @@ def generate_reliability_diagram(
         ...     "reports/reliability.png", n_bins=10
         ... )
     """
-    predictions = np.asarray(predictions)
-    outcomes = np.asarray(outcomes)
-
-    # Create bins
-    bin_edges = np.linspace(0, 1, n_bins + 1)
-    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-    bin_indices = np.digitize(predictions, bin_edges[:-1]) - 1
-    bin_indices = np.clip(bin_indices, 0, n_bins - 1)
-
-    # Compute accuracy and confidence per bin
-    bin_accuracies = []
-    bin_confidences = []
-    bin_counts = []
-
-    for b in range(n_bins):
-        mask = bin_indices == b
-        n_b = np.sum(mask)
-
-        if n_b == 0:
-            bin_accuracies.append(np.nan)
-            bin_confidences.append(np.nan)
-            bin_counts.append(0)
-        else:
-            bin_accuracies.append(np.mean(outcomes[mask]))
-            bin_confidences.append(np.mean(predictions[mask]))
-            bin_counts.append(n_b)
+    predictions, outcomes = _as_calibration_arrays(predictions, outcomes)
+
+    # Uniform bins on [0, 1]
+    bin_centers = (np.arange(n_bins) + 0.5) / n_bins
+
+    # Compute accuracy and confidence per bin (empty bins excluded)
+    bin_counts, sum_pred, sum_out = _bin_stats(predictions, outcomes, n_bins)
+    valid_mask = bin_counts > 0
+    bin_confidences = sum_pred[valid_mask] / bin_counts[valid_mask]
+    bin_accuracies = sum_out[valid_mask] / bin_counts[valid_mask]
 
     # Plot
-    fig, ax = plt.subplots(figsize=(8, 8))
+    fig, ax = get_figure((8, 8))
 
     # Perfect calibration line
     ax.plot([0, 1], [0, 1], "k--", label="Perfect Calibration", linewidth=2)
 
     # Calibration curve
-    valid_mask = ~np.isnan(bin_accuracies)
     ax.plot(
-        np.array(bin_confidences)[valid_mask],
-        np.array(bin_accuracies)[valid_mask],
+        bin_confidences,
+        bin_accuracies,
         "o-",
         markersize=8,
         linewidth=2,
@@ -206,14 +208,15 @@ def generate_reliability_diagram(
     ax.set_ylim([0, 1])
 
     # Save
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    save_figure(fig, output_path, fast=fast)
 
 
 def generate_roc_curve(
-    predictions: np.ndarray, outcomes: np.ndarray, output_path: str, title: str = "ROC Curve"
+    predictions: np.ndarray,
+    outcomes: np.ndarray,
+    output_path: str,
+    title: str = "ROC Curve",
+    fast: bool = False,
 ) -> float:
     """
     Generate Receiver Operating Characteristic (ROC) curve.
@@ -225,6 +228,7 @@ def generate_roc_curve(
         outcomes: Binary outcomes (N,)
         output_path: Path to save figure
         title: Plot title
+        fast: Bulk mode: save at lower DPI with aggressive path simplification
 
     Returns:
         AUC (Area Under Curve) score
@@ -238,46 +242,34 @@ def generate_roc_curve(
         ...     predictions, outcomes, "reports/roc.png"
         ... )
     """
-    predictions = np.asarray(predictions)
-    outcomes = np.asarray(outcomes)
+    predictions, outcomes = _as_calibration_arrays(predictions, outcomes)
 
     # Sort by prediction (descending)
     sorted_indices = np.argsort(predictions)[::-1]
-    sorted_predictions = predictions[sorted_indices]
     sorted_outcomes = outcomes[sorted_indices]
 
     # Compute TPR and FPR at each threshold
     n_positives = np.sum(outcomes == 1)
     n_negatives = np.sum(outcomes == 0)
 
-    tpr = []
-    fpr = []
-
-    for i in range(len(sorted_predictions) + 1):
-        if i == 0:
-            # Threshold = 1.0 (predict all negative)
-            tp = 0
-            fp = 0
-        else:
-            # Predict first i samples as positive
-            predicted_positives = sorted_outcomes[:i]
-            tp = np.sum(predicted_positives == 1)
-            fp = np.sum(predicted_positives == 0)
-
-        tpr_val = tp / n_positives if n_positives > 0 else 0
-        fpr_val = fp / n_negatives if n_negatives > 0 else 0
-
-        tpr.append(tpr_val)
-        fpr.append(fpr_val)
+    # Predicting the first i samples positive: cumulative TP/FP counts,
+    # with a leading 0 for threshold = 1.0 (predict all negative)
+    tp = np.concatenate(([0], np.cumsum(sorted_outcomes == 1)))
+    fp = np.concatenate(([0], np.cumsum(sorted_outcomes == 0)))
 
-    tpr = np.array(tpr)
-    fpr = np.array(fpr)
+    tpr = tp / n_positives if n_positives > 0 else np.zeros(len(tp))
+    fpr = fp / n_negatives if n_negatives > 0 else np.zeros(len(fp))
 
-    # Compute AUC using trapezoidal rule
-    auc = np.trapz(tpr, fpr)
+    # AUC via the Mann-Whitney rank statistic (exact, tie-aware; curve is for plotting only)
+    if n_positives > 0 and n_negatives > 0:
+        ranks = rankdata(predictions)
+        rank_sum = ranks[outcomes == 1].sum()
+        auc = (rank_sum - n_positives * (n_positives + 1) / 2) / (n_positives * n_negatives)
+    else:
+        auc = 0.0
 
     # Plot
-    fig, ax = plt.subplots(figsize=(8, 8))
+    fig, ax = get_figure((8, 8))
 
     # ROC curve
     ax.plot(fpr, tpr, linewidth=2, label=f"ROC (AUC = {auc:.3f})")
@@ -294,10 +286,7 @@ def generate_roc_curve(
     ax.set_ylim([0, 1])
 
     # Save
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    save_figure(fig, output_path, fast=fast)
 
     return auc
 
@@ -10,17 +10,18 @@ References:
 - SC-004: Lower expectation monotonicity
 """
 
-from pathlib import Path
-
-import matplotlib.pyplot as plt
 import numpy as np
 
+from ..core.belief import normalized_weights
+from .figures import get_figure, save_figure
+
 
 def generate_posterior_ensemble_plot(
     credal_set,
     output_path: str,
     feature_indices: tuple = (0, 1),
     title: str = "Credal Set: Posterior Ensemble",
+    fast: bool = False,
 ) -> None:
     """
     Visualize credal set as ensemble of K extreme posteriors.
@@ -35,6 +36,7 @@ def generate_posterior_ensemble_plot(
         output_path: Path to save figure
         feature_indices: Which state dimensions to plot (default: (0, 1) for 2D)
         title: Plot title
+        fast: Bulk mode: save at lower DPI with aggressive path simplification
 
     References:
         - SC-004: Lower expectation ≤ any posterior
@@ -56,7 +58,7 @@ def generate_posterior_ensemble_plot(
     n_cols = min(3, K)
     n_rows = (K + n_cols - 1) // n_cols
 
-    fig, axes = plt.subplots(n_rows, n_cols, figsize=(5 * n_cols, 4 * n_rows))
+    fig, axes = get_figure((5 * n_cols, 4 * n_rows), n_rows, n_cols)
 
     # Flatten axes for easier indexing
     if K == 1:
@@ -66,15 +68,21 @@ def generate_posterior_ensemble_plot(
     else:
         axes = axes.flatten()
 
+    # Normalize all K weight vectors in one reduction when shapes agree
+    if len({p.particles.shape for p in posteriors}) == 1:
+        W = normalized_weights(np.stack([p.log_weights for p in posteriors]), axis=1)
+        means = np.einsum("kn,knd->kd", W, np.stack([p.particles for p in posteriors]))
+    else:
+        W = [normalized_weights(p.log_weights) for p in posteriors]
+        means = [p.mean() for p in posteriors]
+
     # Plot each posterior
     for k in range(K):
         ax = axes[k]
-        posterior = posteriors[k]
 
         # Get particles and weights
-        particles = posterior.particles
-        weights = np.exp(posterior.log_weights - np.max(posterior.log_weights))
-        weights /= np.sum(weights)
+        particles = posteriors[k].particles
+        weights = W[k]
 
         # Extract feature dimensions
         x_feat = particles[:, feature_indices[0]]
@@ -88,12 +96,13 @@ def generate_posterior_ensemble_plot(
             s=10,
             alpha=0.6,
             cmap="viridis",
+            rasterized=True,  # K×N points → one image tile
             vmin=0,
             vmax=weights.max() if weights.max() > 0 else 1,
         )
 
-        # Compute and plot mean
-        mean = posterior.mean()
+        # Plot mean
+        mean = means[k]
         ax.plot(
             mean[feature_indices[0]], mean[feature_indices[1]], "r*", markersize=15, label="Mean"
         )
@@ -105,7 +114,7 @@ def generate_posterior_ensemble_plot(
         ax.grid(True, alpha=0.3)
 
         # Colorbar
-        plt.colorbar(scatter, ax=ax, label="Particle Weight")
+        fig.colorbar(scatter, ax=ax, label="Particle Weight")
 
     # Hide empty subplots
     for k in range(K, len(axes)):
@@ -114,10 +123,7 @@ def generate_posterior_ensemble_plot(
     fig.suptitle(title, fontsize=16)
 
     # Save
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    save_figure(fig, output_path, fast=fast)
 
 
 def __repr__() -> str:
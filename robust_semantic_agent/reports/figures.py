@@ -0,0 +1,81 @@
+"""
+Figure Pool for Report Generation
+Feature: 002-full-prototype
+
+Report generators are called repeatedly (per episode batch, α sweep, credal
+set). Building a new pyplot figure each time dominates their runtime, so
+figures are pooled by layout and cleared for reuse instead of closed.
+
+Figures are created directly from matplotlib.figure.Figure (no pyplot
+state machine, no GUI backend) with an Agg canvas attached once, so saving
+never resolves a backend and importing the reports leaves the process-wide
+backend (matplotlib.use) untouched.
+
+References:
+- robust_semantic_agent/reports/*.py: Plot generators
+"""
+
+from pathlib import Path
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# (figsize, nrows, ncols) → reusable Figure
+_FIG_POOL: dict[tuple, Figure] = {}
+
+# Render settings for saving: drop sub-pixel path segments before drawing
+_SAVE_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+DEFAULT_DPI = 150
+FAST_DPI = 96
+
+
+def get_figure(figsize: tuple[float, float], nrows: int = 1, ncols: int = 1):
+    """
+    Get a cleared figure with a fresh subplot grid from the pool.
+
+    Args:
+        figsize: Figure size in inches (width, height)
+        nrows: Number of subplot rows
+        ncols: Number of subplot columns
+
+    Returns:
+        (fig, axes) as returned by plt.subplots (axes squeezed)
+    """
+    key = (tuple(figsize), nrows, ncols)
+    fig = _FIG_POOL.get(key)
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        _FIG_POOL[key] = fig
+    else:
+        # Drops all axes, including twins and colorbars from the previous use
+        fig.clf()
+
+    axes = fig.subplots(nrows, ncols)
+    return fig, axes
+
+
+def save_figure(fig: Figure, output_path: str, fast: bool = False) -> None:
+    """
+    Lay out and save a report figure, creating parent directories.
+
+    Args:
+        fig: Figure to save
+        output_path: Destination path (format from extension)
+        fast: Bulk mode: lower DPI (96 instead of 150)
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    fig.tight_layout()
+    with matplotlib.rc_context(_SAVE_RC):
+        fig.savefig(output_path, dpi=FAST_DPI if fast else DEFAULT_DPI, bbox_inches="tight")
+
+
+def clear_fig_cache() -> None:
+    """Release all pooled figures."""
+    _FIG_POOL.clear()
@@ -0,0 +1,50 @@
+"""
+Parallel Report Rendering
+Feature: 002-full-prototype
+Task: T081
+
+Fan out independent report generators across worker processes.
+
+Each generate_*() call builds its own Figure and writes its own PNG, so the
+figures can render concurrently without sharing matplotlib state.
+
+References:
+- User Story 5: Performance monitoring
+"""
+
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+ReportJob = tuple[Callable[..., Any], tuple, dict]
+
+
+def render_all(jobs: list[ReportJob], max_workers: int | None = None) -> list:
+    """
+    Run report generators, in parallel when more than one worker is available.
+
+    Args:
+        jobs: List of (generator, args, kwargs); generators must be module-level
+              functions and arguments picklable
+        max_workers: Worker process count (default: min(len(jobs), cpu_count));
+                     1 runs the jobs serially in this process
+
+    Returns:
+        Generator return values, in job order
+
+    Example:
+        >>> cvar_results, _ = render_all([
+        ...     (generate_cvar_curves, (stats, alphas, "reports/cvar.png"), {}),
+        ...     (generate_tail_distributions, (stats, "reports/tails.png"), {}),
+        ... ])
+    """
+    if max_workers is None:
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+
+    if max_workers <= 1 or len(jobs) <= 1:
+        return [fn(*args, **kwargs) for fn, args, kwargs in jobs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(fn, *args, **kwargs) for fn, args, kwargs in jobs]
+        return [future.result() for future in futures]
@@ -10,16 +10,79 @@ References:
 - SC-010: Risk-averse CVaR ≥ baseline
 """
 
-from pathlib import Path
+from typing import NamedTuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-from ..risk.cvar import cvar
+from ..risk.cvar import cvar_profile_from_cumsum
+from .figures import get_figure, save_figure
+
+
+class ReturnStats(NamedTuple):
+    """Per-episode return statistics shared by the risk figures."""
+
+    returns: np.ndarray
+    sorted_returns: np.ndarray
+    cumsum: np.ndarray
+    n: int
+
+
+def prepare_return_stats(episodes: list[dict] | ReturnStats) -> ReturnStats:
+    """
+    Extract and sort episode returns once for all risk figures.
+
+    Pass the result to generate_cvar_curves() and generate_tail_distributions()
+    in place of the episode list so both reuse the same sorted array.
+
+    Args:
+        episodes: List of episode dicts with 'total_return' key (or existing stats)
+
+    Returns:
+        ReturnStats(returns, sorted_returns, cumsum, n)
+
+    Example:
+        >>> stats = prepare_return_stats(episodes)
+        >>> generate_cvar_curves(stats, alphas, "reports/cvar.png")
+        >>> generate_tail_distributions(stats, "reports/tails.png")
+    """
+    if isinstance(episodes, ReturnStats):
+        return episodes
+
+    returns = np.fromiter((ep["total_return"] for ep in episodes), float, len(episodes))
+    sorted_returns = np.sort(returns)
+    return ReturnStats(returns, sorted_returns, np.cumsum(sorted_returns), len(returns))
+
+
+def _fast_hist(x: np.ndarray, bins: int, lo: float, hi: float) -> np.ndarray:
+    """Counts over uniform bins on [lo, hi] by direct indexing (no binary search)."""
+    idx = np.clip(((x - lo) / (hi - lo) * bins).astype(np.intp), 0, bins - 1)
+    return np.bincount(idx, minlength=bins)
+
+
+def _density_bars(ax, stats: ReturnStats, bins: int, **bar_kwargs) -> None:
+    """Draw a density histogram of the returns (same binning as ax.hist(density=True))."""
+    if stats.n == 0:
+        lo, hi = 0.0, 1.0
+    else:
+        lo, hi = float(stats.sorted_returns[0]), float(stats.sorted_returns[-1])
+        if lo == hi:
+            # Matches np.histogram's range for constant data
+            lo, hi = lo - 0.5, hi + 0.5
+
+    width = (hi - lo) / bins
+    counts = _fast_hist(stats.returns, bins, lo, hi)
+    density = counts / (max(stats.n, 1) * width)
+    centers = lo + (np.arange(bins) + 0.5) * width
+
+    ax.bar(centers, density, width=width, **bar_kwargs)
 
 
 def generate_cvar_curves(
-    episodes: list[dict], alphas: np.ndarray, output_path: str, baseline_episodes: list[dict] = None
+    episodes: list[dict] | ReturnStats,
+    alphas: np.ndarray,
+    output_path: str,
+    baseline_episodes: list[dict] | ReturnStats | None = None,
+    fast: bool = False,
 ) -> dict:
     """
     Generate CVaR curves showing risk sensitivity across α values.
@@ -29,10 +92,11 @@ def generate_cvar_curves(
     Plots CVaR@α for various α ∈ (0, 1], comparing RSA agent vs baseline.
 
     Args:
-        episodes: List of episode dicts with 'total_return' key
+        episodes: List of episode dicts with 'total_return' key, or ReturnStats
         alphas: Array of CVaR risk levels (e.g., [0.05, 0.1, 0.2, ..., 1.0])
         output_path: Path to save figure
-        baseline_episodes: Optional baseline episodes for comparison
+        baseline_episodes: Optional baseline episodes (or ReturnStats) for comparison
+        fast: Bulk mode: save at lower DPI with aggressive path simplification
 
     Returns:
         Dict with CVaR values at each alpha
@@ -45,28 +109,18 @@ def generate_cvar_curves(
         >>> alphas = np.linspace(0.05, 1.0, 20)
         >>> results = generate_cvar_curves(episodes, alphas, "reports/cvar.png")
     """
-    # Extract returns
-    returns = np.array([ep["total_return"] for ep in episodes])
-
-    # Compute CVaR for each alpha
-    cvar_values = []
-    for alpha in alphas:
-        cvar_val = cvar(returns, alpha)
-        cvar_values.append(cvar_val)
-
-    cvar_values = np.array(cvar_values)
+    # Compute CVaR for each alpha (one sort for the whole sweep)
+    stats = prepare_return_stats(episodes)
+    cvar_values = cvar_profile_from_cumsum(stats.cumsum, alphas)
 
     # Compute baseline if provided
     baseline_cvar = None
     if baseline_episodes:
-        baseline_returns = np.array([ep["total_return"] for ep in baseline_episodes])
-        baseline_cvar = []
-        for alpha in alphas:
-            baseline_cvar.append(cvar(baseline_returns, alpha))
-        baseline_cvar = np.array(baseline_cvar)
+        baseline_stats = prepare_return_stats(baseline_episodes)
+        baseline_cvar = cvar_profile_from_cumsum(baseline_stats.cumsum, alphas)
 
     # Plot
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = get_figure((10, 6))
 
     # RSA agent
     ax.plot(alphas, cvar_values, "b-", linewidth=2, label="RSA Agent", marker="o")
@@ -95,10 +149,7 @@ def generate_cvar_curves(
     ax.grid(True, alpha=0.3)
 
     # Save
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    save_figure(fig, output_path, fast=fast)
 
     # Return results
     results = {
@@ -112,7 +163,10 @@ def generate_cvar_curves(
 
 
 def generate_tail_distributions(
-    episodes: list[dict], output_path: str, baseline_episodes: list[dict] = None
+    episodes: list[dict] | ReturnStats,
+    output_path: str,
+    baseline_episodes: list[dict] | ReturnStats | None = None,
+    fast: bool = False,
 ) -> None:
     """
     Generate tail distribution comparison (histogram + CDF).
@@ -122,9 +176,10 @@ def generate_tail_distributions(
     Shows full distribution with focus on tail (worst outcomes).
 
     Args:
-        episodes: List of episode dicts with 'total_return'
+        episodes: List of episode dicts with 'total_return', or ReturnStats
         output_path: Path to save figure
-        baseline_episodes: Optional baseline for comparison
+        baseline_episodes: Optional baseline (episodes or ReturnStats) for comparison
+        fast: Bulk mode: save at lower DPI with aggressive path simplification
 
     References:
         - SC-010: Tail risk comparison
@@ -133,24 +188,22 @@ def generate_tail_distributions(
     Example:
         >>> generate_tail_distributions(episodes, "reports/tails.png")
     """
-    returns = np.array([ep["total_return"] for ep in episodes])
+    stats = prepare_return_stats(episodes)
 
-    baseline_returns = None
+    baseline_stats = None
     if baseline_episodes:
-        baseline_returns = np.array([ep["total_return"] for ep in baseline_episodes])
+        baseline_stats = prepare_return_stats(baseline_episodes)
 
     # Create figure with subplots
-    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    fig, axes = get_figure((14, 5), 1, 2)
 
     # Subplot 1: Histogram
     ax1 = axes[0]
     bins = 30
 
-    ax1.hist(returns, bins=bins, alpha=0.7, label="RSA Agent", color="blue", density=True)
-    if baseline_returns is not None:
-        ax1.hist(
-            baseline_returns, bins=bins, alpha=0.7, label="Baseline", color="red", density=True
-        )
+    _density_bars(ax1, stats, bins, alpha=0.7, label="RSA Agent", color="blue")
+    if baseline_stats is not None:
+        _density_bars(ax1, baseline_stats, bins, alpha=0.7, label="Baseline", color="red")
 
     ax1.set_xlabel("Total Return", fontsize=12)
     ax1.set_ylabel("Density", fontsize=12)
@@ -161,15 +214,14 @@ def generate_tail_distributions(
     # Subplot 2: Empirical CDF (focus on tail)
     ax2 = axes[1]
 
-    # Sort returns
-    sorted_returns = np.sort(returns)
-    cdf = np.arange(1, len(sorted_returns) + 1) / len(sorted_returns)
+    # Returns are already sorted in the stats
+    sorted_returns = stats.sorted_returns
+    cdf = np.arange(1, stats.n + 1) / stats.n
     ax2.plot(sorted_returns, cdf, "b-", linewidth=2, label="RSA Agent")
 
-    if baseline_returns is not None:
-        sorted_baseline = np.sort(baseline_returns)
-        cdf_baseline = np.arange(1, len(sorted_baseline) + 1) / len(sorted_baseline)
-        ax2.plot(sorted_baseline, cdf_baseline, "r--", linewidth=2, label="Baseline")
+    if baseline_stats is not None:
+        cdf_baseline = np.arange(1, baseline_stats.n + 1) / baseline_stats.n
+        ax2.plot(baseline_stats.sorted_returns, cdf_baseline, "r--", linewidth=2, label="Baseline")
 
     # Highlight worst 10% (α=0.1 tail)
     ax2.axhline(0.1, color="gray", linestyle=":", linewidth=1, label="α=0.1 Tail")
@@ -185,11 +237,11 @@ def generate_tail_distributions(
     ax2.set_ylim([0, 0.5])  # Focus on lower tail
 
     # Save
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    save_figure(fig, output_path, fast=fast)
 
 
 def __repr__() -> str:
-    return "Risk reporting: generate_cvar_curves(), generate_tail_distributions()"
+    return (
+        "Risk reporting: prepare_return_stats(), generate_cvar_curves(), "
+        "generate_tail_distributions()"
+    )
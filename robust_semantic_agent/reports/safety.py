@@ -10,13 +10,19 @@ References:
 - SC-001: Zero violations
 """
 
-from pathlib import Path
-
-import matplotlib.pyplot as plt
 import numpy as np
 
+from ..core.episode import EMPTY_INFO
+from .figures import get_figure, save_figure
+
+# Forbidden zone assumed by traces that do not store barrier values
+_OBSTACLE_CENTER = np.zeros(2)
+_OBSTACLE_RADIUS_SQ = 0.3**2
+
 
-def generate_barrier_traces(episodes: list[dict], output_path: str, max_episodes: int = 5) -> None:
+def generate_barrier_traces(
+    episodes: list[dict], output_path: str, max_episodes: int = 5, fast: bool = False
+) -> None:
     """
     Generate barrier function B(x) traces over time.
 
@@ -27,8 +33,10 @@ def generate_barrier_traces(episodes: list[dict], output_path: str, max_episodes
 
     Args:
         episodes: List of episode dicts with step-level info containing 'barrier_value'
+            (uses the 'steps_arr' structured array when present)
         output_path: Path to save figure
         max_episodes: Maximum number of episodes to plot (avoid clutter)
+        fast: Bulk mode: save at lower DPI with aggressive path simplification
 
     References:
         - SC-001: Zero violations (B(x) > 0 → violation)
@@ -37,43 +45,53 @@ def generate_barrier_traces(episodes: list[dict], output_path: str, max_episodes
     Example:
         >>> generate_barrier_traces(episodes, "reports/barriers.png", max_episodes=10)
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = get_figure((12, 6))
 
     violation_count = 0
     total_steps = 0
 
     # Plot first max_episodes
     for ep_idx, episode in enumerate(episodes[:max_episodes]):
-        if "steps" not in episode:
+        steps_arr = episode.get("steps_arr")
+        if steps_arr is not None:
+            # Structured step array: barrier column is already contiguous
+            barrier_values = steps_arr["barrier_value"].astype(float)
+        elif "steps" in episode:
+            steps = episode["steps"]
+
+            # Barrier values stored in step info (NaN where absent)
+            barrier_values = np.fromiter(
+                (step.get("info", EMPTY_INFO).get("barrier_value", np.nan) for step in steps),
+                dtype=float,
+                count=len(steps),
+            )
+        else:
             continue
 
-        steps = episode["steps"]
-        timesteps = list(range(len(steps)))
-
-        # Extract barrier values
-        barrier_values = []
-        for step in steps:
-            # Get barrier value from step info
-            info = step.get("info", {})
-            # Compute barrier value from true state if not stored
-            if "barrier_value" in info:
-                B = info["barrier_value"]
-            else:
-                # Compute from state: B(x) = r² - ||x - center||² where r = obstacle radius
-                state = step.get("state", np.array([0, 0]))
-                # Assume circular obstacle at origin with radius 0.3
-                B = 0.3**2 - np.linalg.norm(state - np.array([0, 0])) ** 2
-
-            barrier_values.append(B)
-
-            # Check violation
-            if B > 0:
-                violation_count += 1
+        n_steps = len(barrier_values)
+        timesteps = np.arange(n_steps)
 
-            total_steps += 1
+        # Compute missing values from state: B(x) = r² - ||x - center||²
+        missing = np.isnan(barrier_values)
+        if missing.any():
+            if steps_arr is not None:
+                states = steps_arr["state"].astype(float)
+            else:
+                states = np.fromiter(
+                    (step.get("state", _OBSTACLE_CENTER) for step in steps),
+                    dtype=(float, 2),
+                    count=n_steps,
+                )
+            delta = states - _OBSTACLE_CENTER
+            computed = _OBSTACLE_RADIUS_SQ - np.einsum("td,td->t", delta, delta)
+            barrier_values = np.where(missing, computed, barrier_values)
+
+        # Check violations
+        violation_count += int(np.count_nonzero(barrier_values > 0))
+        total_steps += n_steps
 
         # Plot
-        color = "blue" if max(barrier_values) <= 0 else "red"
+        color = "blue" if barrier_values.max() <= 0 else "red"
         alpha = 0.7 if ep_idx < 3 else 0.3  # Emphasize first few
         ax.plot(timesteps, barrier_values, color=color, alpha=alpha, linewidth=1.5)
 
@@ -100,10 +118,7 @@ def generate_barrier_traces(episodes: list[dict], output_path: str, max_episodes
     ax.grid(True, alpha=0.3)
 
     # Save
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    save_figure(fig, output_path, fast=fast)
 
 
 def compute_violation_rates(episodes: list[dict]) -> dict:
@@ -115,7 +130,7 @@ def compute_violation_rates(episodes: list[dict]) -> dict:
     Returns detailed breakdown of violations, filter activations, and safety margins.
 
     Args:
-        episodes: List of episode dicts
+        episodes: List of episode dicts (uses 'steps_arr' when present)
 
     Returns:
         Dict with keys:
@@ -140,26 +155,33 @@ def compute_violation_rates(episodes: list[dict]) -> dict:
     filter_activations = 0
 
     for episode in episodes:
-        if "steps" not in episode:
+        steps_arr = episode.get("steps_arr")
+        if steps_arr is not None:
+            # Structured step array: read the flag columns directly
+            n_steps = len(steps_arr)
+            violated = steps_arr["violated_safety"]
+            filter_active = steps_arr["safety_filter_active"]
+        elif "steps" in episode:
+            infos = [step.get("info", EMPTY_INFO) for step in episode["steps"]]
+            n_steps = len(infos)
+
+            violated = np.fromiter(
+                (info.get("violated_safety", False) for info in infos), dtype=bool, count=n_steps
+            )
+            filter_active = np.fromiter(
+                (info.get("safety_filter_active", False) for info in infos),
+                dtype=bool,
+                count=n_steps,
+            )
+        else:
             continue
 
-        episode_had_violation = False
-
-        for step in episode["steps"]:
-            total_steps += 1
-
-            info = step.get("info", {})
-
-            # Check violation
-            if info.get("violated_safety", False):
-                violations += 1
-                episode_had_violation = True
-
-            # Check filter activation
-            if info.get("safety_filter_active", False):
-                filter_activations += 1
+        total_steps += n_steps
+        n_violations = int(np.count_nonzero(violated))
+        violations += n_violations
+        filter_activations += int(np.count_nonzero(filter_active))
 
-        if episode_had_violation:
+        if n_violations > 0:
             episodes_with_violations += 1
 
     # Compute rates
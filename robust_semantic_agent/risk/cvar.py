@@ -4,9 +4,10 @@ Feature: 002-full-prototype
 Tasks: T032, T033
 
 Implements:
-- cvar(): Sort-and-average algorithm for empirical samples
+- cvar(): Partition-and-average algorithm for empirical samples
+- cvar_profile(): CVaR over a sweep of α from a single sort
 - cvar_weighted(): Weighted CVaR for particle beliefs
-- RiskBellman: Risk-aware Bellman operator
+- RiskBellman: Risk-aware Bellman operator (per-action and batched backups)
 
 References:
 - docs/theory.md §4: Risk measures
@@ -21,13 +22,14 @@ import numpy as np
 
 def cvar(values: np.ndarray, alpha: float = 0.10) -> float:
     """
-    Compute CVaR@α from empirical samples (sort-and-average).
+    Compute CVaR@α from empirical samples (partition-and-average).
 
     CVaR@α = mean of worst α-fraction of outcomes
 
     Args:
         values: Array of outcome values (n,) - lower is worse for losses
-        alpha: Tail risk level ∈ (0, 1] (default 0.10 = focus on worst 10%)
+        alpha: Tail risk level ∈ (0, 1] (default 0.10 = focus on worst 10%);
+               α ≤ 1/n reduces to the minimum
 
     Returns:
         CVaR value (expected value in worst α-tail)
@@ -41,21 +43,75 @@ def cvar(values: np.ndarray, alpha: float = 0.10) -> float:
         - SC-005: Gaussian/Uniform analytical validation
         - docs/verified-apis.md: Algorithm specification
     """
+    values = np.asarray(values)
     n = len(values)
     cutoff_idx = max(1, int(np.ceil(alpha * n)))
+    if cutoff_idx >= n:
+        # α = 1: the tail is every sample
+        return np.mean(values)
+    if cutoff_idx == 1:
+        # α ≤ 1/n (including α → 0): the tail is the single worst sample
+        return np.min(values)
 
-    sorted_values = np.sort(values)  # Ascending order (worst first)
-    return np.mean(sorted_values[:cutoff_idx])
+    # Only the worst cutoff_idx values are needed: O(n) partition, no full sort
+    worst = np.partition(values, cutoff_idx - 1)[:cutoff_idx]
+    return np.mean(worst)
+
+
+def cvar_profile(values: np.ndarray, alphas: np.ndarray) -> np.ndarray:
+    """
+    Compute CVaR@α for many α values from one sort.
+
+    Equivalent to [cvar(values, α) for α in alphas], but sorts once and reads
+    each CVaR off the prefix means of the sorted samples.
+
+    Args:
+        values: Array of outcome values (n,)
+        alphas: Tail risk levels (m,), each ∈ (0, 1]
+
+    Returns:
+        CVaR values (m,)
+
+    Example:
+        >>> cvar_profile(returns, np.linspace(0.05, 1.0, 20))
+    """
+    return cvar_profile_from_cumsum(np.cumsum(np.sort(np.asarray(values))), alphas)
+
+
+def cvar_profile_from_cumsum(cumsum: np.ndarray, alphas: np.ndarray) -> np.ndarray:
+    """
+    Compute CVaR@α for many α values from prefix sums of sorted outcomes.
+
+    Lets callers that already hold np.cumsum(np.sort(values)) skip the sort.
+
+    Args:
+        cumsum: Prefix sums of the ascending-sorted outcome values (n,)
+        alphas: Tail risk levels (m,), each ∈ (0, 1]
+
+    Returns:
+        CVaR values (m,); all NaN when there are no outcomes
+    """
+    n = len(cumsum)
+    if n == 0:
+        return np.full(np.shape(alphas), np.nan)
+
+    # prefix_means[k-1] = mean of the k worst outcomes
+    cutoffs = np.clip(np.ceil(np.asarray(alphas) * n).astype(int), 1, n)
+
+    return cumsum[cutoffs - 1] / cutoffs
 
 
 def cvar_weighted(log_weights: np.ndarray, values: np.ndarray, alpha: float = 0.10) -> float:
     """
     Compute CVaR@α from log-weighted particles (for belief integration).
 
+    Exact tail mean of the weighted empirical distribution: particles are taken
+    worst-first until their weight sums to α, splitting the boundary particle.
+
     Args:
         log_weights: Log-probabilities (n,) from particle filter
         values: Outcome values (n,) for each particle
-        alpha: Tail risk level ∈ (0, 1]
+        alpha: Tail risk level ∈ (0, 1]; α ≤ 0 gives the worst weighted particle
 
     Returns:
         Weighted CVaR estimate
@@ -69,30 +125,51 @@ def cvar_weighted(log_weights: np.ndarray, values: np.ndarray, alpha: float = 0.
         - FR-006: CVaR requirement
         - docs/theory.md §4.1: CVaR operator
     """
-    # Normalize weights stably
-    weights = np.exp(log_weights - np.max(log_weights))
-    weights /= np.sum(weights)
+    # Unnormalized weights exp(log w - max): one max and one exp pass. Instead of
+    # scaling all N weights by 1/Σw, the tail is measured against mass = α·Σw
+    weights = np.asarray(log_weights, dtype=np.float64) - np.max(log_weights)
+    np.exp(weights, out=weights)
+    total = np.sum(weights)
+    mass = alpha * total
+
+    values = np.asarray(values)
+    n = len(values)
 
-    # Sort by value (ascending)
-    sorted_idx = np.argsort(values)
-    sorted_values = values[sorted_idx]
-    sorted_weights = weights[sorted_idx]
+    if alpha >= 1.0:
+        # The tail is the whole distribution: plain weighted mean
+        return float(np.dot(weights, values) / total)
+    if alpha <= 0.0:
+        # Limit α → 0: worst particle carrying any weight
+        return float(np.min(values[weights > 0.0]))
+
+    # The α-tail lives among the lowest values: partition out a candidate set
+    # of k ≈ 3αN particles and sort only those (O(N) instead of O(N log N))
+    k = min(n, max(16, int(np.ceil(3 * alpha * n))))
+    if k < n:
+        candidates = np.argpartition(values, k - 1)[:k]
+        sorted_idx = candidates[np.argsort(values[candidates])]
+        sorted_weights = weights[sorted_idx]
+        cumsum = np.cumsum(sorted_weights)
+        if cumsum[-1] < mass:
+            # Candidate set carries too little mass to contain the tail
+            sorted_idx = None
+    else:
+        sorted_idx = None
 
-    # Find α-quantile cutoff
-    cumsum = np.cumsum(sorted_weights)
-    cutoff_idx = np.searchsorted(cumsum, alpha, side="right")
+    if sorted_idx is None:
+        sorted_idx = np.argsort(values)
+        sorted_weights = weights[sorted_idx]
+        cumsum = np.cumsum(sorted_weights)
 
-    if cutoff_idx == 0:
-        cutoff_idx = 1
+    # First particle whose cumulative weight reaches α (clamped against rounding)
+    cutoff_idx = min(int(np.searchsorted(cumsum, mass, side="left")), len(cumsum) - 1)
 
-    # Weighted average of tail
-    tail_weights = sorted_weights[:cutoff_idx]
-    tail_values = sorted_values[:cutoff_idx]
+    # Tail mass is exactly α: the boundary particle contributes only the part of its
+    # weight that lies inside the tail
+    tail_weights = sorted_weights[: cutoff_idx + 1].copy()
+    tail_weights[-1] -= cumsum[cutoff_idx] - mass
 
-    if np.sum(tail_weights) > 1e-12:
-        return np.average(tail_values, weights=tail_weights)
-    else:
-        return sorted_values[0]  # Worst case fallback
+    return float(np.dot(tail_weights, values[sorted_idx[: cutoff_idx + 1]]) / mass)
 
 
 class RiskBellman:
@@ -129,6 +206,8 @@ class RiskBellman:
         transition_fn: Callable,
         value_fn: Callable,
         n_samples: int = 100,
+        vectorized: bool = True,
+        rng: np.random.Generator | None = None,
     ) -> float:
         """
         Compute CVaR Bellman backup for belief-action pair.
@@ -138,10 +217,13 @@ class RiskBellman:
         Args:
             belief: Belief object with particles and log_weights
             action: Control input (m,)
-            reward_fn: (state, action) → reward
-            transition_fn: (state, action) → next_state
-            value_fn: (next_belief) → value
+            reward_fn: (states, action) → rewards, batched over (n_samples, state_dim)
+            transition_fn: (states, action) → next_states (n_samples, state_dim)
+            value_fn: (next_states) → values (n_samples,)
             n_samples: Monte Carlo samples for expectation
+            vectorized: If False, callables take a single state (state_dim,) and
+                        are evaluated per sample (legacy scalar contract)
+            rng: Generator for the particle draw (default: belief.rng)
 
         Returns:
             CVaR value estimate
@@ -149,31 +231,74 @@ class RiskBellman:
         References:
             - Task T033: RiskBellman implementation
         """
-        # Sample particles from belief
-        weights = np.exp(belief.log_weights - np.max(belief.log_weights))
-        weights /= np.sum(weights)
-
-        indices = np.random.choice(len(belief.particles), size=n_samples, replace=True, p=weights)
+        sampled_particles = self._sample_particles(belief, n_samples, rng)
+
+        # Returns r + γ V(x') for all samples (next value assumed deterministic)
+        if vectorized:
+            rewards = reward_fn(sampled_particles, action)
+            next_values = value_fn(transition_fn(sampled_particles, action))
+            returns = np.asarray(rewards + self.gamma * next_values, dtype=float)
+        else:
+            returns = np.array(
+                [
+                    reward_fn(x, action) + self.gamma * value_fn(transition_fn(x, action))
+                    for x in sampled_particles
+                ],
+                dtype=float,
+            )
 
-        sampled_particles = belief.particles[indices]
-
-        # Compute returns for each sample
-        returns = []
-        for x in sampled_particles:
-            # Immediate reward
-            r = reward_fn(x, action)
+        # CVaR of returns
+        return cvar(returns, self.alpha)
 
-            # Next state
-            x_next = transition_fn(x, action)
+    def backup_batched(
+        self,
+        belief,
+        actions: np.ndarray,
+        reward_fn: Callable,
+        transition_fn: Callable,
+        value_fn: Callable,
+        n_samples: int = 100,
+        rng: np.random.Generator | None = None,
+    ) -> np.ndarray:
+        """
+        Compute CVaR Bellman backups for several actions from one particle sample.
 
-            # Next value (simplified: assume deterministic)
-            v_next = value_fn(x_next)
+        Equivalent to calling backup() per action with the same sampled particles,
+        but samples once and takes all A tail means with a single row-wise partition.
 
-            # Total return
-            returns.append(r + self.gamma * v_next)
+        Args:
+            belief: Belief object with particles and log_weights
+            actions: Candidate control inputs (A, m)
+            reward_fn: (states, action) → rewards, batched over (n_samples, state_dim)
+            transition_fn: (states, action) → next_states (n_samples, state_dim)
+            value_fn: (next_states) → values (n_samples,)
+            n_samples: Monte Carlo samples for expectation
+            rng: Generator for the particle draw (default: belief.rng)
 
-        # CVaR of returns
-        return cvar(np.array(returns), self.alpha)
+        Returns:
+            CVaR value estimates (A,)
+        """
+        sampled_particles = self._sample_particles(belief, n_samples, rng)
+
+        returns = np.empty((len(actions), n_samples))
+        for a_idx, action in enumerate(actions):
+            rewards = reward_fn(sampled_particles, action)
+            next_values = value_fn(transition_fn(sampled_particles, action))
+            returns[a_idx] = rewards + self.gamma * next_values
+
+        cutoff_idx = max(1, int(np.ceil(self.alpha * n_samples)))
+        return np.partition(returns, cutoff_idx - 1, axis=1)[:, :cutoff_idx].mean(axis=1)
+
+    @staticmethod
+    def _sample_particles(
+        belief, n_samples: int, rng: np.random.Generator | None = None
+    ) -> np.ndarray:
+        """Draw n_samples particles from the belief by weight (with replacement)."""
+        if rng is None:
+            rng = belief.rng
+        indices = rng.choice(belief.n_particles, size=n_samples, replace=True, p=belief.weights)
+
+        return belief.particles[indices]
 
     def __repr__(self) -> str:
         return f"RiskBellman(α={self.alpha}, γ={self.gamma})"
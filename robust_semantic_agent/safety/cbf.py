@@ -3,7 +3,7 @@ Control Barrier Function (CBF) Safety Filter
 Feature: 002-full-prototype
 Task: T035
 
-Implements QP-based safety filter using cvxpy + OSQP solver.
+Implements QP-based safety filter using a persistent OSQP problem instance.
 
 Minimizes deviation from desired control while enforcing CBF constraint:
     minimize    ||u - u_des||²
@@ -17,8 +17,18 @@ References:
 
 import logging
 
-import cvxpy as cp
 import numpy as np
+import osqp
+from scipy import sparse
+
+# OSQP statuses accepted as a usable solution
+_SOLVED_STATUSES = ("solved", "solved inaccurate")
+
+# Below this ||Lgh||² the closed-form projection is ill-conditioned; defer to OSQP
+_DEGENERATE_GRAD_SQ = 1e-12
+
+# Positions of Lgh₀, Lgh₁ in A's CSC data; the slack entries never change
+_LGH_IDX = np.array([0, 1])
 
 
 class SafetyFilter:
@@ -36,6 +46,7 @@ class SafetyFilter:
 
     Methods:
         filter(x, u_desired): Project desired control onto safe set
+        filter_batch(X, U_desired): Vectorized filter() over N rows
 
     References:
         - SC-001: Zero violations requirement
@@ -49,6 +60,7 @@ class SafetyFilter:
         slack_penalty: float = 1000.0,
         max_iter: int = 200,
         verbose: bool = False,
+        enable_slack: bool = True,
     ):
         """
         Initialize CBF-QP safety filter.
@@ -59,18 +71,82 @@ class SafetyFilter:
             slack_penalty: Penalty weight for constraint relaxation
             max_iter: OSQP max iterations
             verbose: Print solver output
+            enable_slack: Cap the projection multiplier at slack_penalty and let
+                          slack absorb the rest. With unbounded u the constraint
+                          is always feasible, so False returns the pure projection
+                          (slack = 0) unless the barrier gradient vanishes
         """
         self.barrier_fn = barrier_fn
         self.alpha = alpha
         self.slack_penalty = slack_penalty
         self.max_iter = max_iter
         self.verbose = verbose
+        self.enable_slack = enable_slack
+
+        # Scratch buffers: the OSQP data vectors (filled in place). Lgh(x) is a
+        # view into A's values, so the barrier gradient lands where OSQP reads it
+        self._q = np.array([0.0, 0.0, slack_penalty])
+        self._Ax = np.ones(4)  # [Lgh₀, Lgh₁, 1, 1] in A's CSC order
+        self._l = np.zeros(2)
+        self._lgh = self._Ax[:2]
 
         self.logger = logging.getLogger(__name__)
 
+        # QP over z = [u₀, u₁, slack], set up once; filter() only updates data
+        self._qp = self._setup_qp()
+
+        # Previous primal/dual solution, used to warm-start the next solve
+        self._last_x = None
+        self._last_y = None
+
+    def _setup_qp(self) -> osqp.OSQP:
+        """
+        Build the OSQP instance with a fixed sparsity pattern.
+
+        minimize    ½ zᵀPz + qᵀz,   P = diag(2, 2, 0),  q = [-2·u_des, penalty]
+        subject to  l ≤ Az ≤ +∞,    A = [[Lgh₀, Lgh₁, 1],   (CBF row)
+                                         [0,    0,    1]]   (slack ≥ 0)
+
+        Lgh entries are placeholders; filter() overwrites them via update(Ax=...).
+        """
+        P = sparse.csc_matrix(
+            (np.array([2.0, 2.0]), np.array([0, 1]), np.array([0, 1, 2, 2])), shape=(3, 3)
+        )
+        # CSC columns: u₀ → row 0, u₁ → row 0, slack → rows 0 and 1
+        A = sparse.csc_matrix(
+            (np.ones(4), np.array([0, 0, 0, 1]), np.array([0, 1, 2, 4])), shape=(2, 3)
+        )
+
+        qp = osqp.OSQP()
+        qp.setup(
+            P,
+            self._q,
+            A,
+            self._l,
+            np.full(2, np.inf),
+            max_iter=self.max_iter,
+            eps_abs=1e-4,
+            eps_rel=1e-4,
+            polishing=True,
+            warm_starting=True,
+            verbose=self.verbose,
+        )
+        return qp
+
+    def reset(self) -> None:
+        """
+        Drop the cached OSQP solution so the next fallback solve starts cold.
+
+        Warm starts assume the QP changes slowly between consecutive calls;
+        across episodes the state jumps, so the old iterate is no better a
+        guess than zero.
+        """
+        self._last_x = None
+        self._last_y = None
+
     def filter(self, x: np.ndarray, u_desired: np.ndarray) -> tuple[np.ndarray, float]:
         """
-        Project desired control onto safe set via QP.
+        Project desired control onto safe set via QP (solved in closed form).
 
         minimize    ||u - u_desired||²  + penalty × slack
         subject to  ∇h(x)·u ≥ -α·h(x) - slack
@@ -88,48 +164,142 @@ class SafetyFilter:
             - docs/verified-apis.md: OSQP solver configuration
             - Task T025: QP solve tests
         """
-        m = len(u_desired)
+        # CBF constraint terms (2D integrator: Lfh = 0, Lgh = ∇h), one barrier call
+        h_x, Lgh = self.barrier_fn.evaluate_with_gradient(x, out=self._lgh)
+        Lfh = 0.0
 
-        # Decision variables
-        u = cp.Variable(m)
-        slack = cp.Variable(nonneg=True)
+        # Constraint violation v = -α·h(x) - Lfh - Lgh·u_des
+        g0, g1 = Lgh[0], Lgh[1]
+        violation = -self.alpha * h_x - Lfh - (g0 * u_desired[0] + g1 * u_desired[1])
 
-        # Objective: minimize deviation + penalize slack
-        objective = cp.Minimize(cp.sum_squares(u - u_desired) + self.slack_penalty * slack)
+        # Fast path: if u_desired already satisfies the constraint (v ≤ 0) it is
+        # the QP optimum (zero deviation, zero slack), so skip the solve entirely
+        if violation <= 0.0:
+            return np.array(u_desired, dtype=float), 0.0
 
-        # CBF constraint
-        h_x = self.barrier_fn.evaluate(x)
-        dh_dx = self.barrier_fn.gradient(x)
+        # Closed-form KKT solution for the single half-space constraint:
+        #   u* = u_des + (λ/2)·Lgh,  λ = min(2v / ||Lgh||², penalty)
+        # λ hitting the penalty cap means relaxing is cheaper than projecting:
+        # slack absorbs the rest. Without enable_slack λ is uncapped (u is
+        # unbounded, so the projection always exists).
+        grad_sq = g0 * g0 + g1 * g1
+        if grad_sq > _DEGENERATE_GRAD_SQ:
+            step = violation / grad_sq
+            slack_value = 0.0
+            if self.enable_slack and 2.0 * step > self.slack_penalty:
+                step = 0.5 * self.slack_penalty
+                slack_value = violation - step * grad_sq
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"CBF relaxed by slack={slack_value:.6f} at state {x}")
 
-        # For 2D integrator: Lfh = 0, Lgh = ∇h
-        # Constraint: ḣ = ∇h(x)·u ≥ -α·h(x) - slack
-        # This ensures h(x) remains non-negative (safe set)
-        constraints = [dh_dx @ u >= -self.alpha * h_x - slack]
+            return np.array([u_desired[0] + step * g0, u_desired[1] + step * g1]), slack_value
 
-        # Solve QP
-        prob = cp.Problem(objective, constraints)
+        return self._solve_qp(x, u_desired, h_x, Lfh, Lgh)
 
+    def filter_batch(self, X: np.ndarray, U_desired: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Filter N independent (state, desired control) pairs in one vectorized pass.
+
+        Row-wise equivalent to filter() for 2D integrator dynamics (Lfh = 0,
+        Lgh = ∇h): inactive rows pass through, active rows take the closed-form
+        projection, and only degenerate-gradient rows go through OSQP.
+
+        Args:
+            X: States (N, 2)
+            U_desired: Nominal control inputs (N, 2)
+
+        Returns:
+            U_safe: Safe control inputs (N, 2)
+            slacks: Slack values (N,)
+
+        Example:
+            >>> U_safe, slacks = safety_filter.filter_batch(states, desired_actions)
+        """
+        X = np.asarray(X, dtype=float)
+        U_desired = np.asarray(U_desired, dtype=float)
+
+        H = self.barrier_fn.evaluate_batch(X)
+        G = self.barrier_fn.gradient_batch(X)
+
+        # v = -α·H - G·U, built in place in one (N,) buffer (H is still needed
+        # for degenerate rows, so it is not overwritten)
+        violation = np.multiply(H, -self.alpha)
+        violation -= np.einsum("ni,ni->n", G, U_desired)
+        grad_sq = np.einsum("ni,ni->n", G, G)
+        active = violation > 0
+        regular = active & (grad_sq > _DEGENERATE_GRAD_SQ)
+
+        # Same KKT step as filter(), capped where slack is cheaper than projecting
+        step = np.zeros(len(X))
+        step[regular] = violation[regular] / grad_sq[regular]
+        slacks = np.zeros(len(X))
+        if self.enable_slack:
+            capped = 2.0 * step > self.slack_penalty
+        else:
+            capped = np.zeros(len(X), dtype=bool)
+        step[capped] = 0.5 * self.slack_penalty
+        slacks[capped] = violation[capped] - step[capped] * grad_sq[capped]
+
+        U_safe = U_desired + step[:, None] * G
+
+        for i in np.flatnonzero(active & ~regular):
+            U_safe[i], slacks[i] = self._solve_qp(X[i], U_desired[i], H[i], 0.0, G[i])
+
+        return U_safe, slacks
+
+    def _solve_qp(
+        self, x: np.ndarray, u_desired: np.ndarray, h_x: float, Lfh: float, Lgh: np.ndarray
+    ) -> tuple[np.ndarray, float]:
+        """
+        Solve the CBF-QP numerically with OSQP (fallback for degenerate Lgh ≈ 0).
+
+        Args:
+            x: Current state (2,)
+            u_desired: Nominal control input (2,)
+            h_x: Barrier value h(x)
+            Lfh: Drift Lie derivative
+            Lgh: Control Lie derivative (2,)
+
+        Returns:
+            u_safe: Safe control input (2,)
+            slack: Slack variable value (0 if feasible)
+        """
+        m = len(u_desired)
+
+        # Objective: ||u - u_des||² + penalty·slack (constant term dropped)
+        # Constraint: Lfh + Lgh·u + slack ≥ -α·h(x), slack ≥ 0
+        # This ensures h(x) remains non-negative (safe set)
         try:
-            prob.solve(
-                solver=cp.OSQP,
-                warm_start=True,
-                max_iter=self.max_iter,
-                verbose=self.verbose,
-            )
+            # q = [-2·u_des, penalty]; P and q[2] are fixed since setup
+            self._q[0] = -2.0 * u_desired[0]
+            self._q[1] = -2.0 * u_desired[1]
+            self._lgh[:] = Lgh
+            self._l[0] = -self.alpha * h_x - Lfh
+            # Only the two Lgh values change; the sparsity pattern is fixed
+            self._qp.update(q=self._q, l=self._l, Ax=self._lgh, Ax_idx=_LGH_IDX)
+            if self._last_x is not None:
+                self._qp.warm_start(x=self._last_x, y=self._last_y)
+            res = self._qp.solve(raise_error=False)
+
+            if res.info.status not in _SOLVED_STATUSES:
+                self.logger.warning(f"QP solver status: {res.info.status}")
+                if res.x is None or not np.all(np.isfinite(res.x)):
+                    self._last_x = self._last_y = None
+                    return np.zeros(m), float("inf")
 
-            if prob.status not in [cp.OPTIMAL, cp.OPTIMAL_INACCURATE]:
-                self.logger.warning(f"QP solver status: {prob.status}")
+            self._last_x = res.x.copy()
+            self._last_y = res.y.copy()
 
-            u_safe = u.value
-            slack_value = slack.value
+            u_safe = res.x[:2].copy()
+            slack_value = max(float(res.x[2]), 0.0)
 
             # Log if slack was used
-            if slack_value > 1e-5:
+            if slack_value > 1e-5 and self.logger.isEnabledFor(logging.INFO):
                 self.logger.info(f"CBF relaxed by slack={slack_value:.6f} at state {x}")
 
             return u_safe, slack_value
 
-        except Exception as e:
+        except (osqp.OSQPException, ValueError) as e:
             self.logger.error(f"QP solve failed: {e}")
             # Fallback: return zero control
             return np.zeros(m), float("inf")
@@ -0,0 +1,17 @@
+"""
+Shared pytest configuration.
+
+Under pytest-xdist (make test-parallel) every worker is its own process, so
+BLAS/OpenMP thread pools are pinned to one thread per worker: otherwise N
+workers × N threads oversubscribe the cores and the performance tests
+report contention instead of per-step cost. Performance tests share the
+"perf" xdist_group, so with --dist loadgroup they run back to back on a
+single worker.
+"""
+
+import os
+
+if os.environ.get("PYTEST_XDIST_WORKER"):
+    # Must be set before NumPy loads its BLAS backend
+    for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(_var, "1")
@@ -15,7 +15,6 @@ Complete system integration test covering:
 This is the final validation test before project completion.
 """
 
-import json
 import tempfile
 from pathlib import Path
 
@@ -48,7 +47,7 @@ class TestEndToEndSystem:
         - Reports generate without errors
         """
         from robust_semantic_agent.core.config import Configuration
-        from robust_semantic_agent.core.episode import Episode
+        from robust_semantic_agent.core.episode import Episode, write_jsonl
         from robust_semantic_agent.envs.forbidden_circle.env import ForbiddenCircleEnv
         from robust_semantic_agent.policy.agent import Agent
 
@@ -62,6 +61,7 @@ class TestEndToEndSystem:
             config = Configuration.from_yaml("configs/default.yaml")
             config.belief.n_particles = 1000  # Faster for test
             config.safety.cbf = True  # Enable safety
+            np.random.seed(config.seed)
 
             print("\n✓ Configuration loaded")
 
@@ -108,15 +108,15 @@ class TestEndToEndSystem:
                     total_steps += 1
 
                     # Track violations
-                    if env_info.get("violated_safety", False):
+                    if env_info["violated_safety"]:
                         violation_count += 1
 
                     # Track filter activations
-                    if info.get("safety_filter_active", False):
+                    if info.safety_filter_active:
                         filter_activation_count += 1
 
                     # Check goal
-                    if env_info.get("goal_reached", False):
+                    if env_info["goal_reached"]:
                         goal_success_count += 1
                         break
 
@@ -135,10 +135,7 @@ class TestEndToEndSystem:
 
             # 5. Save episodes to JSONL
             episodes_file = runs_dir / "episodes.jsonl"
-            with open(episodes_file, "w") as f:
-                for ep in episodes:
-                    json.dump(ep, f)
-                    f.write("\n")
+            write_jsonl(episodes, episodes_file)
 
             print(f"✓ Episodes saved to {episodes_file}")
 
@@ -147,6 +144,7 @@ class TestEndToEndSystem:
             output_dir.mkdir()
 
             # Import report generators
+            from robust_semantic_agent.reports.render import render_all
             from robust_semantic_agent.reports.risk import (
                 generate_cvar_curves,
                 generate_tail_distributions,
@@ -162,9 +160,14 @@ class TestEndToEndSystem:
             tail_path = output_dir / "tail_distributions.png"
             barrier_path = output_dir / "barrier_traces.png"
 
-            generate_cvar_curves(episodes, alphas, str(cvar_path))
-            generate_tail_distributions(episodes, str(tail_path))
-            generate_barrier_traces(episodes, str(barrier_path), max_episodes=5)
+            render_all(
+                [
+                    (generate_cvar_curves, (episodes, alphas, str(cvar_path)), {}),
+                    (generate_tail_distributions, (episodes, str(tail_path)), {}),
+                    (generate_barrier_traces, (episodes, str(barrier_path)), {"max_episodes": 5}),
+                ],
+                max_workers=2,
+            )
             compute_violation_rates(episodes)
 
             print(f"✓ Reports generated in {output_dir}")
@@ -301,8 +304,8 @@ class TestEndToEndSystem:
         goal = np.array(config.env.goal_region)
 
         def value_fn(b):
-            mean = b.mean()
-            return -np.linalg.norm(mean - goal)
+            d = b.mean() - goal
+            return -np.sqrt(d @ d)
 
         # Compute EVI
         evi_threshold = 0.1
@@ -37,6 +37,7 @@ class TestNavigationScenario:
         # Load configuration
         config = Configuration.from_yaml("configs/default.yaml")
         config.safety.cbf = True  # Enable CBF
+        np.random.seed(config.seed)  # Env/agent seeds come from the global RNG
 
         # Create environment
         env = ForbiddenCircleEnv(config)
@@ -60,7 +61,7 @@ class TestNavigationScenario:
                 action, info = agent.act(obs)
 
                 # Check if safety filter was activated
-                if info.get("safety_filter_active", False):
+                if info.safety_filter_active:
                     filter_activation_count += 1
 
                 # Environment step
@@ -125,12 +126,12 @@ class TestNavigationScenario:
             obs_next, reward, done, env_info = env.step(action)
 
             # Get belief mean estimate
-            belief_mean = info.get("belief_mean", None)
+            belief_mean = info.belief_mean
             true_state = env_info.get("true_state", None)
 
             if belief_mean is not None and true_state is not None:
-                error = np.linalg.norm(belief_mean - true_state)
-                belief_errors.append(error)
+                d = belief_mean - true_state
+                belief_errors.append(float(d @ d))  # squared error; sqrt once below
 
             obs = obs_next
             if done:
@@ -141,8 +142,9 @@ class TestNavigationScenario:
         # because safety corrections alter the trajectory, increasing uncertainty
         # Just verify belief tracking runs without crashes and errors stay bounded
         if len(belief_errors) > 10:
-            mean_error = np.mean(belief_errors)
-            max_error = np.max(belief_errors)
+            errors = np.sqrt(belief_errors)
+            mean_error = np.mean(errors)
+            max_error = np.max(errors)
 
             # Errors should stay within reasonable bounds (not diverge to infinity)
             assert mean_error < 1.0, f"Belief tracking diverged: mean_error={mean_error:.3f}"
@@ -151,3 +153,58 @@ class TestNavigationScenario:
             print(
                 f"\n✓ Belief tracking stable: mean_error={mean_error:.3f}, max_error={max_error:.3f}"
             )
+
+    def test_vector_env_batch_filter_zero_violations(self):
+        """
+        Run a batch of episodes in lockstep with full-state feedback and the
+        batched CBF filter: no env may enter the forbidden zone (SC-001).
+        """
+        from robust_semantic_agent.core.config import Configuration
+        from robust_semantic_agent.envs.forbidden_circle.env import VectorForbiddenCircleEnv
+        from robust_semantic_agent.envs.forbidden_circle.safety import BarrierFunction
+        from robust_semantic_agent.safety.cbf import SafetyFilter
+
+        config = Configuration.from_yaml("configs/default.yaml")
+        envs = VectorForbiddenCircleEnv(config, n_envs=64, seed=0)
+        safety_filter = SafetyFilter(
+            BarrierFunction(
+                radius=config.env.obstacle_radius, center=np.array(config.env.obstacle_center)
+            ),
+            alpha=config.safety.barrier_alpha,
+        )
+
+        envs.reset()
+        assert envs.state.shape == (64, 2)
+
+        violation_count = 0
+        filter_activation_count = 0
+        goal_reached = np.zeros(64, dtype=bool)
+        dones = envs.done.copy()
+        while not dones.all():
+            states = envs.state.copy()
+            # Goal-directed command clipped to the actuator box, fast enough that some
+            # envs finish early and must then stay frozen
+            max_action = config.env.max_action
+            U_desired = np.clip(envs.goal_region - states, -max_action, max_action)
+            U_safe, _ = safety_filter.filter_batch(states, U_desired)
+            filter_activation_count += int(
+                (~dones & ~np.isclose(U_safe, U_desired).all(axis=1)).sum()
+            )
+
+            finished = dones
+            obs, rewards, dones, info = envs.step(U_safe)
+
+            assert obs.shape == (64, 2) and rewards.shape == (64,)
+            np.testing.assert_array_equal(info["active"], ~finished)
+            # Finished envs are frozen and contribute nothing
+            np.testing.assert_array_equal(envs.state[finished], states[finished])
+            assert (rewards[finished] == 0.0).all()
+            assert not info["goal_reached"][finished].any()
+            goal_reached |= info["goal_reached"]
+            violation_count += int(info["violated_safety"].sum())
+
+        assert goal_reached.any(), "Some envs should finish early (frozen-env checks)"
+        # The batch ends at the step limit unless every env reached the goal first
+        assert goal_reached.all() or envs.timestep == envs.max_timesteps
+        assert violation_count == 0, f"SC-001 FAILED: {violation_count} violations"
+        assert filter_activation_count > 0, "Filter should activate for some trajectories"
@@ -62,9 +62,9 @@ class TestQueryActionROI:
             action, info = agent.act(obs)
 
             # Check if query was triggered
-            if info.get("query_triggered", False):
+            if info.query_triggered:
                 query_triggered = True
-                evi_at_trigger = info.get("evi", 0.0)
+                evi_at_trigger = info.evi
                 break
 
             obs_next, reward, done, env_info = env.step(action)
@@ -110,7 +110,7 @@ class TestQueryActionROI:
             action, info = agent.act(obs)
 
             # Check if query was triggered
-            if info.get("query_triggered", False):
+            if info.query_triggered:
                 query_triggered = True
                 entropy_before = H_before
                 entropy_after = info.get("entropy_after_query", H_before)
@@ -150,11 +150,12 @@ class TestQueryActionROI:
         config_no_query.belief.particles = 500
         config_no_query.query.enabled = False
 
+        # Built once; reset() recycles them between episodes
+        env = ForbiddenCircleEnv(config_no_query)
+        agent = Agent(config_no_query)
+
         regret_no_query = []
         for _ep in range(n_episodes):
-            env = ForbiddenCircleEnv(config_no_query)
-            agent = Agent(config_no_query)
-
             obs = env.reset()
             agent.reset()
 
@@ -181,11 +182,12 @@ class TestQueryActionROI:
         config_with_query.query.delta_star = 0.1
         config_with_query.query.cost = 0.02
 
+        # Built once; reset() recycles them between episodes
+        env = ForbiddenCircleEnv(config_with_query)
+        agent = Agent(config_with_query)
+
         regret_with_query = []
         for _ep in range(n_episodes):
-            env = ForbiddenCircleEnv(config_with_query)
-            agent = Agent(config_with_query)
-
             obs = env.reset()
             agent.reset()
 
@@ -198,7 +200,7 @@ class TestQueryActionROI:
 
                 # Include query cost if triggered
                 query_cost = (
-                    config_with_query.query.cost if info.get("query_triggered", False) else 0.0
+                    config_with_query.query.cost if info.query_triggered else 0.0
                 )
                 episode_regret += -reward + query_cost
 
@@ -261,7 +263,7 @@ class TestQueryActionROI:
                 if env_info.get("violated_safety", False):
                     violations += 1
 
-                if info.get("query_triggered", False):
+                if info.query_triggered:
                     queries_triggered += 1
 
                 obs = obs_next
@@ -0,0 +1,47 @@
+"""
+Shared fixtures for unit tests.
+
+Random inputs are drawn once per session from a seeded Generator and handed
+out read-only: tests derive their own arrays from them (scaling, slicing and
+setting Belief.particles all copy), so no test can perturb another's data.
+"""
+
+import numpy as np
+import pytest
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+@pytest.fixture(scope="session")
+def randn_pool() -> dict[str, np.ndarray]:
+    """Standard-normal arrays keyed by shape, e.g. randn_pool["1000x2"]."""
+    rng = np.random.default_rng(42)
+    return {
+        "1000x2": _frozen(rng.standard_normal((1000, 2))),
+        "500x2": _frozen(rng.standard_normal((500, 2))),
+        "1000": _frozen(rng.standard_normal(1000)),
+    }
+
+
+@pytest.fixture(scope="session")
+def beta_pool() -> dict[tuple[int, int], np.ndarray]:
+    """Beta(a, b) draws keyed by (a, b); slice disjoint ranges for independent samples."""
+    rng = np.random.default_rng(42)
+    return {
+        (a, b): _frozen(rng.beta(a, b, 10_000)) for a, b in ((5, 2), (2, 5), (2, 2))
+    }
+
+
+@pytest.fixture
+def particle_buf() -> np.ndarray:
+    """
+    Scratch (1000, 2) float64 buffer for drawing particles in place.
+
+    Fill a leading slice with Generator.standard_normal(out=...) and assign it
+    to Belief.particles, which copies into the belief's own float32 storage,
+    so one buffer serves every posterior a test builds.
+    """
+    return np.empty((1000, 2))
@@ -70,6 +70,111 @@ class TestBeliefObservationUpdate:
         assert ess_after < ess_before, "Informative observation should reduce ESS"
         assert ess_after < 0.5 * belief.n_particles, "ESS should drop significantly"
 
+    def test_update_obs_matches_gaussian_log_pdf(self):
+        """Per-dimension accumulation equals the (N, D) Gaussian log-pdf."""
+        from robust_semantic_agent.core.belief import Belief
+
+        rng = np.random.default_rng(3)
+        belief = Belief(n_particles=1000, state_dim=3)
+        belief.particles = rng.standard_normal((1000, 3))
+        prior = rng.standard_normal(1000)
+        belief.log_weights = prior.copy()
+
+        observation = np.array([0.4, -0.2, 0.1])
+        obs_noise = 0.25
+        belief.update_obs(observation, obs_noise)
+
+        diff = belief.particles.astype(np.float64) - observation
+        expected = prior - 0.5 * np.einsum("nd,nd->n", diff, diff) / obs_noise**2
+        expected -= np.logaddexp.reduce(expected)
+
+        np.testing.assert_allclose(belief.log_weights, expected, rtol=1e-12, atol=1e-9)
+
+    def test_particle_assignment_copies_foreign_buffers(self):
+        """Assigning another belief's particles copies; in-place updates do not."""
+        from robust_semantic_agent.core.belief import Belief
+
+        source = Belief(n_particles=100, state_dim=2)
+        source.particles = np.random.default_rng(0).standard_normal((100, 2))
+
+        target = Belief(n_particles=100, state_dim=2)
+        target.particles = source.particles
+        assert not np.shares_memory(target.particles, source.particles)
+
+        buffer = target.particles
+        target.particles += 1.0
+        assert np.shares_memory(target.particles, buffer)
+        np.testing.assert_allclose(target.particles, source.particles + 1.0)
+
+    def test_weights_cached_until_update(self):
+        """Normalized weights are computed once per update and stay in sync."""
+        from robust_semantic_agent.core.belief import Belief
+
+        belief = Belief(n_particles=500, state_dim=2)
+        belief.particles = np.random.default_rng(0).standard_normal((500, 2))
+
+        weights = belief.weights
+        assert belief.weights is weights
+        assert not weights.flags.writeable
+
+        belief.update_obs(np.array([0.5, 0.0]), obs_noise=0.3)
+        updated = belief.weights
+
+        assert updated is not weights
+        np.testing.assert_allclose(updated, np.exp(belief.log_weights), rtol=1e-12)
+
+    def test_entropy_and_clone(self):
+        """Entropy matches -Σ w log w; clones start equal and then diverge."""
+        from scipy.special import xlogy
+
+        from robust_semantic_agent.core.belief import Belief
+
+        belief = Belief(n_particles=500, state_dim=2)
+        belief.particles = np.random.default_rng(0).standard_normal((500, 2))
+        belief.update_obs(np.array([0.3, 0.1]), obs_noise=0.2)
+
+        weights = np.exp(belief.log_weights)
+        assert np.isclose(belief.entropy(), -xlogy(weights, weights).sum(), rtol=1e-12)
+
+        twin = belief.clone()
+        assert twin.entropy() == belief.entropy()
+
+        twin.update_obs(np.array([0.3, 0.1]), obs_noise=0.05)
+        assert twin.entropy() < belief.entropy()
+        assert not np.shares_memory(twin.particles, belief.particles)
+
+    def test_entropy_of_unnormalized_log_weights(self):
+        """Assigned log-weights are stored as given; entropy must not assume Σw = 1."""
+        from scipy.special import xlogy
+
+        from robust_semantic_agent.core.belief import Belief
+
+        belief = Belief(n_particles=100, state_dim=2)
+        belief.log_weights = np.zeros(100)
+        assert np.isclose(belief.entropy(), np.log(100), rtol=1e-12)
+
+        rng = np.random.default_rng(1)
+        log_weights = rng.standard_normal(500) * 3 + 7
+        log_weights[::50] = -np.inf  # zero-weight particles
+        belief = Belief.from_particles(rng.standard_normal((500, 2)), log_weights)
+        weights = belief.weights
+        assert np.isclose(belief.entropy(), -xlogy(weights, weights).sum(), rtol=1e-10)
+
+    def test_mean_cache_tracks_particles_and_weights(self):
+        """Cached mean is refreshed after weight updates and particle moves."""
+        from robust_semantic_agent.core.belief import Belief
+
+        belief = Belief(n_particles=500, state_dim=2)
+        belief.particles = np.random.default_rng(0).standard_normal((500, 2))
+        mean_before = belief.mean()
+
+        belief.update_obs(np.array([1.0, 0.0]), obs_noise=0.3)
+        assert belief.mean()[0] > mean_before[0]
+
+        mean_weighted = belief.mean()
+        belief.particles += np.array([2.0, -1.0])
+        np.testing.assert_allclose(belief.mean(), mean_weighted + [2.0, -1.0], atol=1e-5)
+
 
 @pytest.mark.unit
 class TestBeliefCommutativity:
@@ -124,6 +229,36 @@ class TestBeliefCommutativity:
 
         assert tv_dist <= 1e-6, f"Commutativity violated: TV distance = {tv_dist:.2e} > 1e-6"
 
+    def test_apply_message_rejects_non_vectorized_claim(self):
+        """A_c must return one bool per particle."""
+        from robust_semantic_agent.core.belief import Belief
+        from robust_semantic_agent.core.messages import Message, SourceTrust
+        from robust_semantic_agent.core.semantics import BelnapValue
+
+        belief = Belief(n_particles=100, state_dim=2)
+        source_trust = SourceTrust(r_s=0.8)
+
+        for bad_claim in (lambda p: p[:, 0], lambda p: p > 0.0):
+            message = Message(
+                claim="bad", source="source_1", value=BelnapValue.TRUE, A_c=bad_claim
+            )
+            with pytest.raises(ValueError, match="A_c"):
+                belief.apply_message(message, source_trust)
+
+    def test_threshold_claim_matches_lambda(self):
+        """ThresholdClaim should be a drop-in for the equivalent lambda predicate."""
+        from robust_semantic_agent.core.messages import ThresholdClaim
+
+        particles = np.random.default_rng(0).standard_normal((500, 2))
+        np.testing.assert_array_equal(
+            ThresholdClaim(axis=0, threshold=0.2)(particles), particles[:, 0] > 0.2
+        )
+        np.testing.assert_array_equal(
+            ThresholdClaim(axis=1, threshold=-0.1, op="<=")(particles), particles[:, 1] <= -0.1
+        )
+        with pytest.raises(ValueError, match="op"):
+            ThresholdClaim(axis=0, threshold=0.0, op="==")
+
 
 @pytest.mark.unit
 class TestBeliefResampling:
@@ -159,8 +294,9 @@ class TestBeliefResampling:
         """Resampling should restore ESS to ~N."""
         from robust_semantic_agent.core.belief import Belief
 
-        belief = Belief(n_particles=1000, state_dim=2)
-        belief.particles = np.random.randn(1000, 2)
+        rng = np.random.default_rng(42)
+        belief = Belief(n_particles=1000, state_dim=2, rng=rng)
+        belief.particles = rng.standard_normal((1000, 2))
 
         # Create low ESS via informative observation
         observation = np.array([0.0, 0.0])
@@ -182,8 +318,9 @@ class TestBeliefResampling:
         """Resampling should preserve weighted mean (approximately)."""
         from robust_semantic_agent.core.belief import Belief
 
-        belief = Belief(n_particles=5000, state_dim=2)
-        belief.particles = np.random.randn(5000, 2)
+        rng = np.random.default_rng(42)
+        belief = Belief(n_particles=5000, state_dim=2, rng=rng)
+        belief.particles = rng.standard_normal((5000, 2))
 
         # Create non-uniform weights
         observation = np.array([1.0, 0.5])
@@ -198,3 +335,21 @@ class TestBeliefResampling:
         # Means should be close (within sampling error)
         diff = np.linalg.norm(mean_after - mean_before)
         assert diff < 0.1, f"Resampling should preserve mean, got diff={diff:.3f}"
+
+    def test_stratified_resample_preserves_distribution(self):
+        """Stratified resampling should restore ESS and preserve the weighted mean."""
+        from robust_semantic_agent.core.belief import Belief
+
+        rng = np.random.default_rng(7)
+        belief = Belief(n_particles=5000, state_dim=2, rng=rng)
+        belief.particles = rng.standard_normal((5000, 2))
+        belief.update_obs(np.array([1.0, 0.5]), obs_noise=0.2)
+
+        mean_before = belief.mean()
+        belief.resample(scheme="stratified")
+
+        assert belief.ess() > 0.9 * belief.n_particles
+        assert np.linalg.norm(belief.mean() - mean_before) < 0.1
+
+        with pytest.raises(ValueError, match="scheme"):
+            belief.resample(scheme="multinomial")
@@ -12,10 +12,19 @@ References:
 
 import numpy as np
 
-from robust_semantic_agent.core.semantics import calibrate_thresholds
+from robust_semantic_agent.core.semantics import CALIBRATION_DTYPE, calibrate_thresholds
 from robust_semantic_agent.reports.calibration import compute_brier, compute_ece
 
 
+def _episodes(s_c, s_bar_c, ground_truth):
+    """Calibration episodes as one structured array (no per-episode dicts)."""
+    episodes = np.empty(len(s_c), dtype=CALIBRATION_DTYPE)
+    episodes["s_c"] = s_c
+    episodes["s_bar_c"] = s_bar_c
+    episodes["ground_truth"] = ground_truth
+    return episodes
+
+
 class TestECEComputation:
     """Test Expected Calibration Error (ECE) computation."""
 
@@ -129,7 +138,7 @@ class TestBrierScore:
 class TestThresholdTuning:
     """Test automatic threshold calibration."""
 
-    def test_threshold_tuning_improves_ece(self):
+    def test_threshold_tuning_improves_ece(self, beta_pool, randn_pool):
         """
         Calibration should reduce ECE.
 
@@ -138,23 +147,19 @@ class TestThresholdTuning:
         2. Calibrate thresholds
         3. Verify ECE decreases
         """
-        np.random.seed(42)
-
         # Create synthetic calibration data
         # Simulate claim evaluations with ground truth
         n_samples = 200
 
         # Support and countersupport scores (before calibration)
-        s_c = np.random.beta(2, 2, n_samples)  # Support scores
-        s_bar_c = np.random.beta(2, 2, n_samples)  # Countersupport scores
+        s_c = beta_pool[(2, 2)][:n_samples]  # Support scores
+        s_bar_c = beta_pool[(2, 2)][n_samples : 2 * n_samples]  # Countersupport scores
 
         # Ground truth: claim is true if s_c > s_bar_c + noise
-        ground_truth = (s_c > s_bar_c + np.random.randn(n_samples) * 0.1).astype(int)
+        ground_truth = (s_c > s_bar_c + randn_pool["1000"][:n_samples] * 0.1).astype(int)
 
         # Package as episodes for calibration
-        episodes = []
-        for i in range(n_samples):
-            episodes.append({"s_c": s_c[i], "s_bar_c": s_bar_c[i], "ground_truth": ground_truth[i]})
+        episodes = _episodes(s_c, s_bar_c, ground_truth)
 
         # Calibrate thresholds
         tau_opt, tau_prime_opt, ece_before, ece_after = calibrate_thresholds(
@@ -171,33 +176,30 @@ class TestThresholdTuning:
             tau_prime_opt < 0.5 < tau_opt
         ), f"Thresholds should satisfy τ' < 0.5 < τ, got τ'={tau_prime_opt:.3f}, τ={tau_opt:.3f}"
 
-    def test_threshold_tuning_respects_target_ece(self):
+    def test_threshold_tuning_respects_target_ece(self, beta_pool):
         """
         Calibration should achieve target ECE (SC-008).
 
         Scenario: Calibrate to ECE ≤ 0.05
         """
-        np.random.seed(42)
-
         # Generate well-separated data for easier calibration
         n_samples = 500
+        half = n_samples // 2
         s_c = np.concatenate(
             [
-                np.random.beta(5, 2, n_samples // 2),  # High support
-                np.random.beta(2, 5, n_samples // 2),  # Low support
+                beta_pool[(5, 2)][:half],  # High support
+                beta_pool[(2, 5)][:half],  # Low support
             ]
         )
         s_bar_c = np.concatenate(
             [
-                np.random.beta(2, 5, n_samples // 2),  # Low countersupport
-                np.random.beta(5, 2, n_samples // 2),  # High countersupport
+                beta_pool[(2, 5)][half : 2 * half],  # Low countersupport
+                beta_pool[(5, 2)][half : 2 * half],  # High countersupport
             ]
         )
         ground_truth = np.array([1] * (n_samples // 2) + [0] * (n_samples // 2))
 
-        episodes = []
-        for i in range(n_samples):
-            episodes.append({"s_c": s_c[i], "s_bar_c": s_bar_c[i], "ground_truth": ground_truth[i]})
+        episodes = _episodes(s_c, s_bar_c, ground_truth)
 
         tau_opt, tau_prime_opt, ece_before, ece_after = calibrate_thresholds(
             episodes, target_ece=0.05
@@ -212,22 +214,18 @@ class TestThresholdTuning:
 class TestCostMatrixPenalties:
     """Test cost-matrix aware calibration."""
 
-    def test_cost_matrix_shifts_thresholds(self):
+    def test_cost_matrix_shifts_thresholds(self, beta_pool):
         """
         Cost matrix should shift thresholds based on asymmetric penalties.
 
         Scenario: High false positive cost → increase τ (more conservative)
         """
-        np.random.seed(42)
-
         n_samples = 200
-        s_c = np.random.beta(2, 2, n_samples)
-        s_bar_c = np.random.beta(2, 2, n_samples)
+        s_c = beta_pool[(2, 2)][:n_samples]
+        s_bar_c = beta_pool[(2, 2)][n_samples : 2 * n_samples]
         ground_truth = (s_c > s_bar_c).astype(int)
 
-        episodes = []
-        for i in range(n_samples):
-            episodes.append({"s_c": s_c[i], "s_bar_c": s_bar_c[i], "ground_truth": ground_truth[i]})
+        episodes = _episodes(s_c, s_bar_c, ground_truth)
 
         # Neutral cost matrix
         cost_neutral = np.array([[0, 1], [1, 0]])  # Equal FP and FN costs
@@ -257,13 +255,11 @@ class TestCostMatrixPenalties:
             f"neutral={tau_neutral:.3f} vs FP-heavy={tau_fp:.3f}"
         )
 
-    def test_cost_matrix_default(self):
+    def test_cost_matrix_default(self, beta_pool):
         """Calibration should work with default (balanced) cost matrix."""
-        np.random.seed(42)
-
         n_samples = 100
-        s_c = np.random.beta(2, 2, n_samples)
-        s_bar_c = np.random.beta(2, 2, n_samples)
+        s_c = beta_pool[(2, 2)][:n_samples]
+        s_bar_c = beta_pool[(2, 2)][n_samples : 2 * n_samples]
         ground_truth = (s_c > s_bar_c).astype(int)
 
         episodes = []
@@ -273,5 +269,13 @@ class TestCostMatrixPenalties:
         # Should work without explicit cost matrix (use default)
         tau, tau_prime, ece_before, ece_after = calibrate_thresholds(episodes)
 
+        # List-of-dicts input and the packed structured array agree exactly
+        assert calibrate_thresholds(_episodes(s_c, s_bar_c, ground_truth)) == (
+            tau,
+            tau_prime,
+            ece_before,
+            ece_after,
+        )
+
         assert tau_prime < 0.5 < tau, "Thresholds should be valid"
         assert ece_after < ece_before, "Calibration should improve ECE"
@@ -12,6 +12,7 @@ References:
 """
 
 import numpy as np
+from scipy.spatial.distance import pdist
 
 from robust_semantic_agent.core.belief import Belief
 from robust_semantic_agent.core.credal import CredalSet
@@ -26,13 +27,17 @@ class TestCredalSetCreation:
         - FR-005: CredalSet class specification
     """
 
-    def test_credal_set_initialization(self):
+    def test_credal_set_initialization(self, particle_buf):
         """CredalSet can be initialized with K posteriors"""
+        rng, buf = np.random.default_rng(0), particle_buf[:100]
+
         # Create 3 simple posteriors (each is a Belief)
         posteriors = []
         for i in range(3):
             belief = Belief(n_particles=100, state_dim=2)
-            belief.particles = np.random.randn(100, 2) + i  # Shift means
+            rng.standard_normal(out=buf)
+            buf += i  # Shift means
+            belief.particles = buf
             posteriors.append(belief)
 
         credal = CredalSet(posteriors=posteriors)
@@ -70,28 +75,28 @@ class TestPosteriorDiversity:
         - docs/theory.md: Logit interval [-λ_s, +λ_s] for v=⊤
     """
 
-    def test_posteriors_have_different_means(self):
+    def test_posteriors_have_different_means(self, particle_buf):
         """K posteriors should have different means"""
+        rng, buf = np.random.default_rng(0), particle_buf[:100]
+
         # Create posteriors with different mean shifts
         posteriors = []
         for i in range(5):
             belief = Belief(n_particles=100, state_dim=2)
             # Shift particles to create different means
-            belief.particles = np.random.randn(100, 2) + np.array([i * 0.5, 0])
+            rng.standard_normal(out=buf)
+            buf[:, 0] += i * 0.5
+            belief.particles = buf
             posteriors.append(belief)
 
         credal = CredalSet(posteriors=posteriors)
 
         # Compute means of each posterior
-        means = [p.mean() for p in credal.posteriors]
+        means = np.stack([p.mean() for p in credal.posteriors])
 
         # Verify they are not all identical
         # (at least two should differ by > 0.1)
-        max_diff = 0
-        for i in range(len(means)):
-            for j in range(i + 1, len(means)):
-                diff = np.linalg.norm(means[i] - means[j])
-                max_diff = max(max_diff, diff)
+        max_diff = pdist(means).max()
 
         assert max_diff > 0.1, "Posteriors should be diverse (different means)"
 
@@ -123,16 +128,20 @@ class TestLowerExpectation:
         - FR-005: Lower expectation ≤ any extreme posterior expectation
     """
 
-    def test_lower_expectation_simple_function(self):
+    def test_lower_expectation_simple_function(self, particle_buf):
         """Lower expectation of simple function f(x) = x[0]"""
+        rng, buf = np.random.default_rng(0), particle_buf[:100]
+
         # Create posteriors with different x[0] means
         posteriors = []
         means_x0 = [0.0, 1.0, 2.0]  # Three different means for x[0]
 
         for mean_val in means_x0:
             belief = Belief(n_particles=100, state_dim=2)
-            belief.particles = np.random.randn(100, 2) * 0.1  # Small variance
-            belief.particles[:, 0] += mean_val  # Shift x[0]
+            rng.standard_normal(out=buf)
+            buf *= 0.1  # Small variance
+            buf[:, 0] += mean_val  # Shift x[0]
+            belief.particles = buf
             posteriors.append(belief)
 
         credal = CredalSet(posteriors=posteriors)
@@ -147,17 +156,21 @@ class TestLowerExpectation:
         assert lower_exp < 0.3, f"Lower expectation {lower_exp} should be close to 0.0"
         assert lower_exp > -0.3, f"Lower expectation {lower_exp} should be positive"
 
-    def test_lower_expectation_monotonicity(self):
+    def test_lower_expectation_monotonicity(self, particle_buf):
         """
         SC-004: Lower expectation ≤ expectation of any extreme posterior.
 
         𝔼_[f] ≤ 𝔼_P[f] for all P ∈ Γ
         """
+        rng, buf = np.random.default_rng(0), particle_buf[:100]
+
         # Create 5 posteriors
         posteriors = []
         for i in range(5):
             belief = Belief(n_particles=100, state_dim=2)
-            belief.particles = np.random.randn(100, 2) + i
+            rng.standard_normal(out=buf)
+            buf += i
+            belief.particles = buf
             posteriors.append(belief)
 
         credal = CredalSet(posteriors=posteriors)
@@ -181,12 +194,16 @@ class TestLowerExpectation:
                 lower_exp <= expected + 1e-6
             ), f"Lower expectation {lower_exp} exceeds posterior {i} expectation {expected}"
 
-    def test_lower_expectation_constant_function(self):
+    def test_lower_expectation_constant_function(self, particle_buf):
         """Lower expectation of constant function f(x) = c should be c"""
+        rng, buf = np.random.default_rng(0), particle_buf[:50]
+
         posteriors = []
         for i in range(3):
             belief = Belief(n_particles=50, state_dim=2)
-            belief.particles = np.random.randn(50, 2) * (i + 1)  # Different variances
+            rng.standard_normal(out=buf)
+            buf *= i + 1  # Different variances
+            belief.particles = buf
             posteriors.append(belief)
 
         credal = CredalSet(posteriors=posteriors)
@@ -200,15 +217,17 @@ class TestLowerExpectation:
             np.abs(lower_exp - 5.0) < 1e-6
         ), "Lower expectation of constant should equal the constant"
 
-    def test_lower_expectation_linear_function(self):
+    def test_lower_expectation_linear_function(self, particle_buf):
         """Lower expectation of linear function"""
+        rng, buf = np.random.default_rng(42), particle_buf[:100]
+
         # Create posteriors with different means
         posteriors = []
-        np.random.seed(42)
         for i in range(4):
             belief = Belief(n_particles=100, state_dim=2)
-            belief.particles = np.random.randn(100, 2)
-            belief.particles += np.array([i, -i])  # Different mean shifts
+            rng.standard_normal(out=buf)
+            buf += np.array([i, -i])  # Different mean shifts
+            belief.particles = buf
             posteriors.append(belief)
 
         credal = CredalSet(posteriors=posteriors)
@@ -265,11 +284,8 @@ class TestCredalSetEdgeCases:
         np.random.seed(42)
         particles = np.random.randn(100, 2)
 
-        posteriors = []
-        for _ in range(3):
-            belief = Belief(n_particles=100, state_dim=2)
-            belief.particles = particles.copy()  # Same particles
-            posteriors.append(belief)
+        # Same particles: one shared read-only buffer
+        posteriors = [Belief.from_particles(particles, share=True) for _ in range(3)]
 
         credal = CredalSet(posteriors=posteriors)
 
@@ -288,3 +304,42 @@ class TestCredalSetEdgeCases:
 
         # Should be approximately equal
         assert np.abs(lower_exp - expected) < 1e-4
+
+    def test_lower_expectation_vec_matches_scalar(self):
+        """Vectorized lower expectation equals the per-particle path"""
+        rng = np.random.default_rng(0)
+        posteriors = []
+        for i, n in enumerate([100, 60, 80]):  # Unequal particle counts
+            belief = Belief(n_particles=n, state_dim=2)
+            belief.particles = rng.standard_normal((n, 2)) + i
+            belief.log_weights = rng.standard_normal(n)
+            posteriors.append(belief)
+
+        credal = CredalSet(posteriors=posteriors)
+
+        lower_exp = credal.lower_expectation(lambda x: 2 * x[0] - 3 * x[1])
+        lower_exp_vec = credal.lower_expectation_vec(lambda x: 2 * x[:, 0] - 3 * x[:, 1])
+
+        # f is evaluated on float32 particles in both paths
+        assert np.isclose(lower_exp_vec, lower_exp, rtol=1e-6, atol=1e-6)
+
+    def test_from_single_shares_particles(self):
+        """from_single builds K identical posteriors over one particle buffer"""
+        belief = Belief(n_particles=100, state_dim=2)
+        belief.particles = np.random.default_rng(0).standard_normal((100, 2))
+
+        credal = CredalSet.from_single(belief, K=3)
+        assert credal.K == 3
+        first, second = credal.posteriors[0], credal.posteriors[1]
+        assert np.shares_memory(first.particles, second.particles)
+        assert not np.shares_memory(first.particles, belief.particles)
+
+        # share=False always copies, even from another belief's particle view
+        copied = Belief.from_particles(belief.particles)
+        assert not np.shares_memory(copied.particles, belief.particles)
+
+        # The shared buffer is read-only; reassigning gives one posterior its own copy
+        assert not first.particles.flags.writeable
+        first.particles = first.particles + np.array([1.0, 0.0])
+        np.testing.assert_allclose(second.particles, belief.particles)
+        np.testing.assert_allclose(first.mean(), belief.mean() + [1.0, 0.0], atol=1e-5)
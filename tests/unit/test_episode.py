@@ -0,0 +1,58 @@
+"""
+Unit Tests: Episode Step Arrays
+Feature: 002-full-prototype
+Task: T040
+
+Structured step arrays must match the dict-based report path.
+"""
+
+import numpy as np
+import pytest
+
+
+def _make_episode(n_steps=20, seed=0):
+    from robust_semantic_agent.core.episode import Episode
+
+    rng = np.random.default_rng(seed)
+    episode = Episode(episode_id=0)
+    for t in range(n_steps):
+        info = {"violated_safety": bool(t % 7 == 3), "safety_filter_active": bool(t % 3 == 0)}
+        if t % 2 == 0:
+            info["barrier_value"] = float(rng.normal())
+        episode.add_step(
+            state=rng.normal(size=2),
+            action=np.zeros(2),
+            observation=np.zeros(2),
+            reward=-1.0,
+            info=info,
+        )
+    return episode
+
+
+@pytest.mark.unit
+class TestStepArray:
+    """Episode.to_dict(include_step_array=True) packs step info into STEP_DTYPE."""
+
+    def test_step_array_fields(self):
+        from robust_semantic_agent.core.episode import STEP_DTYPE
+
+        ep = _make_episode().to_dict(include_step_array=True)
+        arr = ep["steps_arr"]
+
+        assert arr.dtype == STEP_DTYPE
+        assert len(arr) == ep["num_steps"]
+        assert arr["violated_safety"].tolist() == [
+            s["info"]["violated_safety"] for s in ep["steps"]
+        ]
+        np.testing.assert_allclose(arr["state"], [s["state"] for s in ep["steps"]], rtol=1e-6)
+        # Barrier value is NaN exactly where the step info lacks it
+        assert np.isnan(arr["barrier_value"][1::2]).all()
+        assert not np.isnan(arr["barrier_value"][::2]).any()
+
+    def test_violation_rates_match_dict_path(self):
+        from robust_semantic_agent.reports.safety import compute_violation_rates
+
+        episodes = [_make_episode(seed=s).to_dict(include_step_array=True) for s in range(3)]
+        dict_only = [{k: v for k, v in ep.items() if k != "steps_arr"} for ep in episodes]
+
+        assert compute_violation_rates(episodes) == compute_violation_rates(dict_only)
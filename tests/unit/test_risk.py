@@ -8,36 +8,62 @@ Tests MUST FAIL initially (TDD Principle V: NON-NEGOTIABLE)
 
 import numpy as np
 import pytest
-from scipy.stats import norm
+from scipy.special import ndtri
+
+# Analytical CVaR@0.10 of N(0, 1): -φ(Φ⁻¹(α)) / α
+_ALPHA_GAUSS = 0.10
+_Z_ALPHA = ndtri(_ALPHA_GAUSS)
+_PHI_Z = np.exp(-0.5 * _Z_ALPHA * _Z_ALPHA) / np.sqrt(2 * np.pi)
+_CVAR_GAUSS_ANALYTICAL = -_PHI_Z / _ALPHA_GAUSS
+
+
+@pytest.fixture
+def rng() -> np.random.Generator:
+    """Fresh seeded Generator per test, so each test's draws are order-independent."""
+    return np.random.default_rng(42)
+
+
+@pytest.fixture(scope="module")
+def gauss_10k() -> np.ndarray:
+    """10k standard-normal samples, drawn once per module (read-only)."""
+    samples = np.random.default_rng(42).standard_normal(10000)
+    samples.setflags(write=False)
+    return samples
+
+
+@pytest.fixture(scope="module")
+def weighted_particles() -> tuple[np.ndarray, np.ndarray]:
+    """(values, log_weights) for 5000 particles, drawn once per module (read-only)."""
+    values, log_weights = np.random.default_rng(42).standard_normal((2, 5000))
+    log_weights = log_weights - log_weights.max()
+    values.setflags(write=False)
+    log_weights.setflags(write=False)
+    return values, log_weights
 
 
 @pytest.mark.unit
 class TestCVaRGaussianAnalytical:
     """T021: Validate CVaR against Gaussian analytical formula (SC-005)."""
 
-    def test_cvar_gaussian_analytical_match(self):
+    def test_cvar_gaussian_analytical_match(self, rng):
         """
         CVaR@α for Gaussian should match analytical formula within <1% error.
         Formula: CVaR_α = μ - σ × φ(Φ^(-1)(α)) / (1-α)
         """
         from robust_semantic_agent.risk.cvar import cvar
 
-        np.random.seed(42)
-
         mu, sigma = 0.0, 1.0
-        alpha = 0.10
+        alpha = _ALPHA_GAUSS
         n_samples = 100000
 
         # Generate Gaussian samples
-        samples = np.random.randn(n_samples) * sigma + mu
+        samples = rng.standard_normal(n_samples) * sigma + mu
 
         # Empirical CVaR
         cvar_empirical = cvar(samples, alpha)
 
-        # Analytical CVaR for Gaussian
-        z_alpha = norm.ppf(alpha)
-        phi_z = norm.pdf(z_alpha)
-        cvar_analytical = mu - sigma * phi_z / alpha
+        # Analytical CVaR for Gaussian (standard-normal value, shifted and scaled)
+        cvar_analytical = mu + sigma * _CVAR_GAUSS_ANALYTICAL
 
         # Error
         error = abs(cvar_empirical - cvar_analytical)
@@ -54,21 +80,19 @@ class TestCVaRGaussianAnalytical:
 class TestCVaRUniformAnalytical:
     """T022: Validate CVaR against Uniform analytical formula."""
 
-    def test_cvar_uniform_analytical_match(self):
+    def test_cvar_uniform_analytical_match(self, rng):
         """
         CVaR@α for Uniform should match analytical formula.
         Formula: CVaR_α = a + α × (b-a) / 2
         """
         from robust_semantic_agent.risk.cvar import cvar
 
-        np.random.seed(42)
-
         a, b = -5.0, 5.0
         alpha = 0.20
         n_samples = 50000
 
         # Generate Uniform samples
-        samples = np.random.uniform(a, b, n_samples)
+        samples = rng.uniform(a, b, n_samples)
 
         # Empirical CVaR
         cvar_empirical = cvar(samples, alpha)
@@ -91,13 +115,11 @@ class TestCVaRUniformAnalytical:
 class TestCVaRMonotonicity:
     """T023: Verify monotonicity property: α1 < α2 → CVaR@α1 ≤ CVaR@α2."""
 
-    def test_cvar_monotonicity_increasing_alpha(self):
+    def test_cvar_monotonicity_increasing_alpha(self, gauss_10k):
         """CVaR should increase (become less risk-averse) as α increases."""
         from robust_semantic_agent.risk.cvar import cvar
 
-        np.random.seed(42)
-
-        samples = np.random.randn(10000)
+        samples = gauss_10k
 
         cvar_005 = cvar(samples, alpha=0.05)
         cvar_010 = cvar(samples, alpha=0.10)
@@ -113,6 +135,8 @@ class TestCVaRMonotonicity:
         """Test edge cases: α→0 (worst case) and α=1 (mean)."""
         from robust_semantic_agent.risk.cvar import cvar
 
+        # Legacy stream kept: the "within 0.5 of the minimum" bound below is tuned to
+        # these draws and does not hold for every seed (a lone outlier breaks it)
         np.random.seed(42)
 
         samples = np.random.randn(10000)
@@ -140,23 +164,43 @@ class TestCVaRMonotonicity:
             abs(cvar_all - mean_sample) < 0.01
         ), f"CVaR@1.0 should equal mean, got {cvar_all:.3f} vs mean={mean_sample:.3f}"
 
+        # α → 0: exactly the worst sample
+        assert cvar(samples, alpha=0.0) == min_sample
+
+    def test_cvar_profile_matches_pointwise(self, rng):
+        """CVaR sweep from a single sort should match per-alpha cvar()."""
+        from robust_semantic_agent.risk.cvar import cvar, cvar_profile
+
+        samples = rng.standard_normal(1000)
+        alphas = np.linspace(0.001, 1.0, 25)
+
+        profile = cvar_profile(samples, alphas)
+        pointwise = np.array([cvar(samples, alpha) for alpha in alphas])
+
+        np.testing.assert_allclose(profile, pointwise, rtol=1e-12, atol=1e-12)
+
+    def test_cvar_profile_empty(self):
+        """An empty sample gives NaN at every alpha rather than an IndexError."""
+        from robust_semantic_agent.reports.risk import prepare_return_stats
+        from robust_semantic_agent.risk.cvar import cvar_profile, cvar_profile_from_cumsum
+
+        alphas = np.array([0.1, 0.5, 1.0])
+
+        assert np.all(np.isnan(cvar_profile(np.array([]), alphas)))
+        stats = prepare_return_stats([])
+        assert np.all(np.isnan(cvar_profile_from_cumsum(stats.cumsum, alphas)))
+
 
 @pytest.mark.unit
 class TestCVaRWeighted:
     """Test weighted CVaR for particle belief integration."""
 
-    def test_cvar_weighted_particles(self):
+    def test_cvar_weighted_particles(self, weighted_particles):
         """Weighted CVaR should handle log-space particle weights."""
         from robust_semantic_agent.risk.cvar import cvar_weighted
 
-        np.random.seed(42)
-
-        n_particles = 5000
-        particles_values = np.random.randn(n_particles)
-
-        # Non-uniform log-weights (simulate belief after observation)
-        log_weights = np.random.randn(n_particles)
-        log_weights -= np.max(log_weights)  # Normalize
+        # Non-uniform log-weights (simulate belief after observation), max-shifted to 0
+        particles_values, log_weights = weighted_particles
 
         alpha = 0.10
 
@@ -166,3 +210,115 @@ class TestCVaRWeighted:
         assert np.isfinite(cvar_value), f"CVaR should be finite, got {cvar_value}"
         assert cvar_value < np.max(particles_values), "CVaR should be less than max value"
         assert cvar_value > np.min(particles_values), "CVaR should be greater than min value"
+
+    def test_cvar_weighted_splits_boundary_particle(self):
+        """Tail mass is exactly α, so the boundary particle counts fractionally."""
+        from robust_semantic_agent.risk.cvar import cvar_weighted
+
+        values = np.arange(10.0)
+        uniform = np.zeros(10)
+
+        # α = 0.25 of 10 equal particles: 0 and 1 in full, half of 2
+        assert cvar_weighted(uniform, values, alpha=0.25) == pytest.approx(
+            (0.0 + 1.0 + 0.5 * 2.0) / 2.5
+        )
+
+        # Rockafellar–Uryasev: CVaR_α = w - E[(w - Y)⁺] / α at w = VaR_α
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=2000)
+        log_weights = rng.normal(size=2000)
+        p = np.exp(log_weights - log_weights.max())
+        p /= p.sum()
+        order = np.argsort(values)
+        # Limits: α = 1 is the weighted mean, α → 0 the worst particle
+        assert cvar_weighted(log_weights, values, 1.0) == pytest.approx(np.dot(p, values))
+        assert cvar_weighted(log_weights, values, 0.0) == values.min()
+        for alpha in (0.01, 0.1, 0.5, 1.0):
+            var = values[order][min(np.searchsorted(np.cumsum(p[order]), alpha), 1999)]
+            expected = var - np.dot(p, np.maximum(var - values, 0.0)) / alpha
+            assert cvar_weighted(log_weights, values, alpha) == pytest.approx(expected)
+
+
+@pytest.mark.unit
+class TestRiskBellman:
+    """Test CVaR Bellman backup over belief particles."""
+
+    def test_backup_batched_matches_scalar(self):
+        """Batched callables should give the same backup as per-sample callables."""
+        from robust_semantic_agent.core.belief import Belief
+        from robust_semantic_agent.risk.cvar import RiskBellman
+
+        belief = Belief(n_particles=1000, state_dim=2)
+        belief.particles = np.random.RandomState(0).randn(1000, 2)
+
+        goal = np.array([0.8, 0.8])
+        action = np.array([0.1, 0.0])
+        bellman = RiskBellman(alpha=0.1, gamma=0.9)
+
+        batched = bellman.backup(
+            belief,
+            action,
+            reward_fn=lambda x, u: -np.linalg.norm(x - goal, axis=1),
+            transition_fn=lambda x, u: x + 0.1 * u,
+            value_fn=lambda x: -np.linalg.norm(x - goal, axis=1),
+            rng=np.random.default_rng(42),
+        )
+
+        scalar = bellman.backup(
+            belief,
+            action,
+            reward_fn=lambda x, u: -np.linalg.norm(x - goal),
+            transition_fn=lambda x, u: x + 0.1 * u,
+            value_fn=lambda x: -np.linalg.norm(x - goal),
+            vectorized=False,
+            rng=np.random.default_rng(42),
+        )
+
+        assert np.isclose(batched, scalar), f"Batched {batched} != scalar {scalar}"
+
+    def test_backup_batched_matches_per_action(self):
+        """backup_batched over A actions should equal A backup() calls on the same sample."""
+        from robust_semantic_agent.core.belief import Belief
+        from robust_semantic_agent.risk.cvar import RiskBellman
+
+        belief = Belief(n_particles=1000, state_dim=2)
+        belief.particles = np.random.RandomState(0).randn(1000, 2)
+
+        goal = np.array([0.8, 0.8])
+        actions = np.array([[0.1, 0.0], [0.0, 0.1], [-0.1, -0.1]])
+        bellman = RiskBellman(alpha=0.1, gamma=0.9)
+        fns = dict(
+            reward_fn=lambda x, u: -np.linalg.norm(x - goal, axis=1),
+            transition_fn=lambda x, u: x + 0.1 * u,
+            value_fn=lambda x: -np.linalg.norm(x - goal, axis=1),
+        )
+
+        batched = bellman.backup_batched(belief, actions, rng=np.random.default_rng(42), **fns)
+
+        per_action = []
+        for u in actions:
+            per_action.append(bellman.backup(belief, u, rng=np.random.default_rng(42), **fns))
+
+        np.testing.assert_allclose(batched, per_action)
+
+    def test_backup_draws_from_belief_rng(self):
+        """backup() samples from belief.rng and leaves the global RandomState alone."""
+        from robust_semantic_agent.core.belief import Belief
+        from robust_semantic_agent.risk.cvar import RiskBellman
+
+        bellman = RiskBellman(alpha=0.1, gamma=0.9)
+        fns = dict(
+            reward_fn=lambda x, u: -np.linalg.norm(x, axis=1),
+            transition_fn=lambda x, u: x + 0.1 * u,
+            value_fn=lambda x: -np.linalg.norm(x, axis=1),
+        )
+
+        results = []
+        for _ in range(2):
+            belief = Belief(n_particles=1000, state_dim=2, rng=np.random.default_rng(7))
+            belief.particles = np.random.RandomState(0).randn(1000, 2)
+            state = np.random.get_state()[1].copy()
+            results.append(bellman.backup(belief, np.array([0.1, 0.0]), **fns))
+            np.testing.assert_array_equal(np.random.get_state()[1], state)
+
+        assert results[0] == results[1]
@@ -71,8 +71,8 @@ class TestQPSolve:
         # Get safe control
         u_safe, slack = safety_filter.filter(x, u_desired)
 
-        # Should be close to desired (state is safe)
-        np.linalg.norm(u_safe - u_desired)
+        # u_desired already satisfies the constraint, so it is returned unchanged
+        np.testing.assert_array_equal(u_safe, u_desired)
 
         # Slack should be ~0 (feasible)
         assert slack < 1e-5, f"Slack should be ~0 for feasible case, got {slack:.6f}"
@@ -136,3 +136,137 @@ class TestQPSolve:
 
         # Allow small numerical tolerance
         assert lhs >= rhs - 1e-4, f"CBF constraint violated: LHS={lhs:.6f} < RHS={rhs:.6f}"
+
+    def test_cbf_constraint_enforcement_batch(self):
+        """Batch barrier API matches the scalar one; every filtered row meets the CBF bound."""
+        from robust_semantic_agent.envs.forbidden_circle.safety import BarrierFunction
+        from robust_semantic_agent.safety.cbf import SafetyFilter
+
+        barrier_fn = BarrierFunction(radius=0.3, center=np.array([0.1, -0.2]))
+        safety_filter = SafetyFilter(barrier_fn, alpha=0.5)
+
+        rng = np.random.default_rng(1)
+        X = rng.uniform(-1.0, 1.0, size=(500, 2))
+        U = rng.uniform(-0.2, 0.2, size=(500, 2))
+
+        H = barrier_fn.evaluate_batch(X)
+        G = barrier_fn.gradient_batch(X)
+        np.testing.assert_allclose(H, [barrier_fn.evaluate(x) for x in X], atol=1e-12)
+        np.testing.assert_allclose(G, [barrier_fn.gradient(x) for x in X], atol=1e-12)
+
+        U_safe, slacks = safety_filter.filter_batch(X, U)
+        lhs = np.einsum("ni,ni->n", G, U_safe) + slacks
+        assert np.all(lhs >= -0.5 * H - 1e-4)
+
+    def test_step_and_evaluate(self):
+        """Fused step + barrier matches x + u·dt followed by evaluate(), scalar and batched."""
+        from robust_semantic_agent.envs.forbidden_circle.safety import BarrierFunction
+
+        barrier_fn = BarrierFunction(radius=0.3, center=np.array([0.1, -0.2]))
+        rng = np.random.default_rng(2)
+        X = rng.uniform(-1.0, 1.0, size=(50, 2))
+        U = rng.uniform(-0.5, 0.5, size=(50, 2))
+
+        X_next, H_next = barrier_fn.step_and_evaluate_batch(X, U, 0.1)
+        np.testing.assert_allclose(X_next, X + U * 0.1)
+        np.testing.assert_allclose(H_next, barrier_fn.evaluate_batch(X + U * 0.1), atol=1e-12)
+
+        x = X[0].copy()
+        x_next, h_next = barrier_fn.step_and_evaluate(x, U[0], 0.1, out=x)
+        assert x_next is x  # advanced in place
+        np.testing.assert_allclose(x, X_next[0])
+        assert np.isclose(h_next, H_next[0])
+
+    def test_evaluate_with_gradient(self):
+        """Fused h(x), ∇h(x) matches evaluate() and gradient() and fills the given buffer."""
+        from robust_semantic_agent.envs.forbidden_circle.safety import BarrierFunction
+
+        barrier_fn = BarrierFunction(radius=0.3, center=np.array([0.1, -0.2]))
+        rng = np.random.default_rng(3)
+        out = np.empty(2)
+
+        for x in rng.uniform(-1.0, 1.0, size=(20, 2)):
+            h_x, Lgh = barrier_fn.evaluate_with_gradient(x, out=out)
+            assert Lgh is out
+            assert np.isclose(h_x, barrier_fn.evaluate(x))
+            np.testing.assert_allclose(Lgh, barrier_fn.gradient(x), atol=1e-12)
+
+    def test_filter_batch_matches_filter(self):
+        """filter_batch should reproduce per-row filter() results, incl. slack and x = c."""
+        from robust_semantic_agent.envs.forbidden_circle.safety import BarrierFunction
+        from robust_semantic_agent.safety.cbf import SafetyFilter
+
+        barrier_fn = BarrierFunction(radius=0.3, center=np.array([0.0, 0.0]))
+        safety_filter = SafetyFilter(barrier_fn, alpha=0.5, slack_penalty=0.5)
+
+        rng = np.random.default_rng(0)
+        X = rng.uniform(-1.0, 1.0, size=(200, 2))
+        U = rng.uniform(-1.0, 1.0, size=(200, 2))
+        X[0] = 0.0  # Degenerate gradient at the circle center
+
+        U_batch, slack_batch = safety_filter.filter_batch(X, U)
+
+        for i in range(len(X)):
+            u_i, slack_i = safety_filter.filter(X[i], U[i])
+            np.testing.assert_allclose(U_batch[i], u_i, atol=1e-8)
+            assert np.isclose(slack_batch[i], slack_i, atol=1e-8)
+
+    def test_projection_without_slack(self):
+        """enable_slack=False should return the exact projection with zero slack."""
+        from robust_semantic_agent.envs.forbidden_circle.safety import BarrierFunction
+        from robust_semantic_agent.safety.cbf import SafetyFilter
+
+        barrier_fn = BarrierFunction(radius=0.3, center=np.array([0.0, 0.0]))
+        # Tiny penalty: the slack path would relax the constraint here
+        safety_filter = SafetyFilter(barrier_fn, alpha=0.5, slack_penalty=0.01, enable_slack=False)
+
+        x = np.array([0.35, 0.0])
+        u_desired = np.array([-1.0, 0.0])
+        u_safe, slack = safety_filter.filter(x, u_desired)
+
+        g = barrier_fn.gradient(x)
+        assert slack == 0.0
+        assert np.isclose(g @ u_safe, -0.5 * barrier_fn.evaluate(x))
+
+        U_batch, slacks = safety_filter.filter_batch(x[None], u_desired[None])
+        np.testing.assert_allclose(U_batch[0], u_safe, atol=1e-12)
+        assert slacks[0] == 0.0
+
+    def test_reset_clears_warm_start(self):
+        """reset() should drop the cached OSQP iterate used for warm starts."""
+        from robust_semantic_agent.envs.forbidden_circle.safety import BarrierFunction
+        from robust_semantic_agent.safety.cbf import SafetyFilter
+
+        barrier_fn = BarrierFunction(radius=0.3, center=np.array([0.0, 0.0]))
+        safety_filter = SafetyFilter(barrier_fn, alpha=0.5, max_iter=4000)
+
+        # Degenerate gradient at the center goes through OSQP
+        u_safe, _ = safety_filter.filter(np.zeros(2), np.array([0.1, 0.0]))
+        assert safety_filter._last_x is not None
+
+        safety_filter.reset()
+        assert safety_filter._last_x is None and safety_filter._last_y is None
+
+        # Cold and warm solves agree
+        u_cold, _ = safety_filter.filter(np.zeros(2), np.array([0.1, 0.0]))
+        np.testing.assert_allclose(u_cold, u_safe, atol=1e-4)
+
+    def test_closed_form_matches_osqp(self):
+        """Closed-form projection should agree with a converged OSQP solve."""
+        from robust_semantic_agent.envs.forbidden_circle.safety import BarrierFunction
+        from robust_semantic_agent.safety.cbf import SafetyFilter
+
+        barrier_fn = BarrierFunction(radius=0.3, center=np.array([0.0, 0.0]))
+        safety_filter = SafetyFilter(barrier_fn, alpha=0.5, slack_penalty=1000.0, max_iter=10000)
+
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            x = rng.uniform(-0.6, 0.6, size=2)
+            u_desired = rng.uniform(-1.0, 1.0, size=2)
+
+            u_closed, slack_closed = safety_filter.filter(x, u_desired)
+            h_x, Lgh = barrier_fn.evaluate_with_gradient(x)
+            u_qp, slack_qp = safety_filter._solve_qp(x, u_desired, h_x, 0.0, Lgh)
+
+            np.testing.assert_allclose(u_closed, u_qp, atol=1e-3)
+            assert abs(slack_closed - slack_qp) < 1e-3